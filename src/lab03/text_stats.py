@@ -9,11 +9,14 @@ text_stats.py - скрипт для анализа текстовой стати
 import sys
 import os
 
-# Добавляем путь для импорта наших модулей
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "lib"))
+if not __package__:
+    # Запуск файлом (python src/lab03/text_stats.py): добавляем корень репозитория,
+    # чтобы импорты из пакета src работали так же, как при python -m
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
-# Импортируем наши функции из библиотеки
-from text import normalize, tokenize, count_freq, top_n
+# Импортируем наши функции из библиотеки (общее ядро анализа текста).
+# count_freq и top_n реэкспортируются для обратной совместимости
+from src.lib.text import TextAnalysis, count_freq, top_n
 
 
 def text_stats(text: str, table_mode: bool = False) -> None:
@@ -29,19 +32,13 @@ def text_stats(text: str, table_mode: bool = False) -> None:
         print("Ошибка: текст пустой или содержит только пробелы")
         return
 
-    # 1. Нормализуем текст (приводим к нижнему регистру, убираем лишние пробелы)
-    norm_text = normalize(text)
+    # 1-4. Нормализуем, разбиваем на слова, считаем частоты и топ-5
+    #      за один проход общего ядра
+    analysis = TextAnalysis.from_text(text, n=5)
 
-    # 2. Разбиваем на отдельные слова (токены)
-    tokens = tokenize(norm_text)
-
-    # 3. Подсчитываем частоту каждого слова
-    freq = count_freq(tokens)
-
-    # 4. Получаем статистику
-    total_words = len(tokens)
-    unique_words = len(freq)
-    top_words = top_n(freq, n=5)
+    total_words = analysis.total_words
+    unique_words = analysis.unique_words
+    top_words = analysis.top_words
 
     # 5. Выводим результаты
     print(f"Всего слов: {total_words}")
@@ -1,18 +1,22 @@
-import re
+import os
+import sys
 
+if not __package__:
+    # Запуск файлом (python src/lab03/tokenize.py): добавляем корень репозитория,
+    # чтобы импорты из пакета src работали так же, как при python -m
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 
-def tokenize(text: str) -> list[str]:
-    """
-    Разбивает текст на слова (токены).
+# Реализация живёт в общем ядре src/lib/text.py, чтобы все точки входа
+# считали слова одинаково
 
-    Находит последовательности букв, цифр, подчеркиваний,
-    может содержать дефисы внутри слов.
 
-    Args:
-        text: Текст для разбиения на слова
+def tokenize(text: str) -> list[str]:
+    """
+    Разбивает текст на слова (токены) с помощью общего ядра src/lib/text.py.
 
-    Returns:
-        Список найденных слов
+    Ядро импортируется при вызове, а не при импорте модуля: при запуске
+    скриптов из src/lab03 этот файл перекрывает стандартный модуль tokenize,
+    который импортируется внутри самого ядра (через dataclasses).
 
     Examples:
         >>> tokenize("привет, мир!")
@@ -20,30 +24,22 @@ def tokenize(text: str) -> list[str]:
 
         >>> tokenize("по-настоящему круто")
         ['по-настоящему', 'круто']
-
-        >>> tokenize("emoji 🐈‍⬛ не слово")
-        ['emoji', 'не', 'слово']
     """
-    # Регулярное выражение для поиска слов
-    # [\w]+    - одна или больше букв/цифр/подчеркиваний
-    # (?:-[\w]+)* - ноль или больше повторов: дефис + буквы/цифры
-    pattern = r"[\w]+(?:-[\w]+)*"
-
-    # Находим все совпадения с шаблоном
-    tokens = re.findall(pattern, text)
+    from src.lib.text import tokenize as core_tokenize
 
-    return tokens
+    return core_tokenize(text)
 
 
-print("=== Тесты текста ===")
-texts = [
-    "привет мир",
-    "hello,world!!!",
-    "по-настоящему круто",
-    "2025 год",
-    "emoji 🐈‍⬛ не слово",
-]
+if __name__ == "__main__":
+    print("=== Тесты текста ===")
+    texts = [
+        "привет мир",
+        "hello,world!!!",
+        "по-настоящему круто",
+        "2025 год",
+        "emoji 🐈‍⬛ не слово",
+    ]
 
-for text in texts:
-    result = tokenize(text)
-    print(result)
+    for text in texts:
+        result = tokenize(text)
+        print(result)
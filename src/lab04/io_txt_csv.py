@@ -5,7 +5,10 @@
 
 import csv
 from pathlib import Path
-from typing import Union, Iterable, Sequence
+from typing import Union, Iterable, Iterator, Sequence
+
+# Размер буфера для потокового чтения (в символах)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 
 def read_text(path: Union[str, Path], encoding: str = "utf-8") -> str:
@@ -36,6 +39,49 @@ def read_text(path: Union[str, Path], encoding: str = "utf-8") -> str:
     return file_path.read_text(encoding=encoding)
 
 
+def read_text_chunks(
+    path: Union[str, Path],
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Читает текстовый файл кусками фиксированного размера.
+
+    В отличие от read_text, не загружает весь файл в память: одновременно
+    в памяти находится не больше chunk_size символов.
+
+    Args:
+        path: Путь к файлу (строка или Path объект)
+        encoding: Кодировка файла (по умолчанию UTF-8)
+        chunk_size: Размер одного куска в символах
+
+    Yields:
+        Куски текста длиной не больше chunk_size
+
+    Raises:
+        FileNotFoundError: Если файл не существует
+        UnicodeDecodeError: Если неправильная кодировка
+        ValueError: Если chunk_size не положительный
+
+    Examples:
+        >>> for chunk in read_text_chunks("data/big.txt", chunk_size=65536):
+        ...     process(chunk)
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Размер куска должен быть положительным: {chunk_size}")
+
+    file_path = Path(path)
+
+    # Текстовый режим сам корректно декодирует многобайтовые символы
+    # на границах буферов и переводит \r\n в \n, как и read_text
+    with file_path.open("r", encoding=encoding) as file:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
 def write_csv(
     rows: Iterable[Sequence], path: Union[str, Path], header: tuple[str, ...] = None
 ) -> None:
@@ -0,0 +1,341 @@
+"""
+Дисковый кэш таблиц частот для text_report.
+ЛР4 — Файлы: TXT/CSV и отчёты
+
+Для каждого входного файла хранится его словарь частот слов. Ключ записи -
+путь, размер, время изменения, SHA-256 содержимого и параметры
+нормализации. Если файл не менялся, анализ пропускается полностью:
+при совпадении размера и mtime не нужно даже считать хэш, а если файл
+только "потрогали" (mtime другой, содержимое то же), хватает одного
+быстрого прохода хэширования.
+
+Записи с частотами адресуются по хэшу содержимого, поэтому одинаковые
+файлы по разным путям делят одну запись. Общий размер кэша (записи вместе
+с индексом) ограничен: при превышении удаляются давно не использованные
+записи (LRU по mtime), а из индекса - строки, которые на них указывали.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+# Версия формата: при изменении алгоритма анализа старые записи не подойдут
+CACHE_FORMAT_VERSION = 1
+
+# Ограничение размера кэша по умолчанию (в байтах)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Размер буфера при вычислении хэша файла
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """
+    Считает SHA-256 содержимого файла, читая его блоками.
+
+    Args:
+        path: Путь к файлу
+
+    Returns:
+        Хэш в виде шестнадцатеричной строки
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(_HASH_BLOCK_SIZE)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_json_atomic(path: Path, data) -> None:
+    """Записывает JSON во временный файл и атомарно подменяет им path."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+class ReportCache:
+    """
+    Кэш словарей частот слов на диске.
+
+    Использование:
+        with ReportCache("data/.cache") as cache:
+            freq = cache.get_or_compute(path, options, lambda: count(path))
+        print(cache.summary())
+
+    Если анализ выполняется в другом месте (например, в пуле процессов),
+    можно отдельно вызвать lookup() и затем store() для промахов.
+
+    Attributes:
+        cache_dir: Папка кэша
+        max_bytes: Максимальный суммарный размер записей и индекса
+        hits: Сколько раз результат взят из кэша
+        misses: Сколько раз пришлось анализировать файл
+        evicted: Сколько записей удалено при очистке
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Папка для хранения кэша (создаётся при необходимости)
+            max_bytes: Максимальный суммарный размер записей и индекса в байтах
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+
+        self._entries_dir = self.cache_dir / "entries"
+        self._entries_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.cache_dir / "index.json"
+        self._index = self._load_index()
+        self._dirty = False
+        # Суммарный размер записей считается один раз и дальше поддерживается
+        self._total_bytes: Optional[int] = None
+        # Характеристики файлов, для которых lookup() промахнулся
+        self._pending: Dict[str, dict] = {}
+
+    def _load_index(self) -> Dict[str, dict]:
+        """Читает индекс путь -> (размер, mtime, хэш); битый индекс игнорируется."""
+        try:
+            with self._index_path.open("r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+        if not isinstance(index, dict):
+            return {}
+        return index
+
+    @staticmethod
+    def options_key(options: dict) -> str:
+        """
+        Короткий ключ параметров анализа (кодировка, casefold, yo2e и т.д.).
+
+        Args:
+            options: Параметры, влияющие на результат анализа
+
+        Returns:
+            Первые 16 символов SHA-1 от канонического JSON параметров
+        """
+        canonical = json.dumps(
+            {"version": CACHE_FORMAT_VERSION, **options}, sort_keys=True
+        )
+        return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+    def get_or_compute(
+        self,
+        path: Union[str, Path],
+        options: dict,
+        compute: Callable[[], Dict[str, int]],
+    ) -> Dict[str, int]:
+        """
+        Возвращает словарь частот файла из кэша или вычисляет и сохраняет его.
+
+        Args:
+            path: Путь к анализируемому файлу
+            options: Параметры анализа (входят в ключ кэша)
+            compute: Функция без аргументов, которая анализирует файл
+
+        Returns:
+            Словарь частот слов
+
+        Raises:
+            FileNotFoundError: Если файл не существует
+        """
+        freq = self.lookup(path, options)
+        if freq is None:
+            freq = compute()
+            self.store(path, options, freq)
+        return freq
+
+    def lookup(self, path: Union[str, Path], options: dict) -> Optional[Dict[str, int]]:
+        """
+        Ищет словарь частот файла в кэше.
+
+        При промахе запоминает размер, mtime и хэш файла, чтобы store()
+        мог сохранить результат без повторного хэширования.
+
+        Args:
+            path: Путь к анализируемому файлу
+            options: Параметры анализа (входят в ключ кэша)
+
+        Returns:
+            Словарь частот или None, если файла нет в кэше
+
+        Raises:
+            FileNotFoundError: Если файл не существует
+        """
+        file_path = Path(path).resolve()
+        stat = file_path.stat()
+        options_key = self.options_key(options)
+        index_key = f"{file_path}|{options_key}"
+
+        # Быстрый путь: размер и mtime не изменились - хэш не считаем
+        record = self._index.get(index_key)
+        if (
+            record is not None
+            and record.get("size") == stat.st_size
+            and record.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            freq = self._read_entry(record["sha256"], options_key)
+            if freq is not None:
+                self.hits += 1
+                return freq
+
+        # Файл мог быть только "потроган": сверяем содержимое по хэшу
+        sha256 = file_sha256(file_path)
+        record = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        freq = self._read_entry(sha256, options_key)
+
+        if freq is None:
+            self.misses += 1
+            self._pending[index_key] = record
+            return None
+
+        self.hits += 1
+        self._index[index_key] = record
+        self._dirty = True
+        return freq
+
+    def store(
+        self, path: Union[str, Path], options: dict, freq: Dict[str, int]
+    ) -> None:
+        """
+        Сохраняет словарь частот файла, для которого lookup() вернул None.
+
+        Args:
+            path: Путь к анализируемому файлу
+            options: Параметры анализа (те же, что и в lookup)
+            freq: Вычисленный словарь частот
+        """
+        options_key = self.options_key(options)
+        index_key = f"{Path(path).resolve()}|{options_key}"
+
+        record = self._pending.pop(index_key, None)
+        if record is None:
+            # lookup не вызывался: снимаем характеристики файла сейчас
+            stat = Path(path).stat()
+            record = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": file_sha256(path),
+            }
+
+        # Строка индекса добавляется до записи: очистка может сразу её убрать
+        self._index[index_key] = record
+        self._dirty = True
+        self._write_entry(record["sha256"], options_key, freq)
+
+    def _entry_path(self, sha256: str, options_key: str) -> Path:
+        """Путь к файлу записи для данного содержимого и параметров."""
+        return self._entries_dir / f"{sha256}-{options_key}.json"
+
+    def _read_entry(self, sha256: str, options_key: str) -> Optional[Dict[str, int]]:
+        """Читает запись и отмечает её как недавно использованную."""
+        entry_path = self._entry_path(sha256, options_key)
+        try:
+            with entry_path.open("r", encoding="utf-8") as f:
+                freq = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # mtime записи служит отметкой последнего использования для LRU
+        os.utime(entry_path)
+        return freq
+
+    def _write_entry(self, sha256: str, options_key: str, freq: Dict[str, int]) -> None:
+        """Сохраняет запись и при необходимости освобождает место."""
+        entry_path = self._entry_path(sha256, options_key)
+        total = self.size()
+        if entry_path.exists():
+            total -= entry_path.stat().st_size
+
+        _write_json_atomic(entry_path, freq)
+        self._total_bytes = total + entry_path.stat().st_size
+
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _index_bytes(self) -> int:
+        """Размер файла индекса на диске (0, если он ещё не сохранён)."""
+        try:
+            return self._index_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def size(self) -> int:
+        """Возвращает суммарный размер записей и индекса кэша в байтах."""
+        if self._total_bytes is None:
+            self._total_bytes = self._index_bytes() + sum(
+                p.stat().st_size for p in self._entries_dir.glob("*.json")
+            )
+        return self._total_bytes
+
+    def evict(self) -> None:
+        """
+        Удаляет давно не использованные записи, пока кэш больше max_bytes.
+
+        Строки индекса, указывающие на удалённые (или уже отсутствующие)
+        записи, выбрасываются, и индекс сразу перезаписывается.
+        """
+        entries = []
+        total = self._index_bytes()
+        for entry_path in self._entries_dir.glob("*.json"):
+            stat = entry_path.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+            total += stat.st_size
+
+        # Сначала самые старые по времени последнего использования
+        entries.sort()
+        kept = {entry_path.name for _, _, entry_path in entries}
+        for _, size, entry_path in entries:
+            if total <= self.max_bytes:
+                break
+            entry_path.unlink(missing_ok=True)
+            kept.discard(entry_path.name)
+            total -= size
+            self.evicted += 1
+
+        self._total_bytes = total
+
+        # Индекс не должен ссылаться на удалённые записи и расти без предела
+        for index_key, record in list(self._index.items()):
+            options_key = index_key.rpartition("|")[2]
+            if self._entry_path(record["sha256"], options_key).name not in kept:
+                del self._index[index_key]
+                self._dirty = True
+        self.save()
+
+    def save(self) -> None:
+        """Сохраняет индекс на диск, если он изменился."""
+        if self._dirty:
+            old_bytes = self._index_bytes()
+            _write_json_atomic(self._index_path, self._index)
+            self._dirty = False
+            if self._total_bytes is not None:
+                self._total_bytes += self._index_bytes() - old_bytes
+
+    def summary(self) -> str:
+        """
+        Возвращает строку со статистикой кэша для вывода в консоль.
+
+        Returns:
+            Например: "попаданий: 3, промахов: 1, удалено: 0, размер: 12.3 КБ"
+        """
+        return (
+            f"попаданий: {self.hits}, промахов: {self.misses}, "
+            f"удалено: {self.evicted}, размер: {self.size() / 1024:.1f} КБ"
+        )
+
+    def __enter__(self) -> "ReportCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.save()
@@ -10,33 +10,37 @@ text_report.py - скрипт для генерации отчетов по те
     python src/lab04/text_report.py                    # Базовая версия
     python src/lab04/text_report.py --table            # С красивой таблицей
     python src/lab04/text_report.py --input my.txt     # Свои файлы
+
+Из корня репозитория скрипт можно запустить и как модуль:
+    python -m src.lab04.text_report
 """
 
 # Импортируем стандартные модули Python
+import os  # Для работы с путями и размерами файлов
 import sys  # Для работы с системными функциями (выход из программы)
+import time  # Для замера скорости обработки
 import argparse  # Для обработки аргументов командной строки (--input, --output и т.д.)
 from pathlib import Path  # Для удобной работы с путями файлов и папок
+from typing import TYPE_CHECKING, Optional, Sequence, Union  # Для подсказок типов
 
-"""
-ВНИМАНИЕ: следующий блок кода нужен чтобы Python мог найти наши собственные модули
-в папке src/lib/ и src/lab04/
-"""
-# Получаем путь к родительской папке (src/) и добавляем его в sys.path
-# Это нужно чтобы импортировать наши собственные модули
-sys.path.append(str(Path(__file__).parent.parent))
+if not __package__:
+    # Запуск файлом (python src/lab04/text_report.py): добавляем корень
+    # репозитория, чтобы импорты из пакета src работали так же, как при -m
+    sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 # Импортируем наши собственные функции из других файлов
-from lib.text import (
-    normalize,
-    tokenize,
-    count_freq,
-    top_n,
-)  # Функции из ЛР3 для работы с текстом
-from lab04.io_txt_csv import (
-    read_text,
+from src.lab04.io_txt_csv import (
+    DEFAULT_CHUNK_SIZE,
+    read_text_chunks,
     write_csv,
 )  # Функции из этой ЛР для работы с файлами
 
+# Остальные модули (ядро анализа текста, пул процессов, кэш) импортируются
+# внутри функций, которым они нужны: так --help и простой запуск не платят
+# за импорт того, что не используется
+if TYPE_CHECKING:
+    from src.lab04.report_cache import ReportCache
+
 
 def print_table_output(top_words: list[tuple[str, int]]) -> None:
     """
@@ -114,116 +118,354 @@ def analyze_text(text: str) -> tuple[int, int, list[tuple[str, int]]]:
         2. Токенизация: разбиваем текст на отдельные слова
         3. Подсчет частот: считаем сколько раз каждое слово встречается
         4. Сортировка: находим 5 самых частых слов
+
+    Полный результат (включая таблицу всех частот) дает TextAnalysis.from_text.
+    """
+    from src.lib.text import TextAnalysis
+
+    # Все шаги выполняются за один проход внутри TextAnalysis
+    analysis = TextAnalysis.from_text(text, n=5)
+
+    return analysis.total_words, analysis.unique_words, analysis.top_words
+
+
+def count_file(
+    input_file: Union[str, Path],
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> dict[str, int]:
+    """
+    Считает частоты слов в одном файле, не загружая его в память целиком.
+
+    Args:
+        input_file: Путь к файлу с текстом
+        encoding: Кодировка файла
+        chunk_size: Размер буфера чтения в символах
+        workers: Количество процессов (1 - без процессов)
+
+    Returns:
+        Словарь частот слов
+    """
+    if workers > 1:
+        from src.lib.text_parallel import count_file_freq_parallel
+
+        # Файл делится на диапазоны, которые считаются в разных процессах
+        return count_file_freq_parallel(input_file, encoding, workers)
+
+    from src.lib.text import count_freq_stream
+
+    return count_freq_stream(read_text_chunks(input_file, encoding, chunk_size))
+
+
+def expand_inputs(inputs: Sequence[str], pattern: str = "*.txt") -> list[Path]:
+    """
+    Раскрывает папки и шаблоны в список файлов для анализа.
+
+    Args:
+        inputs: Пути к файлам, папкам или шаблоны (data/*.txt, data/**/*.txt)
+        pattern: Какие файлы брать из папок (ищутся рекурсивно)
+
+    Returns:
+        Список файлов без повторов в порядке перечисления
+
+    Examples:
+        >>> expand_inputs(["data/lab04", "notes.txt"])
+        [PosixPath('data/lab04/a.txt'), ..., PosixPath('notes.txt')]
+    """
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob(pattern) if p.is_file()))
+        elif any(char in str(item) for char in "*?["):
+            import glob
+
+            matches = glob.glob(str(item), recursive=True)
+            files.extend(sorted(Path(p) for p in matches if Path(p).is_file()))
+        else:
+            # Обычный путь (если файла нет - ошибка будет при чтении)
+            files.append(path)
+
+    # Убираем повторы, сохраняя порядок
+    return list(dict.fromkeys(files))
+
+
+def per_file_report_path(
+    input_file: Union[str, Path], base_dir: Union[str, Path], per_file_dir: str
+) -> Path:
+    """
+    Возвращает путь отчета для одного файла внутри per_file_dir.
+
+    Имя строится из пути файла относительно base_dir, поэтому одноименные
+    файлы из разных папок не перезаписывают отчеты друг друга:
+    base_dir/a/text.txt -> per_file_dir/a__text.csv
+
+    Args:
+        input_file: Анализируемый файл
+        base_dir: Общая родительская папка всех входных файлов
+        per_file_dir: Папка для отчетов по отдельным файлам
+
+    Returns:
+        Путь к CSV отчету
+    """
+    relative = Path(input_file).resolve().relative_to(base_dir)
+    name = "__".join(relative.with_suffix("").parts) + ".csv"
+    return Path(per_file_dir) / name
+
+
+def collect_frequencies(
+    input_files: Sequence[Union[str, Path]],
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    jobs: int = 1,
+    cache: Optional["ReportCache"] = None,
+    per_file_dir: Optional[str] = None,
+) -> dict[str, int]:
+    """
+    Считает частоты слов во всех файлах и складывает их в общий словарь.
+
+    Все файлы обрабатываются в одном процессе Python (или в пуле из jobs
+    процессов), поэтому запуск интерпретатора и импорты оплачиваются один
+    раз. По ходу работы печатается прогресс и скорость (файлов/с, МБ/с).
+
+    Args:
+        input_files: Список файлов
+        encoding: Кодировка файлов
+        chunk_size: Размер буфера чтения в символах
+        workers: Количество процессов внутри одного файла (если jobs == 1)
+        jobs: Количество процессов, обрабатывающих разные файлы параллельно
+        cache: Дисковый кэш частот (None - без кэша)
+        per_file_dir: Папка для CSV отчетов по каждому файлу (None - не нужны)
+
+    Returns:
+        Общий словарь частот по всем файлам
+
+    Raises:
+        FileNotFoundError: Если какого-то файла нет
+        UnicodeDecodeError: Если файл не читается в указанной кодировке
+            (путь к файлу сохраняется в атрибуте input_file исключения)
     """
-    # Шаг 1: Нормализуем текст (приводим к нижнему регистру, убираем лишние пробелы)
-    normalized_text = normalize(text)
+    from src.lib.text import TextAnalysis, merge_freq
+
+    # Параметры, от которых зависит результат анализа (входят в ключ кэша)
+    cache_options = {"encoding": encoding, "casefold": True, "yo2e": True}
 
-    # Шаг 2: Разбиваем нормализованный текст на отдельные слова (токены)
-    tokens = tokenize(normalized_text)
+    # Проверяем все файлы заранее, чтобы не упасть в середине работы
+    for input_file in input_files:
+        if not Path(input_file).is_file():
+            raise FileNotFoundError(2, "Файл не найден", str(input_file))
 
-    # Шаг 3: Подсчитываем частоту каждого слова (сколько раз встречается)
-    frequency_dict = count_freq(tokens)
+    base_dir = None
+    if per_file_dir and input_files:
+        base_dir = os.path.commonpath(
+            [str(Path(p).resolve().parent) for p in input_files]
+        )
 
-    # Шаг 4: Находим 5 самых частых слов
-    top_5_words = top_n(frequency_dict, 5)
+    frequencies = {}
+    processed_files = 0
+    processed_bytes = 0
+    start = time.perf_counter()
+
+    def finish(input_file, file_frequencies):
+        """Учитывает результат одного файла: общий отчет, свой отчет, прогресс."""
+        nonlocal processed_files, processed_bytes
+
+        # Общий отчет по нескольким файлам - сумма их частот
+        merge_freq(frequencies, file_frequencies)
+
+        if per_file_dir:
+            report = TextAnalysis.from_freq(file_frequencies)
+            write_csv(
+                report.frequencies,
+                per_file_report_path(input_file, base_dir, per_file_dir),
+                header=("word", "count"),
+            )
+
+        processed_files += 1
+        processed_bytes += os.path.getsize(input_file)
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        print(
+            f"[{processed_files}/{len(input_files)}] {input_file}: "
+            f"{sum(file_frequencies.values())} слов, "
+            f"{processed_bytes / 1024 / 1024 / elapsed:.1f} МБ/с"
+        )
 
-    # Возвращаем результаты
-    total_word_count = len(tokens)  # Всего слов (с повторениями)
-    unique_word_count = len(frequency_dict)  # Уникальных слов (без повторений)
+    # Сначала отдаем все, что есть в кэше; анализировать нужно только промахи
+    misses = []
+    for input_file in input_files:
+        file_frequencies = cache.lookup(input_file, cache_options) if cache else None
+        if file_frequencies is None:
+            misses.append(input_file)
+        else:
+            finish(input_file, file_frequencies)
+
+    def analyzed(input_file, file_frequencies):
+        if cache is not None:
+            cache.store(input_file, cache_options, file_frequencies)
+        finish(input_file, file_frequencies)
+
+    if jobs > 1 and len(misses) > 1:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # Разные файлы - в разных процессах, каждый файл считается целиком
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(count_file, input_file, encoding, chunk_size): (
+                    input_file
+                )
+                for input_file in misses
+            }
+            for future in as_completed(futures):
+                input_file = futures[future]
+                try:
+                    file_frequencies = future.result()
+                except UnicodeDecodeError as error:
+                    error.input_file = str(input_file)
+                    raise
+                analyzed(input_file, file_frequencies)
+    else:
+        for input_file in misses:
+            try:
+                file_frequencies = count_file(input_file, encoding, chunk_size, workers)
+            except UnicodeDecodeError as error:
+                error.input_file = str(input_file)
+                raise
+            analyzed(input_file, file_frequencies)
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    megabytes = processed_bytes / 1024 / 1024
+    print(
+        f"Обработано файлов: {processed_files} ({megabytes:.2f} МБ) "
+        f"за {elapsed:.2f} сек: {processed_files / elapsed:.1f} файлов/с, "
+        f"{megabytes / elapsed:.1f} МБ/с"
+    )
 
-    return total_word_count, unique_word_count, top_5_words
+    return frequencies
 
 
 def generate_report(
-    input_file: str,
+    input_file: Union[str, Sequence[str]],
     output_file: str,
     encoding: str = "utf-8",
     table_output: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: Optional[int] = None,
+    jobs: int = 1,
+    per_file_dir: Optional[str] = None,
 ) -> None:
     """
     Основная функция генерации отчета - координирует всю работу.
 
     Эта функция:
-      1. Читает текст из файла
-      2. Анализирует его
+      1. Читает текст из файла кусками фиксированного размера
+      2. Анализирует его на лету, не загружая файл целиком в память
+         (при workers > 1 - параллельно на нескольких процессах)
       3. Сохраняет полные результаты в CSV
       4. Выводит краткую статистику в консоль
 
+    Если передано несколько файлов, строится общий отчет по сумме их частот
+    (и, если указан per_file_dir, отдельный отчет по каждому файлу).
+    Если указан cache_dir, частоты неизменившихся файлов берутся из кэша.
+
     Args:
-        input_file (str): Путь к файлу с текстом для анализа
+        input_file (str | list[str]): Путь к файлу (или список путей) с текстом
         output_file (str): Путь куда сохранить CSV отчет
         encoding (str): Кодировка входного файла (utf-8, cp1251 и т.д.)
         table_output (bool): Если True - выводит красивую таблицу, иначе простой список
+        chunk_size (int): Размер буфера чтения в символах
+        workers (int): Количество процессов для подсчета частот (1 - без процессов)
+        cache_dir (str | None): Папка дискового кэша частот (None - без кэша)
+        cache_max_bytes (int | None): Максимальный размер кэша в байтах
+            (None - размер по умолчанию, 256 МБ)
+        jobs (int): Количество процессов, обрабатывающих разные файлы
+        per_file_dir (str | None): Папка для отчетов по каждому файлу
 
     Raises:
         FileNotFoundError: Если входной файл не существует
         UnicodeDecodeError: Если неправильно указана кодировка файла
     """
-    try:
-        """
-        БЛОК 1: ЧТЕНИЕ ФАЙЛА
-        """
-        print(f"Читаем файл: {input_file}")
-        text_content = read_text(input_file, encoding)
+    if isinstance(input_file, (str, Path)):
+        input_files = [input_file]
+    else:
+        input_files = list(input_file)
 
-        # Проверяем что файл не пустой
-        if not text_content.strip():
-            print("Внимание: файл пустой или содержит только пробелы")
+    from src.lib.text import TextAnalysis
+
+    cache = None
+    if cache_dir:
+        from src.lab04.report_cache import DEFAULT_MAX_BYTES, ReportCache
+
+        cache = ReportCache(cache_dir, cache_max_bytes or DEFAULT_MAX_BYTES)
 
+    try:
         """
-        БЛОК 2: АНАЛИЗ ТЕКСТА
+        БЛОК 1: ПОТОКОВОЕ ЧТЕНИЕ И АНАЛИЗ ТЕКСТА
+        Файлы читаются кусками, слова на границах кусков склеиваются,
+        поэтому память не зависит от размера файлов
         """
+        print(f"Читаем файлов: {len(input_files)}")
         print("Анализируем текст...")
-        total_words, unique_words, top_words = analyze_text(text_content)
+        frequencies = collect_frequencies(
+            input_files, encoding, chunk_size, workers, jobs, cache, per_file_dir
+        )
 
-        """
-        БЛОК 3: ПОДГОТОВКА ДАННЫХ ДЛЯ CSV
-        Здесь мы заново получаем частоты всех слов и сортируем их
-        для сохранения в CSV файл
-        """
-        # Получаем частоты всех слов (не только топ-5)
-        all_frequencies = count_freq(tokenize(normalize(text_content)))
+        if cache is not None:
+            cache.save()
+            print(f"Кэш: {cache.summary()}")
 
-        # Сортируем слова по убыванию частоты, при равенстве - по алфавиту
-        sorted_all_words = sorted(all_frequencies.items(), key=lambda x: (-x[1], x[0]))
+        # Частоты считаются один раз, из них же строятся и топ-5, и полная
+        # отсортированная таблица для CSV
+        analysis = TextAnalysis.from_freq(frequencies, n=5)
 
-        # Преобразуем в формат для CSV: список кортежей (слово, количество)
-        csv_data = [(word, count) for word, count in sorted_all_words]
+        # Проверяем что файл не пустой (нужно только если слов не нашлось)
+        if analysis.total_words == 0 and not any(
+            chunk.strip()
+            for input_path in input_files
+            for chunk in read_text_chunks(input_path, encoding, chunk_size)
+        ):
+            print("Внимание: файл пустой или содержит только пробелы")
 
         """
-        БЛОК 4: СОХРАНЕНИЕ CSV ОТЧЕТА
+        БЛОК 2: СОХРАНЕНИЕ CSV ОТЧЕТА
+        Полная таблица частот уже отсортирована по убыванию частоты,
+        при равенстве - по алфавиту
         """
         print(f"Сохраняем отчет...")
-        write_csv(csv_data, output_file, header=("word", "count"))
+        write_csv(analysis.frequencies, output_file, header=("word", "count"))
 
         """
-        БЛОК 5: ВЫВОД СТАТИСТИКИ В КОНСОЛЬ
+        БЛОК 3: ВЫВОД СТАТИСТИКИ В КОНСОЛЬ
         """
         print("\nРЕЗУЛЬТАТЫ АНАЛИЗА:")
-        print(f"   Всего слов: {total_words}")
-        print(f"   Уникальных слов: {unique_words}")
+        print(f"   Всего слов: {analysis.total_words}")
+        print(f"   Уникальных слов: {analysis.unique_words}")
         print("   Топ-5 самых частых слов:")
 
         if table_output:
             # ВЫВОД В ВИДЕ КРАСИВОЙ ТАБЛИЦЫ
-            print_table_output(top_words)
+            print_table_output(analysis.top_words)
         else:
             # ПРОСТОЙ ВЫВОД (как было раньше)
-            for word, count in top_words:
+            for word, count in analysis.top_words:
                 print(f"   {word}: {count}")
 
         print(f"\nПолный отчет сохранен в: {output_file}")
 
-    except FileNotFoundError:
+    except FileNotFoundError as error:
         # Обработка ошибки: файл не найден
-        print(f"Ошибка: файл '{input_file}' не найден!")
+        print(f"Ошибка: файл '{error.filename}' не найден!")
         print("   Проверьте путь к файлу и его наличие")
         sys.exit(1)  # Завершаем программу с кодом ошибки 1
 
-    except UnicodeDecodeError:
+    except UnicodeDecodeError as error:
         # Обработка ошибки: неправильная кодировка
+        failed_file = getattr(error, "input_file", input_files[0])
         print(
-            f"Ошибка: не удалось прочитать файл '{input_file}' в кодировке '{encoding}'"
+            f"Ошибка: не удалось прочитать файл '{failed_file}' в кодировке '{encoding}'"
         )
         print("   Возможные решения:")
         print("   - Укажите правильную кодировку: --encoding cp1251")
@@ -241,10 +483,17 @@ def main() -> None:
       3. Запускает процесс генерации отчета
 
     Аргументы командной строки:
-      --input, -i    : Путь к входному файлу
+      --input, -i    : Пути к файлам, папкам или шаблоны (data/*.txt)
       --output, -o   : Путь для сохранения отчета
       --encoding, -e : Кодировка файла
       --table, -t    : Включить красивый табличный вывод
+      --chunk-size   : Размер буфера потокового чтения в символах
+      --workers      : Количество процессов для подсчета частот
+      --cache-dir    : Папка дискового кэша частот
+      --cache-max-mb : Максимальный размер кэша в мегабайтах
+      --glob         : Шаблон файлов внутри папок
+      --per-file-dir : Папка для отчетов по каждому файлу
+      --jobs, -j     : Количество файлов, обрабатываемых параллельно
     """
     """
     Шаг 1: СОЗДАЕМ ПАРСЕР АРГУМЕНТОВ
@@ -256,7 +505,8 @@ def main() -> None:
         epilog="Примеры использования:\n"
         "  python text_report.py                    # Базовая версия\n"
         "  python text_report.py --table            # С красивой таблицей\n"
-        "  python text_report.py -i story.txt -t    # Анализ story.txt с таблицей",
+        "  python text_report.py -i story.txt -t    # Анализ story.txt с таблицей\n"
+        "  python text_report.py -i data/ -j 4      # Общий отчет по всем .txt в папке",
     )
 
     """
@@ -268,8 +518,11 @@ def main() -> None:
     parser.add_argument(
         "--input",  # Длинное имя: --input
         "-i",  # Короткое имя: -i
-        default="data/lab04/input.txt",  # Значение по умолчанию если аргумент не указан
-        help="Путь к файлу с текстом для анализа",  # Описание для справки
+        nargs="+",  # Можно указать несколько файлов - будет общий отчет
+        default=[
+            "data/lab04/input.txt"
+        ],  # Значение по умолчанию если аргумент не указан
+        help="Путь к файлу (или нескольким файлам) с текстом для анализа",  # Описание для справки
     )
 
     # Аргумент для выходного файла
@@ -296,25 +549,91 @@ def main() -> None:
         help="Выводить топ-5 слов в виде красивой таблицы",
     )
 
+    # Аргумент для размера буфера потокового чтения
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Размер буфера чтения в символах (файл не загружается в память целиком)",
+    )
+
+    # Аргумент для количества процессов
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Количество процессов для подсчета частот (по умолчанию 1)",
+    )
+
+    # Аргументы для дискового кэша частот
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Папка кэша: неизменившиеся файлы не анализируются повторно",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=None,
+        help="Максимальный размер кэша в МБ, по умолчанию 256 (старые записи удаляются)",
+    )
+
+    # Аргументы для обработки нескольких файлов и папок
+    parser.add_argument(
+        "--glob",
+        default="*.txt",
+        help="Какие файлы брать из папок, указанных в --input (по умолчанию *.txt)",
+    )
+    parser.add_argument(
+        "--per-file-dir",
+        default=None,
+        help="Папка для отдельного CSV отчета по каждому файлу",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Количество процессов, обрабатывающих разные файлы (по умолчанию 1)",
+    )
+
     """
     Шаг 3: ЧИТАЕМ АРГУМЕНТЫ ИЗ КОМАНДНОЙ СТРОКИ
     parse_args() анализирует sys.argv (аргументы которые передали при запуске)
     и возвращает объект с значениями всех аргументов
     """
     args = parser.parse_args()
+    input_files = expand_inputs(args.input, args.glob)
+    if not input_files:
+        print(f"Ошибка: по '{' '.join(args.input)}' не найдено ни одного файла")
+        sys.exit(1)
 
     """
     Шаг 4: ЗАПУСКАЕМ ГЕНЕРАЦИЮ ОТЧЕТА
     Передаем все аргументы в основную функцию
     """
     print("Запуск анализа текста...")
-    print(f"   Входной файл: {args.input}")
+    print(f"   Входные файлы: {len(input_files)} ({', '.join(args.input)})")
     print(f"   Выходной файл: {args.output}")
     print(f"   Кодировка: {args.encoding}")
     print(f"   Табличный вывод: {'ВКЛЮЧЕН' if args.table else 'выключен'}")
+    print(f"   Процессов: {args.workers}, параллельных файлов: {args.jobs}")
+    print(f"   Кэш: {args.cache_dir or 'выключен'}")
     print()
 
-    generate_report(args.input, args.output, args.encoding, args.table)
+    generate_report(
+        [str(path) for path in input_files],
+        args.output,
+        args.encoding,
+        args.table,
+        args.chunk_size,
+        args.workers,
+        args.cache_dir,
+        int(args.cache_max_mb * 1024 * 1024) if args.cache_max_mb else None,
+        args.jobs,
+        args.per_file_dir,
+    )
 
 
 """
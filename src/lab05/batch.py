@@ -0,0 +1,200 @@
+"""
+Пакетная конвертация папки файлов JSON/CSV/XLSX.
+ЛР5 — JSON и конвертации
+
+Все файлы обрабатываются в одном запуске Python (и при jobs > 1 - в пуле
+процессов), поэтому запуск интерпретатора и импорты оплачиваются один
+раз, а не для каждого файла. Файлы, у которых результат новее исходника,
+пропускаются. Ошибка в одном файле не останавливает остальные.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+# Какие исходные файлы берутся для каждого целевого формата
+SOURCE_SUFFIXES = {
+    "csv": (".json", ".jsonl", ".ndjson"),
+    "json": (".csv",),
+    "xlsx": (".csv",),
+}
+
+
+@dataclass
+class BatchResult:
+    """
+    Итоги пакетной конвертации.
+
+    Attributes:
+        converted: Сколько файлов сконвертировано
+        skipped: Сколько файлов пропущено (результат уже актуален)
+        failed: Список (исходный файл, текст ошибки)
+        total_bytes: Суммарный размер сконвертированных исходных файлов
+        elapsed: Время работы в секундах
+    """
+
+    converted: int = 0
+    skipped: int = 0
+    failed: list[tuple[str, str]] = field(default_factory=list)
+    total_bytes: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> str:
+        """
+        Возвращает строку с итогами для вывода в консоль.
+
+        Returns:
+            Например: "сконвертировано: 10, пропущено: 2, ошибок: 0, ..."
+        """
+        elapsed = max(self.elapsed, 1e-9)
+        megabytes = self.total_bytes / 1024 / 1024
+        return (
+            f"сконвертировано: {self.converted}, пропущено: {self.skipped}, "
+            f"ошибок: {len(self.failed)} за {self.elapsed:.2f} сек "
+            f"({self.converted / elapsed:.1f} файлов/с, {megabytes / elapsed:.1f} МБ/с)"
+        )
+
+
+def plan_batch(
+    in_dir: Union[str, Path], out_dir: Union[str, Path], to: str
+) -> list[tuple[Path, Path]]:
+    """
+    Находит исходные файлы и пути результатов для них.
+
+    Структура вложенных папок сохраняется: in_dir/a/b.json -> out_dir/a/b.csv
+
+    Args:
+        in_dir: Папка с исходными файлами (просматривается рекурсивно)
+        out_dir: Папка для результатов
+        to: Целевой формат: "csv", "json" или "xlsx"
+
+    Returns:
+        Список пар (исходный файл, файл результата)
+
+    Raises:
+        ValueError: Если формат не поддерживается
+        FileNotFoundError: Если папки in_dir нет
+    """
+    if to not in SOURCE_SUFFIXES:
+        raise ValueError(f"Неизвестный формат: {to}")
+
+    in_path = Path(in_dir)
+    if not in_path.is_dir():
+        raise FileNotFoundError(f"Папка не найдена: {in_dir}")
+
+    suffixes = SOURCE_SUFFIXES[to]
+    pairs = []
+    for source in sorted(in_path.rglob("*")):
+        if source.is_file() and source.suffix.lower() in suffixes:
+            target = Path(out_dir) / source.relative_to(in_path).with_suffix("." + to)
+            pairs.append((source, target))
+    return pairs
+
+
+def is_up_to_date(source: Path, target: Path) -> bool:
+    """Проверяет, что результат существует и не старше исходного файла."""
+    try:
+        return target.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def convert_file(source: Union[str, Path], target: Union[str, Path], to: str) -> None:
+    """
+    Конвертирует один файл в формат to.
+
+    Модули конвертации импортируются только при первом использовании,
+    поэтому, например, openpyxl нужен только для xlsx.
+
+    Args:
+        source: Исходный файл
+        target: Файл результата
+        to: Целевой формат: "csv", "json" или "xlsx"
+    """
+    if to == "csv":
+        from src.lab05.json_csv import json_to_csv
+
+        json_to_csv(str(source), str(target))
+    elif to == "json":
+        from src.lab05.json_csv import csv_to_json
+
+        csv_to_json(str(source), str(target))
+    elif to == "xlsx":
+        from src.lab05.csv_xlsx import csv_to_xlsx
+
+        csv_to_xlsx(str(source), str(target))
+    else:
+        raise ValueError(f"Неизвестный формат: {to}")
+
+
+def _convert_task(task: tuple[Path, Path, str]) -> Optional[str]:
+    """
+    Конвертирует один файл в пуле процессов.
+
+    Returns:
+        None при успехе, иначе текст ошибки (недописанный результат удаляется)
+    """
+    source, target, to = task
+    try:
+        convert_file(source, target, to)
+    except Exception as e:
+        Path(target).unlink(missing_ok=True)
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def convert_batch(
+    in_dir: Union[str, Path],
+    out_dir: Union[str, Path],
+    to: str,
+    jobs: int = 1,
+    force: bool = False,
+) -> BatchResult:
+    """
+    Конвертирует все подходящие файлы папки.
+
+    Args:
+        in_dir: Папка с исходными файлами (просматривается рекурсивно)
+        out_dir: Папка для результатов
+        to: Целевой формат: "csv", "json" или "xlsx"
+        jobs: Количество процессов (1 - без процессов)
+        force: Конвертировать даже актуальные файлы
+
+    Returns:
+        Итоги конвертации (ошибки отдельных файлов собираются в failed)
+
+    Raises:
+        ValueError: Если формат не поддерживается
+        FileNotFoundError: Если папки in_dir нет
+    """
+    start = time.perf_counter()
+    result = BatchResult()
+
+    tasks = []
+    for source, target in plan_batch(in_dir, out_dir, to):
+        if not force and is_up_to_date(source, target):
+            result.skipped += 1
+        else:
+            tasks.append((source, target, to))
+
+    if jobs > 1 and len(tasks) > 1:
+        # Мелкие файлы отдаются процессам пачками, чтобы не платить
+        # за передачу каждой задачи отдельно
+        chunksize = max(1, len(tasks) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            errors = list(executor.map(_convert_task, tasks, chunksize=chunksize))
+    else:
+        errors = [_convert_task(task) for task in tasks]
+
+    for (source, _, _), error in zip(tasks, errors):
+        if error is None:
+            result.converted += 1
+            result.total_bytes += os.path.getsize(source)
+        else:
+            result.failed.append((str(source), error))
+
+    result.elapsed = time.perf_counter() - start
+    return result
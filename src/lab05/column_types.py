@@ -0,0 +1,296 @@
+"""
+Определение типов колонок CSV для конвертаций CSV → JSON/XLSX.
+ЛР5 — JSON и конвертации
+
+csv.DictReader возвращает все значения строками. Здесь по первым строкам
+файла (ограниченная выборка) для каждой колонки выбирается тип:
+null, bool, int, float, date или str. Затем для каждой колонки строится
+функция-конвертер, которая применяется к строкам на лету при потоковой
+записи.
+
+Найденные типы можно сохранить в файл схемы: при следующем запуске
+на файле с тем же заголовком выборка не нужна.
+"""
+
+import csv
+import json
+import math
+import re
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+# Сколько строк просматривать для определения типов
+DEFAULT_SAMPLE_ROWS = 1000
+
+# Версия формата файла схемы
+SCHEMA_VERSION = 1
+
+# Числа с ведущими нулями ("007" - коды, индексы) остаются строками
+_LEADING_ZERO_RE = re.compile(r"[-+]?0[0-9]")
+_INT_RE = re.compile(r"[-+]?[0-9]+")
+_FLOAT_RE = re.compile(r"[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+)(?:[eE][-+]?[0-9]+)?")
+_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_BOOL_VALUES = {"true": True, "false": False}
+
+# Какой тип получается, если в колонке встретились значения двух типов
+_NUMERIC_TYPES = {"int", "float"}
+
+
+def detect_type(value: str) -> str:
+    """
+    Определяет тип одного значения из CSV.
+
+    Args:
+        value: Строка из CSV
+
+    Returns:
+        "null" для пустой строки, иначе "bool", "int", "float", "date" или "str"
+
+    Examples:
+        >>> detect_type("25"), detect_type("2.5"), detect_type("2025-01-31")
+        ('int', 'float', 'date')
+    """
+    if value == "":
+        return "null"
+    if _LEADING_ZERO_RE.match(value):
+        return "str"
+    if _INT_RE.fullmatch(value):
+        return "int"
+    if _FLOAT_RE.fullmatch(value):
+        # "1e999" разбирается в inf, который нельзя записать в JSON
+        return "float" if math.isfinite(float(value)) else "str"
+    if value.lower() in _BOOL_VALUES:
+        return "bool"
+    if _DATE_RE.fullmatch(value):
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            return "str"
+        return "date"
+    return "str"
+
+
+def merge_types(current: str, new: str) -> str:
+    """
+    Объединяет тип колонки с типом очередного значения.
+
+    Пустые значения не меняют тип, int и float дают float,
+    любые другие разные типы - str.
+
+    Args:
+        current: Тип колонки по предыдущим значениям
+        new: Тип очередного значения
+
+    Returns:
+        Общий тип
+    """
+    if current == new or new == "null":
+        return current
+    if current == "null":
+        return new
+    if current in _NUMERIC_TYPES and new in _NUMERIC_TYPES:
+        return "float"
+    return "str"
+
+
+def infer_column_types(
+    header: Sequence[str],
+    rows: Iterable[Sequence[str]],
+    sample_rows: Optional[int] = DEFAULT_SAMPLE_ROWS,
+) -> dict[str, str]:
+    """
+    Определяет типы колонок по первым sample_rows строкам.
+
+    Args:
+        header: Названия колонок
+        rows: Строки CSV (списки значений) без заголовка
+        sample_rows: Размер выборки (None - все строки)
+
+    Returns:
+        Словарь колонка -> тип
+    """
+    types = ["null"] * len(header)
+    for row in islice(rows, sample_rows):
+        for index, value in enumerate(row[: len(header)]):
+            if types[index] != "str":
+                types[index] = merge_types(types[index], detect_type(value))
+
+    return dict(zip(header, types))
+
+
+def _converter(
+    parse: Callable[[str], Any], accepted: frozenset
+) -> Callable[[Any], Any]:
+    """
+    Оборачивает разбор значения: пустое -> None, не подошло -> как есть.
+
+    Значение проверяется тем же detect_type, что и выборка: "00123" в
+    колонке int или "nan" в колонке float остаются строками.
+    """
+
+    def convert(value):
+        if value == "" or value is None:
+            return None
+        try:
+            if detect_type(value) in accepted:
+                return parse(value)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            pass
+        # Значение за пределами выборки не подошло под тип колонки
+        return value
+
+    return convert
+
+
+def _keep(value):
+    return value
+
+
+# Тип колонки -> (разбор, типы значений, которые он принимает)
+_PARSERS = {
+    "int": (int, frozenset({"int"})),
+    "float": (float, frozenset({"int", "float"})),
+    "bool": (lambda value: _BOOL_VALUES[value.lower()], frozenset({"bool"})),
+}
+
+
+def make_converters(
+    types: dict[str, str], parse_dates: bool = False
+) -> dict[str, Callable[[Any], Any]]:
+    """
+    Строит функции-конвертеры для каждой колонки.
+
+    Args:
+        types: Словарь колонка -> тип (результат infer_column_types)
+        parse_dates: Превращать даты в datetime.date (для Excel);
+            иначе даты остаются строками ISO (для JSON)
+
+    Returns:
+        Словарь колонка -> функция "строка из CSV -> значение"
+    """
+    converters = {
+        column_type: _converter(parse, accepted)
+        for column_type, (parse, accepted) in _PARSERS.items()
+    }
+    if parse_dates:
+        converters["date"] = _converter(date.fromisoformat, frozenset({"date"}))
+    else:
+        converters["date"] = _keep
+
+    return {
+        column: converters.get(column_type, _keep)
+        for column, column_type in types.items()
+    }
+
+
+def convert_row(
+    row: dict[str, Any], converters: dict[str, Callable[[Any], Any]]
+) -> dict[str, Any]:
+    """
+    Применяет конвертеры колонок к строке из csv.DictReader.
+
+    Args:
+        row: Строка CSV в виде словаря
+        converters: Результат make_converters
+
+    Returns:
+        Новый словарь с типизированными значениями
+    """
+    return {key: converters.get(key, _keep)(value) for key, value in row.items()}
+
+
+def _layout_key(header: Sequence[str]) -> str:
+    """Ключ схемы в файле: заголовок CSV целиком."""
+    return json.dumps(list(header), ensure_ascii=False)
+
+
+def load_schema(
+    schema_path: Union[str, Path], header: Sequence[str]
+) -> Optional[dict[str, str]]:
+    """
+    Ищет сохраненные типы колонок для файла с таким заголовком.
+
+    Args:
+        schema_path: Путь к файлу схемы
+        header: Заголовок CSV
+
+    Returns:
+        Словарь колонка -> тип или None, если схемы нет
+    """
+    try:
+        with open(schema_path, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if not isinstance(schema, dict) or schema.get("version") != SCHEMA_VERSION:
+        return None
+    return schema.get("layouts", {}).get(_layout_key(header))
+
+
+def save_schema(
+    schema_path: Union[str, Path], header: Sequence[str], types: dict[str, str]
+) -> None:
+    """
+    Сохраняет типы колонок в файл схемы (другие заголовки сохраняются).
+
+    Args:
+        schema_path: Путь к файлу схемы
+        header: Заголовок CSV
+        types: Словарь колонка -> тип
+    """
+    schema_file = Path(schema_path)
+    try:
+        with schema_file.open("r", encoding="utf-8") as f:
+            schema = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        schema = {}
+
+    if not isinstance(schema, dict) or schema.get("version") != SCHEMA_VERSION:
+        schema = {}
+    schema["version"] = SCHEMA_VERSION
+    schema.setdefault("layouts", {})[_layout_key(header)] = types
+
+    schema_file.parent.mkdir(parents=True, exist_ok=True)
+    with schema_file.open("w", encoding="utf-8") as f:
+        json.dump(schema, f, ensure_ascii=False, indent=2)
+
+
+def infer_csv_types(
+    csv_path: Union[str, Path],
+    sample_rows: Optional[int] = DEFAULT_SAMPLE_ROWS,
+    schema_path: Optional[Union[str, Path]] = None,
+) -> dict[str, str]:
+    """
+    Определяет типы колонок CSV файла (с кэшем в файле схемы).
+
+    Если указан schema_path и в нем есть схема для такого же заголовка,
+    файл дальше заголовка не читается. Иначе типы определяются по выборке
+    и сохраняются в schema_path.
+
+    Args:
+        csv_path: Путь к CSV файлу
+        sample_rows: Размер выборки (None - все строки)
+        schema_path: Файл схемы (None - не сохранять)
+
+    Returns:
+        Словарь колонка -> тип (пустой для пустого файла)
+    """
+    with open(csv_path, "r", encoding="utf-8", newline="") as cf:
+        reader = csv.reader(cf)
+        header = next(reader, None)
+        if header is None:
+            return {}
+
+        if schema_path is not None:
+            types = load_schema(schema_path, header)
+            if types is not None:
+                return types
+
+        types = infer_column_types(header, reader, sample_rows)
+
+    if schema_path is not None:
+        save_schema(schema_path, header, types)
+    return types
@@ -4,78 +4,212 @@
 """
 
 import csv
+import re
+from itertools import islice
 from pathlib import Path
+from typing import Optional, Sequence, Union
 
-# Импортируем openpyxl (внешняя библиотека)
-try:
-    from openpyxl import Workbook
-    from openpyxl.utils import get_column_letter
-except ImportError:
-    raise ImportError(
-        "Для работы этого модуля установите openpyxl: pip install openpyxl"
-    )
+from src.lab05.column_types import (
+    DEFAULT_SAMPLE_ROWS,
+    infer_csv_types,
+    make_converters,
+)
 
+# Минимальная ширина колонки в символах
+MIN_COLUMN_WIDTH = 8
 
-def csv_to_xlsx(csv_path: str, xlsx_path: str) -> None:
+# Максимальное количество строк на листе Excel
+EXCEL_MAX_ROWS = 1_048_576
+
+# Максимальная длина имени листа и запрещенные в нем символы
+MAX_SHEET_TITLE = 31
+_INVALID_SHEET_CHARS_RE = re.compile(r"[\[\]:*?/\\]")
+
+
+def column_widths(csv_path: str, sample_rows: Optional[int] = None) -> list[int]:
+    """
+    Считает ширину колонок по самому длинному значению в каждой колонке.
+
+    CSV читается потоково, в памяти хранится только текущий максимум
+    для каждой колонки, поэтому память не зависит от количества строк.
+
+    Args:
+        csv_path: Путь к CSV файлу
+        sample_rows: Сколько строк просмотреть (None - все строки)
+
+    Returns:
+        Список ширин колонок (пустой список, если в файле нет строк)
+    """
+    max_lengths = []
+    with open(csv_path, "r", encoding="utf-8", newline="") as cf:
+        for row in islice(csv.reader(cf), sample_rows):
+            # Строка может оказаться длиннее всех предыдущих
+            if len(row) > len(max_lengths):
+                max_lengths.extend([0] * (len(row) - len(max_lengths)))
+            for index, value in enumerate(row):
+                if len(value) > max_lengths[index]:
+                    max_lengths[index] = len(value)
+
+    return [max(length + 2, MIN_COLUMN_WIDTH) for length in max_lengths]
+
+
+def sheet_title(name: str, used: set[str]) -> str:
+    """
+    Делает допустимое и уникальное имя листа Excel.
+
+    Excel запрещает символы []:*?/\\ и имена длиннее 31 символа,
+    а также одинаковые имена листов (без учета регистра).
+
+    Args:
+        name: Желаемое имя (например, имя CSV файла)
+        used: Уже занятые имена в нижнем регистре (пополняется)
+
+    Returns:
+        Имя листа
+    """
+    base = _INVALID_SHEET_CHARS_RE.sub("_", name)[:MAX_SHEET_TITLE] or "Sheet"
+    title = base
+    number = 2
+    while title.lower() in used:
+        suffix = f"_{number}"
+        title = base[: MAX_SHEET_TITLE - len(suffix)] + suffix
+        number += 1
+
+    used.add(title.lower())
+    return title
+
+
+def csv_to_xlsx(
+    csv_path: Union[str, Sequence[str]],
+    xlsx_path: str,
+    width_sample_rows: Optional[int] = None,
+    max_rows: int = EXCEL_MAX_ROWS,
+    infer_types: bool = False,
+    sample_rows: Optional[int] = DEFAULT_SAMPLE_ROWS,
+    schema_path: Optional[str] = None,
+) -> int:
     """
     Конвертирует CSV файл в XLSX формат (Excel).
 
     Автоматически подбирает ширину колонок по содержимому.
 
+    Книга создается в режиме write-only: строки CSV записываются в файл
+    по одной и не хранятся в памяти, поэтому память не зависит от размера
+    CSV. В этом режиме ширину колонок нужно задать до первой строки, поэтому
+    она считается заранее отдельным быстрым проходом по CSV (или только по
+    первым width_sample_rows строкам).
+
+    Если строк больше max_rows (лимит Excel - 1 048 576), запись продолжается
+    на новом листе (Sheet1_2, Sheet1_3, ...), заголовок CSV повторяется
+    в начале каждого листа. Если передано несколько CSV, каждый попадает
+    на свой лист с именем файла.
+
+    Если infer_types=True, типы колонок определяются по первым sample_rows
+    строкам, и числа, bool и даты записываются в ячейки как значения
+    (их можно суммировать и сортировать в Excel), а не как текст.
+
     Args:
-        csv_path: Путь к исходному CSV файлу
+        csv_path: Путь к исходному CSV файлу (или список путей)
         xlsx_path: Путь для сохранения XLSX файла
+        width_sample_rows: По скольким первым строкам считать ширину колонок
+            (None - по всем строкам)
+        max_rows: Максимум строк на одном листе (вместе с заголовком)
+        infer_types: Определять типы колонок (по умолчанию все - строки)
+        sample_rows: Сколько строк просмотреть для определения типов
+        schema_path: Файл схемы для повторного использования типов
+            (включает infer_types)
+
+    Returns:
+        Количество записанных строк данных CSV по всем файлам
+        (заголовки, в том числе повторенные на новых листах, не считаются)
 
     Raises:
         FileNotFoundError: Если CSV файл не существует
-        ValueError: Если CSV файл пустой
+        ValueError: Если CSV файл пустой или max_rows меньше 2
+        ImportError: Если не установлен openpyxl
     """
-    # Преобразуем пути в Path объекты
-    csv_file = Path(csv_path)
+    # Импортируем openpyxl (внешняя библиотека) только при конвертации:
+    # сам модуль импортируется быстро и без установленного openpyxl
+    try:
+        from openpyxl import Workbook
+        from openpyxl.utils import get_column_letter
+    except ImportError:
+        raise ImportError(
+            "Для работы этого модуля установите openpyxl: pip install openpyxl"
+        )
+
+    if isinstance(csv_path, (str, Path)):
+        csv_files = [Path(csv_path)]
+    else:
+        csv_files = [Path(path) for path in csv_path]
     xlsx_file = Path(xlsx_path)
 
-    # Проверяем существование CSV файла
-    if not csv_file.exists():
-        raise FileNotFoundError(f"CSV файл не найден: {csv_path}")
+    if max_rows < 2:
+        raise ValueError("На листе должно помещаться хотя бы 2 строки")
+
+    # Проверяем существование CSV файлов
+    for csv_file in csv_files:
+        if not csv_file.exists():
+            raise FileNotFoundError(f"CSV файл не найден: {csv_file}")
 
-    # Читаем CSV файл
-    with csv_file.open("r", encoding="utf-8") as cf:
-        reader = csv.reader(cf)
-        rows = list(reader)
+    # Ширина колонок по содержимому (предварительный проход)
+    widths = [column_widths(csv_file, width_sample_rows) for csv_file in csv_files]
 
     # Валидация данных
-    if not rows:
-        raise ValueError("CSV файл пустой")
+    for csv_file, file_widths in zip(csv_files, widths):
+        if not file_widths:
+            raise ValueError(f"CSV файл пустой: {csv_file}")
 
     # Создаем родительские папки если их нет
     xlsx_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Создаем новую книгу Excel
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Sheet1"
-
-    # Записываем данные из CSV в Excel
-    for row in rows:
-        sheet.append(row)
-
-    # Настраиваем авто-ширину колонок
-    for column_cells in sheet.columns:
-        # Получаем максимальную длину текста в колонке
-        max_length = 0
-        column_letter = get_column_letter(column_cells[0].column)
-
-        for cell in column_cells:
-            try:
-                # Проверяем длину текста в ячейке
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-
-        # Устанавливаем ширину колонки (минимум 8 символов)
-        adjusted_width = max(max_length + 2, 8)
-        sheet.column_dimensions[column_letter].width = adjusted_width
+    # Создаем новую книгу Excel (только для записи)
+    workbook = Workbook(write_only=True)
+    used_titles = set()
+    # Только строки данных: заголовки в "Строк" и строк/с не входят
+    total_rows = 0
+
+    def new_sheet(name, file_widths):
+        sheet = workbook.create_sheet(sheet_title(name, used_titles))
+        # Настраиваем ширину колонок (до записи первой строки)
+        for index, width in enumerate(file_widths, start=1):
+            sheet.column_dimensions[get_column_letter(index)].width = width
+        return sheet
+
+    for csv_file, file_widths in zip(csv_files, widths):
+        # Один файл - привычный лист Sheet1, несколько - по имени файла
+        name = "Sheet1" if len(csv_files) == 1 else csv_file.stem
+
+        # Записываем данные из CSV в Excel по одной строке
+        with csv_file.open("r", encoding="utf-8", newline="") as cf:
+            reader = csv.reader(cf)
+            header = next(reader)
+
+            converters = None
+            if infer_types or schema_path is not None:
+                # Типы определяются по выборке, затем применяются на лету
+                types = infer_csv_types(csv_file, sample_rows, schema_path)
+                by_column = make_converters(types, parse_dates=True)
+                converters = [by_column[column] for column in header]
+
+            sheet = new_sheet(name, file_widths)
+            sheet.append(header)
+            sheet_rows = 1
+
+            for row in reader:
+                if sheet_rows >= max_rows:
+                    # Лист заполнен - продолжаем на новом с тем же заголовком
+                    sheet = new_sheet(name, file_widths)
+                    sheet.append(header)
+                    sheet_rows = 1
+                if converters is not None:
+                    row = [
+                        convert(value) for convert, value in zip(converters, row)
+                    ] + row[len(converters) :]
+                sheet.append(row)
+                sheet_rows += 1
+                total_rows += 1
 
     # Сохраняем XLSX файл
     workbook.save(xlsx_file)
+    return total_rows
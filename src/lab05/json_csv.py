@@ -5,23 +5,55 @@
 
 import json
 import csv
+import os
+from itertools import chain, islice
 from pathlib import Path
-
-
-def json_to_csv(json_path: str, csv_path: str) -> None:
+from typing import Optional, Sequence
+
+from src.lab05.column_types import (
+    DEFAULT_SAMPLE_ROWS,
+    convert_row,
+    infer_csv_types,
+    make_converters,
+)
+from src.lib.json_stream import iter_json_records
+
+
+def json_to_csv(
+    json_path: str,
+    csv_path: str,
+    fieldnames: Optional[Sequence[str]] = None,
+    sample_size: Optional[int] = None,
+) -> None:
     """
     Конвертирует JSON файл в CSV формат.
 
     Поддерживает JSON файлы содержащие список словарей.
     Например: [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
+    а также JSON Lines (NDJSON) - по одному словарю на строку (файлы
+    .jsonl/.ndjson или несколько словарей подряд).
+
+    Файл читается потоково (по одной записи), поэтому память не зависит
+    от размера файла. CSV пишется во временный файл и заменяет csv_path
+    только после успешной записи: ошибка в середине JSON не оставляет
+    на диске обрезанный CSV. Заголовок CSV определяется одним из способов:
+      - fieldnames: колонки заданы пользователем, файл читается один раз
+        (ключи записей, которых нет в fieldnames, не попадают в CSV)
+      - иначе: предварительный проход собирает все ключи (по алфавиту);
+        sample_size ограничивает этот проход первыми N записями
 
     Args:
         json_path: Путь к исходному JSON файлу
         csv_path: Путь для сохранения CSV файла
+        fieldnames: Список колонок CSV (None - определить по данным)
+        sample_size: Сколько записей просмотреть для поиска колонок
+            (None - все записи)
 
     Raises:
         FileNotFoundError: Если JSON файл не существует
-        ValueError: Если JSON пустой, не список или содержит не словари
+        ValueError: Если JSON пустой, не список или содержит не словари,
+            а также если запись содержит ключ, не найденный в первых
+            sample_size записях
     """
     # Преобразуем пути в Path объекты
     json_file = Path(json_path)
@@ -31,54 +63,83 @@ def json_to_csv(json_path: str, csv_path: str) -> None:
     if not json_file.exists():
         raise FileNotFoundError(f"JSON файл не найден: {json_path}")
 
-    # Читаем JSON файл
-    with json_file.open("r", encoding="utf-8") as jf:
-        try:
-            data = json.load(jf)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Ошибка чтения JSON: {e}")
-
-    # Валидация данных
-    if not data:
+    def records():
+        # Читаем JSON файл по одной записи и проверяем каждую
+        for item in iter_json_records(json_file):
+            if not isinstance(item, dict):
+                raise ValueError("Все элементы JSON должны быть словарями")
+            yield item
+
+    # Валидация данных: файл должен содержать хотя бы одну запись
+    data = records()
+    first = next(data, None)
+    if first is None:
         raise ValueError("Пустой JSON файл")
 
-    if not isinstance(data, list):
-        raise ValueError("JSON должен содержать список")
+    strict = fieldnames is None
+    if fieldnames is None:
+        # Получаем все уникальные ключи (в памяти только ключи, не записи)
+        all_keys = set(first.keys())
+        for item in islice(records(), 1, sample_size):
+            all_keys.update(item.keys())
 
-    if not all(isinstance(item, dict) for item in data):
-        raise ValueError("Все элементы JSON должны быть словарями")
+        # Сортируем ключи по алфавиту для единообразия
+        fieldnames = sorted(all_keys)
 
     # Создаем родительские папки если их нет
     csv_file.parent.mkdir(parents=True, exist_ok=True)
 
-    # Получаем все уникальные ключи из всех словарей
-    all_keys = set()
-    for item in data:
-        all_keys.update(item.keys())
-
-    # Сортируем ключи по алфавиту для единообразия
-    fieldnames = sorted(all_keys)
-
-    # Записываем CSV
-    with csv_file.open("w", encoding="utf-8", newline="") as cf:
-        writer = csv.DictWriter(cf, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for item in data:
-            # Заполняем отсутствующие поля пустыми строками
-            row = {key: item.get(key, "") for key in fieldnames}
-            writer.writerow(row)
-
-
-def csv_to_json(csv_path: str, json_path: str) -> None:
+    # Записываем CSV во временный файл рядом с целевым
+    known_keys = set(fieldnames)
+    tmp_file = csv_file.with_name(csv_file.name + ".tmp")
+    try:
+        with tmp_file.open("w", encoding="utf-8", newline="") as cf:
+            writer = csv.writer(cf)
+            writer.writerow(fieldnames)
+
+            for item in chain([first], data):
+                if strict and not known_keys.issuperset(item):
+                    unknown = sorted(set(item) - known_keys)
+                    raise ValueError(
+                        f"Ключи {unknown} не найдены в первых {sample_size} "
+                        f"записях: увеличьте sample_size или задайте fieldnames"
+                    )
+                # Заполняем отсутствующие поля пустыми строками
+                writer.writerow([item.get(key, "") for key in fieldnames])
+        os.replace(tmp_file, csv_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def csv_to_json(
+    csv_path: str,
+    json_path: str,
+    ndjson: bool = False,
+    infer_types: bool = False,
+    sample_rows: Optional[int] = DEFAULT_SAMPLE_ROWS,
+    schema_path: Optional[str] = None,
+) -> None:
     """
     Конвертирует CSV файл в JSON формат.
 
     Преобразует CSV в список словарей, где первая строка - заголовки.
+    Строки читаются и записываются по одной: JSON массив выводится
+    постепенно, поэтому таблица целиком в памяти не хранится.
+
+    Если infer_types=True, типы колонок (число, bool, дата, null)
+    определяются по первым sample_rows строкам и значения записываются
+    как числа, true/false и null вместо строк. Даты остаются строками ISO.
 
     Args:
         csv_path: Путь к исходному CSV файлу
         json_path: Путь для сохранения JSON файла
+        ndjson: Если True - писать JSON Lines (по одному объекту на строку)
+            вместо JSON массива
+        infer_types: Определять типы колонок (по умолчанию все - строки)
+        sample_rows: Сколько строк просмотреть для определения типов
+        schema_path: Файл схемы для повторного использования типов
+            (включает infer_types)
 
     Raises:
         FileNotFoundError: Если CSV файл не существует
@@ -96,16 +157,35 @@ def csv_to_json(csv_path: str, json_path: str) -> None:
     with csv_file.open("r", encoding="utf-8") as cf:
         reader = csv.DictReader(cf)
 
-        # Преобразуем в список
-        data = list(reader)
-
-    # Валидация данных
-    if not data:
-        raise ValueError("CSV файл пустой или не содержит данных")
-
-    # Создаем родительские папки если их нет
-    json_file.parent.mkdir(parents=True, exist_ok=True)
-
-    # Записываем JSON
-    with json_file.open("w", encoding="utf-8") as jf:
-        json.dump(data, jf, ensure_ascii=False, indent=2)
+        # Валидация данных: нужна хотя бы одна строка данных
+        first = next(reader, None)
+        if first is None:
+            raise ValueError("CSV файл пустой или не содержит данных")
+
+        rows = chain([first], reader)
+        if infer_types or schema_path is not None:
+            # Типы определяются по выборке, затем применяются на лету
+            types = infer_csv_types(csv_file, sample_rows, schema_path)
+            converters = make_converters(types)
+            rows = (convert_row(row, converters) for row in rows)
+
+        # Создаем родительские папки если их нет
+        json_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Записываем JSON
+        with json_file.open("w", encoding="utf-8") as jf:
+            if ndjson:
+                for row in rows:
+                    jf.write(json.dumps(row, ensure_ascii=False))
+                    jf.write("\n")
+                return
+
+            # Тот же текст, что дает json.dump(data, indent=2), но по одной строке
+            separator = "[\n  "
+            for row in rows:
+                jf.write(separator)
+                jf.write(
+                    json.dumps(row, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+                )
+                separator = ",\n  "
+            jf.write("\n]")
@@ -1,7 +1,7 @@
 # src/lab06/cli_convert.py
 import argparse
 import sys
-from pathlib import Path
+import time
 
 
 def main():
@@ -20,6 +20,17 @@ def main():
     json2csv_parser.add_argument(
         "--out", dest="output", required=True, help="Выходной CSV файл"
     )
+    json2csv_parser.add_argument(
+        "--fields",
+        default=None,
+        help="Колонки CSV через запятую (без предварительного прохода по файлу)",
+    )
+    json2csv_parser.add_argument(
+        "--sample",
+        type=int,
+        default=None,
+        help="Сколько записей просмотреть для поиска колонок (по умолчанию все)",
+    )
 
     # csv2json команда
     csv2json_parser = subparsers.add_parser(
@@ -31,17 +42,81 @@ def main():
     csv2json_parser.add_argument(
         "--out", dest="output", required=True, help="Выходной JSON файл"
     )
+    csv2json_parser.add_argument(
+        "--types",
+        action="store_true",
+        help="Определять типы колонок (числа, bool, даты, пустые значения)",
+    )
+    csv2json_parser.add_argument(
+        "--schema",
+        default=None,
+        help="Файл схемы типов: создается при первом запуске и используется повторно",
+    )
+    csv2json_parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Писать JSON Lines (по одному объекту на строку) вместо массива",
+    )
 
     # csv2xlsx команда
     csv2xlsx_parser = subparsers.add_parser(
         "csv2xlsx", help="Конвертировать CSV в XLSX"
     )
     csv2xlsx_parser.add_argument(
-        "--in", dest="input", required=True, help="Входной CSV файл"
+        "--in",
+        dest="input",
+        nargs="+",
+        required=True,
+        help="Входной CSV файл (несколько файлов - по листу на каждый)",
     )
     csv2xlsx_parser.add_argument(
         "--out", dest="output", required=True, help="Выходной XLSX файл"
     )
+    csv2xlsx_parser.add_argument(
+        "--types",
+        action="store_true",
+        help="Определять типы колонок (числа, bool, даты, пустые значения)",
+    )
+    csv2xlsx_parser.add_argument(
+        "--schema",
+        default=None,
+        help="Файл схемы типов: создается при первом запуске и используется повторно",
+    )
+    csv2xlsx_parser.add_argument(
+        "--max-rows",
+        type=int,
+        default=1_048_576,
+        help="Максимум строк на листе, дальше - новый лист (по умолчанию лимит Excel)",
+    )
+    csv2xlsx_parser.add_argument(
+        "--width-sample",
+        type=int,
+        default=None,
+        help="По скольким первым строкам считать ширину колонок (по умолчанию все)",
+    )
+
+    # batch команда
+    batch_parser = subparsers.add_parser(
+        "batch", help="Конвертировать все файлы папки за один запуск"
+    )
+    batch_parser.add_argument(
+        "--in-dir", required=True, help="Папка с исходными файлами"
+    )
+    batch_parser.add_argument("--out-dir", required=True, help="Папка для результатов")
+    batch_parser.add_argument(
+        "--to",
+        required=True,
+        choices=["csv", "json", "xlsx"],
+        help="Целевой формат (csv - из JSON, json и xlsx - из CSV)",
+    )
+    batch_parser.add_argument(
+        "--jobs", type=int, default=1, help="Количество процессов (по умолчанию 1)"
+    )
+    batch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Конвертировать заново даже файлы, результат которых новее исходника",
+    )
 
     args = parser.parse_args()
 
@@ -53,20 +128,51 @@ def main():
         if args.command == "json2csv":
             from src.lab05.json_csv import json_to_csv
 
-            json_to_csv(args.input, args.output)
+            fieldnames = args.fields.split(",") if args.fields else None
+            json_to_csv(args.input, args.output, fieldnames, args.sample)
             print(f"✅ Успешно конвертирован {args.input} → {args.output}")
 
         elif args.command == "csv2json":
             from src.lab05.json_csv import csv_to_json
 
-            csv_to_json(args.input, args.output)
+            csv_to_json(
+                args.input,
+                args.output,
+                args.ndjson,
+                args.types,
+                schema_path=args.schema,
+            )
             print(f"✅ Успешно конвертирован {args.input} → {args.output}")
 
         elif args.command == "csv2xlsx":
             from src.lab05.csv_xlsx import csv_to_xlsx
 
-            csv_to_xlsx(args.input, args.output)
-            print(f"✅ Успешно конвертирован {args.input} → {args.output}")
+            start = time.perf_counter()
+            rows = csv_to_xlsx(
+                args.input,
+                args.output,
+                args.width_sample,
+                args.max_rows,
+                args.types,
+                schema_path=args.schema,
+            )
+            elapsed = max(time.perf_counter() - start, 1e-9)
+            print(f"✅ Успешно конвертирован {', '.join(args.input)} → {args.output}")
+            print(
+                f"   Строк: {rows} за {elapsed:.2f} сек ({rows / elapsed:.0f} строк/с)"
+            )
+
+        elif args.command == "batch":
+            from src.lab05.batch import convert_batch
+
+            result = convert_batch(
+                args.in_dir, args.out_dir, args.to, args.jobs, args.force
+            )
+            for source, error in result.failed:
+                print(f"❌ {source}: {error}")
+            print(f"Итого: {result.summary()}")
+            if result.failed:
+                sys.exit(1)
 
     except FileNotFoundError as e:
         print(f"❌ Ошибка: файл не найден - {e}")
@@ -1,26 +1,21 @@
 # src/lab06/cli_text.py
 import argparse
 import sys
-from pathlib import Path
 
 
 def read_and_tokenize(filepath: str):
     """
     Читает файл и разбивает на слова (токены).
+
+    Использует общее ядро src/lib/text.py, поэтому слова совпадают
+    с text_stats.py и text_report.py.
     """
+    from src.lib.text import normalize_tokenize
+
     with open(filepath, "r", encoding="utf-8") as f:
         text = f.read()
 
-    # Приводим к нижнему регистру и разбиваем на слова
-    text = text.lower()
-    # Убираем пунктуацию и разбиваем на слова
-    import string
-
-    for char in string.punctuation:
-        text = text.replace(char, " ")
-
-    tokens = text.split()
-    return tokens
+    return normalize_tokenize(text)
 
 
 def main():
@@ -36,6 +31,9 @@ def main():
     stats_parser = subparsers.add_parser("stats", help="Статистика частот слов")
     stats_parser.add_argument("--input", required=True, help="Входной текстовый файл")
     stats_parser.add_argument("--top", type=int, default=5, help="Количество топ-слов")
+    stats_parser.add_argument(
+        "--workers", type=int, default=1, help="Количество процессов для подсчета"
+    )
 
     args = parser.parse_args()
 
@@ -53,20 +51,19 @@ def main():
                         print(line, end="")
 
         elif args.command == "stats":
-            # Импортируем функции из lab03
-            from src.lab03.text_stats import count_freq, top_n
-
-            # Читаем файл и получаем токены
-            tokens = read_and_tokenize(args.input)
+            # Импортируем общее ядро анализа текста
+            from src.lib.text import TextAnalysis
+            from src.lib.text_parallel import count_file_freq_parallel
 
-            # Подсчитываем частоту
-            frequency = count_freq(tokens)
+            # Файл читается потоково; при --workers > 1 диапазоны файла
+            # считаются на нескольких процессах
+            frequency = count_file_freq_parallel(args.input, workers=args.workers)
 
-            # Получаем топ-N слов
-            top_words = top_n(frequency, args.top)
+            # Частоты и топ-N считаются за один проход
+            analysis = TextAnalysis.from_freq(frequency, args.top)
 
             print(f"Топ-{args.top} слов в файле {args.input}:")
-            for word, count in top_words:
+            for word, count in analysis.top_words:
                 print(f"  {word}: {count}")
 
     except FileNotFoundError:
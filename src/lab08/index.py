@@ -0,0 +1,161 @@
+from bisect import bisect_left, bisect_right, insort
+from math import inf
+from typing import TYPE_CHECKING, Iterable, Tuple
+
+if TYPE_CHECKING:
+    from .models import Student
+
+
+class StudentIndex:
+    """
+    Вторичные индексы по группе и среднему баллу.
+
+    Студенты хранятся под целыми ключами (номер в списке, номер строки
+    файла): при равном GPA и внутри группы они возвращаются в порядке ключей.
+
+    - хеш-индекс: группа -> {ключ: студент}, выборка группы без перебора
+      остальных студентов;
+    - отсортированный список (-gpa, ключ), поддерживаемый через bisect:
+      диапазон GPA и топ-k за O(log n + k).
+
+    Добавление и удаление стоят O(log n) на поиск места плюс сдвиг
+    элементов списка, что намного дешевле пересортировки.
+
+    Группа и GPA запоминаются при добавлении: если поля студента потом
+    изменили, индекс остается согласованным, но отвечает по прежним
+    значениям. Чтобы учесть изменения, студента нужно добавить заново.
+    """
+
+    def __init__(self, items: Iterable[Tuple[int, "Student"]] = ()):
+        """
+        Строит индексы сразу для всех студентов (одна сортировка вместо
+        n вставок).
+
+        Args:
+            items: Пары (ключ, студент)
+        """
+        self._students = {}
+        # Ключ -> (элемент списка _by_gpa, группа) на момент добавления
+        self._placed = {}
+        self._by_group = {}
+        for key, student in items:
+            self._students[key] = student
+            self._placed[key] = ((-student.gpa, key), student.group)
+            self._by_group.setdefault(student.group, {})[key] = student
+        self._by_gpa = sorted(entry for entry, _ in self._placed.values())
+
+    def __len__(self) -> int:
+        return len(self._students)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._students
+
+    def add(self, key: int, student: "Student") -> None:
+        """
+        Добавляет студента в индексы (если ключ уже есть - заменяет).
+
+        Args:
+            key: Ключ студента
+            student: Объект Student
+        """
+        if key in self._students:
+            self.remove(key)
+
+        entry = (-student.gpa, key)
+        self._students[key] = student
+        self._placed[key] = (entry, student.group)
+        self._by_group.setdefault(student.group, {})[key] = student
+        insort(self._by_gpa, entry)
+
+    def remove(self, key: int) -> None:
+        """
+        Удаляет студента из индексов.
+
+        Место в индексах берется из значений, запомненных при добавлении,
+        а не из текущих полей студента.
+
+        Args:
+            key: Ключ студента
+
+        Raises:
+            KeyError: Если ключа нет в индексе
+            ValueError: Если индексы рассогласованы (запись о месте студента
+                не найдена в отсортированном списке)
+        """
+        entry, group = self._placed[key]
+        pos = bisect_left(self._by_gpa, entry)
+        if pos == len(self._by_gpa) or self._by_gpa[pos] != entry:
+            raise ValueError(f"Индекс рассогласован: нет записи {entry}")
+
+        del self._placed[key]
+        del self._students[key]
+        members = self._by_group[group]
+        del members[key]
+        if not members:
+            del self._by_group[group]
+        del self._by_gpa[pos]
+
+    def by_group(self, group: str) -> list["Student"]:
+        """
+        Возвращает студентов группы в порядке ключей.
+
+        Args:
+            group: Номер группы
+
+        Returns:
+            Список студентов (пустой, если группы нет)
+        """
+        members = self._by_group.get(group)
+        if not members:
+            return []
+        return [members[key] for key in sorted(members)]
+
+    def group_sizes(self) -> dict[str, int]:
+        """
+        Возвращает количество студентов в каждой группе.
+
+        Returns:
+            Словарь группа -> количество
+        """
+        return {group: len(members) for group, members in self._by_group.items()}
+
+    def gpa_range(self, lo: float = 0.0, hi: float = 5.0) -> list["Student"]:
+        """
+        Возвращает студентов с lo <= GPA <= hi по убыванию GPA.
+
+        Args:
+            lo: Нижняя граница (включительно)
+            hi: Верхняя граница (включительно)
+
+        Returns:
+            Список студентов
+        """
+        start = bisect_left(self._by_gpa, (-hi,))
+        end = bisect_right(self._by_gpa, (-lo, inf))
+        return [self._students[key] for _, key in self._by_gpa[start:end]]
+
+    def top_k(self, k: int = 5) -> list["Student"]:
+        """
+        Возвращает k студентов с наибольшим GPA.
+
+        Args:
+            k: Количество студентов
+
+        Returns:
+            Список студентов по убыванию GPA
+        """
+        return [self._students[key] for _, key in self._by_gpa[: max(k, 0)]]
+
+    def min_gpa(self) -> float:
+        """Наименьший GPA (0, если индекс пуст)."""
+        return -self._by_gpa[-1][0] if self._by_gpa else 0
+
+    def max_gpa(self) -> float:
+        """Наибольший GPA (0, если индекс пуст)."""
+        return -self._by_gpa[0][0] if self._by_gpa else 0
+
+    def average_gpa(self) -> float:
+        """Средний GPA (0, если индекс пуст)."""
+        if not self._by_gpa:
+            return 0.0
+        return -sum(gpa for gpa, _ in self._by_gpa) / len(self._by_gpa)
@@ -1,12 +1,69 @@
 from dataclasses import dataclass, asdict
 from datetime import datetime, date
-from typing import Self
+from typing import Iterable, Optional, Self
+
+from .index import StudentIndex
+
+
+def parse_date(value: str) -> date:
+    """
+    Разбирает дату в формате YYYY-MM-DD.
+    
+    Строка фиксированного вида разбирается срезами (в несколько раз
+    быстрее strptime), остальные случаи передаются strptime, чтобы
+    набор допустимых значений не изменился.
+    
+    Args:
+        value: Строка с датой
+    
+    Returns:
+        Объект date
+    
+    Raises:
+        ValueError: Если строка не является корректной датой
+    """
+    if (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value.isascii()
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        return date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def full_years(birth: date, on: date) -> int:
+    """
+    Вычисляет количество полных лет между датами.
+    
+    Args:
+        birth: Дата рождения
+        on: Дата, на которую считается возраст
+    
+    Returns:
+        Количество полных лет
+    """
+    age = on.year - birth.year
+    
+    # Учитываем, был ли уже день рождения в этом году
+    if (on.month, on.day) < (birth.month, birth.day):
+        age -= 1
+    
+    return age
+
 
 @dataclass
 class Student:
     """
     Класс, представляющий студента.
     
+    Объекты без __dict__ (slots): поля хранятся в самом объекте, что
+    заметно экономит память на больших группах. Слот _birth - кэш даты
+    рождения, он не входит в поля dataclass (fields, asdict, сравнение).
+    
     Attributes:
         fio: ФИО студента
         birthdate: Дата рождения в формате YYYY-MM-DD
@@ -14,6 +71,9 @@ class Student:
         gpa: Средний балл (от 0 до 5)
     """
     
+    # _birth - разобранная дата рождения: (строка birthdate, date), кэш для age()
+    __slots__ = ("fio", "birthdate", "group", "gpa", "_birth")
+    
     fio: str
     birthdate: str
     group: str
@@ -26,8 +86,8 @@ class Student:
         """
         # Валидация даты рождения
         try:
-            datetime.strptime(self.birthdate, "%Y-%m-%d")
-        except ValueError:
+            self._birth = (self.birthdate, parse_date(self.birthdate))
+        except (ValueError, TypeError):
             raise ValueError(f"Некорректный формат даты: {self.birthdate}. Ожидается YYYY-MM-DD")
         
         # Валидация среднего балла
@@ -35,27 +95,34 @@ class Student:
             raise ValueError(f"Средний балл должен быть в диапазоне от 0 до 5, получено: {self.gpa}")
         
         # Валидация ФИО (должно содержать пробелы)
-        if len(self.fio.split()) < 2:
+        if len(self.fio.split(None, 1)) < 2:
             raise ValueError(f"ФИО должно содержать минимум два слова: {self.fio}")
     
-    def age(self) -> int:
+    @property
+    def birth_date(self) -> date:
+        """
+        Дата рождения как объект date.
+        
+        Разбирается один раз и кэшируется; если birthdate изменили,
+        разбирается заново.
+        """
+        cached = self._birth
+        if cached is None or cached[0] is not self.birthdate:
+            cached = self._birth = (self.birthdate, parse_date(self.birthdate))
+        return cached[1]
+    
+    def age(self, on: Optional[date] = None) -> int:
         """
         Вычисляет возраст студента в полных годах.
         
+        Args:
+            on: Дата, на которую считается возраст (по умолчанию - сегодня).
+                Для многих студентов передайте одну дату или используйте ages()
+        
         Returns:
             Возраст студента (количество полных лет)
         """
-        birth_date = datetime.strptime(self.birthdate, "%Y-%m-%d").date()
-        today = date.today()
-        
-        # Вычисляем возраст
-        age = today.year - birth_date.year
-        
-        # Учитываем, был ли уже день рождения в этом году
-        if (today.month, today.day) < (birth_date.month, birth_date.day):
-            age -= 1
-        
-        return age
+        return full_years(self.birth_date, on or date.today())
     
     def to_dict(self) -> dict:
         """
@@ -72,16 +139,20 @@ class Student:
         }
     
     @classmethod
-    def from_dict(cls, data: dict) -> Self:
+    def from_dict(cls, data: dict, trusted: bool = False) -> Self:
         """
         Создает объект Student из словаря.
         
         Args:
             data: Словарь с данными студента
-            
+            trusted: Данные уже проверены (записаны нами из объекта Student),
+                валидация пропускается
+        
         Returns:
             Объект класса Student
         """
+        if trusted:
+            return cls.trusted(data["fio"], data["birthdate"], data["group"], data["gpa"])
         return cls(
             fio=data.get("fio", ""),
             birthdate=data.get("birthdate", ""),
@@ -89,6 +160,37 @@ class Student:
             gpa=data.get("gpa", 0.0)
         )
     
+    @classmethod
+    def trusted(cls, fio: str, birthdate: str, group: str, gpa: float) -> Self:
+        """
+        Создает объект Student без валидации.
+        
+        Только для данных, которые уже были проверены: например, записанных
+        нами же из объектов Student. Для внешних данных используйте
+        обычный конструктор.
+        
+        Returns:
+            Объект класса Student
+        """
+        student = object.__new__(cls)
+        student.fio = fio
+        student.birthdate = birthdate
+        student.group = group
+        student.gpa = gpa
+        student._birth = None
+        return student
+    
+    def __copy__(self) -> Self:
+        """
+        Создает копию студента без повторной валидации.
+        
+        Returns:
+            Новый объект Student с теми же данными
+        """
+        student = self.trusted(self.fio, self.birthdate, self.group, self.gpa)
+        student._birth = self._birth
+        return student
+    
     def __str__(self) -> str:
         """
         Возвращает строковое представление студента.
@@ -99,27 +201,138 @@ class Student:
         return f"{self.fio}, {self.group}, GPA: {self.gpa:.2f}, возраст: {self.age()} лет"
 
 
+def _counted(method):
+    """Обертка метода list, увеличивающая счетчик изменений после вызова."""
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.version += 1
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class _VersionedList(list):
+    """
+    Список, который считает свои изменения.
+
+    Каждый изменяющий метод увеличивает version: по нему StudentList за O(1)
+    узнает, что индекс устарел, не сравнивая списки целиком.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def __reduce__(self):
+        # Копия и pickle начинают счет заново (по умолчанию элементы
+        # добавлялись бы через append раньше, чем появится version)
+        return type(self), (list(self),)
+
+    __setitem__ = _counted(list.__setitem__)
+    __delitem__ = _counted(list.__delitem__)
+    __iadd__ = _counted(list.__iadd__)
+    __imul__ = _counted(list.__imul__)
+    append = _counted(list.append)
+    extend = _counted(list.extend)
+    insert = _counted(list.insert)
+    pop = _counted(list.pop)
+    remove = _counted(list.remove)
+    clear = _counted(list.clear)
+    sort = _counted(list.sort)
+    reverse = _counted(list.reverse)
+
+
 # Дополнительный класс для работы со списком студентов
 @dataclass
 class StudentList:
-    """Класс для работы со списком студентов."""
+    """
+    Класс для работы со списком студентов.
+    
+    Выборки по группе и топ по GPA идут через индекс (StudentIndex), который
+    строится при первом запросе и дополняется в add_student. Список students
+    хранится как список со счетчиком изменений (переданный список
+    копируется): после append, students[i] = ..., sort и других изменений
+    индекс перестраивается при следующем запросе, а сама проверка стоит O(1).
+    Изменения полей самих студентов индекс не отслеживает.
+    """
     
     students: list[Student]
     
+    def __setattr__(self, name, value):
+        if name == "students" and not isinstance(value, _VersionedList):
+            value = _VersionedList(value)
+        super().__setattr__(name, value)
+    
+    def __post_init__(self):
+        # Индекс (ключи - позиции) и версия списка, по которой он построен
+        self._index: Optional[StudentIndex] = None
+        self._indexed: tuple = (None, -1)
+    
+    def _is_current(self) -> bool:
+        """Проверяет, построен ли индекс по текущему состоянию students."""
+        students, version = self._indexed
+        return students is self.students and version == self.students.version
+    
+    def _get_index(self) -> StudentIndex:
+        """Возвращает актуальный индекс (ключи - позиции в списке)."""
+        if self._index is None or not self._is_current():
+            self._index = StudentIndex(enumerate(self.students))
+            self._indexed = (self.students, self.students.version)
+        return self._index
+    
     def add_student(self, student: Student):
         """Добавляет студента в список."""
+        current = self._index is not None and self._is_current()
         self.students.append(student)
+        if current:
+            # Индекс был актуален - дополняем его, а не перестраиваем
+            self._index.add(len(self.students) - 1, student)
+            self._indexed = (self.students, self.students.version)
     
     def get_by_group(self, group: str) -> list[Student]:
         """Возвращает список студентов указанной группы."""
-        return [s for s in self.students if s.group == group]
+        return self._get_index().by_group(group)
+    
+    def get_by_gpa_range(self, lo: float, hi: float) -> list[Student]:
+        """Возвращает студентов с lo <= GPA <= hi по убыванию GPA."""
+        return self._get_index().gpa_range(lo, hi)
     
     def get_top_students(self, n: int = 5) -> list[Student]:
-        """Возвращает топ-N студентов по среднему баллу."""
-        return sorted(self.students, key=lambda s: s.gpa, reverse=True)[:n]
+        """
+        Возвращает топ-N студентов по среднему баллу.
+        
+        Отрицательное n работает как срез [:n] отсортированного списка:
+        get_top_students(-1) - все, кроме студента с наименьшим GPA.
+        """
+        index = self._get_index()
+        if n < 0:
+            return index.top_k(len(index))[:n]
+        return index.top_k(n)
     
     def average_gpa(self) -> float:
         """Вычисляет средний балл по всем студентам."""
         if not self.students:
             return 0.0
-        return sum(s.gpa for s in self.students) / len(self.students)
\ No newline at end of file
+        return sum(s.gpa for s in self.students) / len(self.students)
+
+
+def ages(students: Iterable[Student], on: Optional[date] = None) -> list[int]:
+    """
+    Вычисляет возраст всех студентов за один проход.
+    
+    Текущая дата берется один раз на весь список, даты рождения - из кэша
+    студентов.
+    
+    Args:
+        students: Объекты Student
+        on: Дата, на которую считается возраст (по умолчанию - сегодня)
+    
+    Returns:
+        Список возрастов в порядке студентов
+    """
+    on = on or date.today()
+    return [full_years(student.birth_date, on) for student in students]
\ No newline at end of file
@@ -1,7 +1,8 @@
 import json
 from pathlib import Path
-from typing import List
-from .models import Student
+from typing import Iterable, Iterator, List
+from .models import Student, ages
+from src.lib.json_stream import iter_json_records
 
 def students_to_json(students: List[Student], path: str) -> None:
     """
@@ -18,18 +19,48 @@ def students_to_json(students: List[Student], path: str) -> None:
     if not students:
         raise ValueError("Список студентов пуст")
     
-    # Преобразуем студентов в словари
-    data = [student.to_dict() for student in students]
+    write_students_json(students, path)
     
-    # Создаем директорию если её нет
+    print(f"✅ Данные сохранены в {path}")
+
+def write_students_json(students: Iterable[Student], path: str, ndjson: bool = False) -> int:
+    """
+    Записывает студентов в JSON по одному, не собирая список словарей.
+    
+    Подходит для генераторов: в памяти одновременно находится только
+    текущий студент. Текст массива совпадает с json.dump(..., indent=2).
+    
+    Args:
+        students: Объекты Student (список или генератор)
+        path: Путь для сохранения JSON файла
+        ndjson: Писать JSON Lines (один студент на строку) вместо массива
+    
+    Returns:
+        Количество записанных студентов
+    """
     file_path = Path(path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Записываем в файл
+    count = 0
     with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-    
-    print(f"✅ Данные сохранены в {path}")
+        if ndjson:
+            for student in students:
+                f.write(json.dumps(student.to_dict(), ensure_ascii=False, default=str))
+                f.write("\n")
+                count += 1
+            return count
+        
+        separator = "[\n  "
+        for student in students:
+            f.write(separator)
+            f.write(
+                json.dumps(student.to_dict(), ensure_ascii=False, indent=2, default=str)
+                .replace("\n", "\n  ")
+            )
+            separator = ",\n  "
+            count += 1
+        f.write("\n]" if count else "[]")
+    return count
 
 def students_from_json(path: str) -> List[Student]:
     """
@@ -71,6 +102,35 @@ def students_from_json(path: str) -> List[Student]:
     print(f"✅ Загружено {len(students)} студентов из {path}")
     return students
 
+def iter_students_from_json(path: str) -> Iterator[Student]:
+    """
+    Лениво читает студентов из JSON массива или JSON Lines файла.
+    
+    Файл разбирается потоком: каждый Student создаётся сразу после чтения
+    своей записи, весь документ в память не загружается.
+    
+    Args:
+        path: Путь к JSON файлу
+        
+    Yields:
+        Объекты Student по одному
+        
+    Raises:
+        FileNotFoundError: Если файл не найден
+        ValueError: Если JSON некорректен или запись не описывает студента
+    """
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Файл не найден: {path}")
+    
+    for i, item in enumerate(iter_json_records(path), 1):
+        if not isinstance(item, dict):
+            raise ValueError(f"Ошибка в записи {i}: ожидался объект JSON")
+        try:
+            student = Student.from_dict(item)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Ошибка в записи {i}: {e}") from e
+        yield student
+
 
 # Дополнительные функции для работы с файлами
 def export_students_csv(students: List[Student], path: str) -> None:
@@ -94,14 +154,14 @@ def export_students_csv(students: List[Student], path: str) -> None:
         # Заголовок
         writer.writerow(['ФИО', 'Дата рождения', 'Группа', 'Средний балл', 'Возраст'])
         
-        # Данные
-        for student in students:
+        # Данные (возраст считается на одну дату для всего списка)
+        for student, age in zip(students, ages(students)):
             writer.writerow([
                 student.fio,
                 student.birthdate,
                 student.group,
                 student.gpa,
-                student.age()
+                age
             ])
     
     print(f"✅ Данные экспортированы в CSV: {path}")
@@ -121,8 +181,8 @@ def print_students_table(students: List[Student]) -> None:
     print(f"{'№':<3} {'ФИО':<30} {'Группа':<10} {'GPA':<6} {'Возраст':<8}")
     print("="*80)
     
-    for i, student in enumerate(students, 1):
-        print(f"{i:<3} {student.fio:<30} {student.group:<10} {student.gpa:<6.2f} {student.age():<8}")
+    for i, (student, age) in enumerate(zip(students, ages(students)), 1):
+        print(f"{i:<3} {student.fio:<30} {student.group:<10} {student.gpa:<6.2f} {age:<8}")
     
     print("="*80)
     print(f"Всего студентов: {len(students)}")
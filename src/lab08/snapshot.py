@@ -0,0 +1,346 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .models import Student
+
+# Двоичный снимок списка студентов (все числа little-endian):
+#
+#   заголовок     HEADER (см. ниже)
+#   gpa           float64 x count
+#   birth_ids     uint32 x count  - номер даты рождения в словаре
+#   group_ids     uint32 x count  - номер группы в словаре
+#   fio_offsets   uint32 x (count + 1) - смещения ФИО в fio_blob
+#   fio_blob      ФИО в UTF-8, каждое завершается нулевым байтом
+#   dict_offsets  uint32 x (dict_count + 1)
+#   dict_blob     даты рождения и группы (без повторов) в том же виде
+#
+# Числовые столбцы читаются целиком через array.frombytes, строки -
+# одним decode и split. Смещения позволяют читать отдельную запись
+# через mmap, не загружая файл (SnapshotReader).
+SNAPSHOT_MAGIC = b"STSN"
+SNAPSHOT_VERSION = 1
+
+# magic, версия, резерв, count, dict_count, размер fio_blob, размер dict_blob
+HEADER = struct.Struct("<4sHHQQQQ")
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _layout(count: int, dict_count: int, fio_size: int) -> dict:
+    """Вычисляет смещения разделов файла по размерам из заголовка."""
+    offsets = {}
+    pos = HEADER.size
+    for name, size in (
+        ("gpa", 8 * count),
+        ("birth_ids", 4 * count),
+        ("group_ids", 4 * count),
+        ("fio_offsets", 4 * (count + 1)),
+        ("fio_blob", fio_size),
+        ("dict_offsets", 4 * (dict_count + 1)),
+        ("dict_blob", None),
+    ):
+        offsets[name] = pos
+        if size is not None:
+            pos += size
+    return offsets
+
+
+def _string_table(strings: list[str]) -> tuple[array, bytes]:
+    """
+    Кодирует строки в смещения и общий буфер.
+
+    Raises:
+        ValueError: Если строка содержит нулевой символ или буфер больше 4 ГБ
+    """
+    offsets = array("I", [0])
+    parts = []
+    size = 0
+    for value in strings:
+        if "\0" in value:
+            raise ValueError(f"Строка не может содержать нулевой символ: {value!r}")
+        data = value.encode("utf-8") + b"\0"
+        parts.append(data)
+        size += len(data)
+        if size >= 2**32:
+            raise ValueError("Слишком большой снимок: строки занимают больше 4 ГБ")
+        offsets.append(size)
+    return offsets, b"".join(parts)
+
+
+def _to_le(column: array) -> bytes:
+    """Байты столбца в little-endian."""
+    if not _LITTLE_ENDIAN:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_le(typecode: str, data) -> array:
+    """Столбец из байтов little-endian."""
+    column = array(typecode)
+    column.frombytes(data)
+    if not _LITTLE_ENDIAN:
+        column.byteswap()
+    return column
+
+
+def _read_header(data) -> tuple[int, int, int, int]:
+    """
+    Проверяет заголовок снимка.
+
+    Returns:
+        (count, dict_count, размер fio_blob, размер dict_blob)
+
+    Raises:
+        ValueError: Если файл не является снимком или версия не поддерживается
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Файл слишком короткий для снимка студентов")
+    magic, version, _, count, dict_count, fio_size, dict_size = HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Файл не является снимком студентов")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+
+    expected = _layout(count, dict_count, fio_size)["dict_blob"] + dict_size
+    if len(data) != expected:
+        raise ValueError(
+            f"Снимок поврежден: ожидалось {expected} байт, получено {len(data)}"
+        )
+    return count, dict_count, fio_size, dict_size
+
+
+def _check_ids(ids: array, dict_count: int) -> None:
+    """
+    Проверяет, что номера в столбце не выходят за словарь.
+
+    Raises:
+        ValueError: Если номер больше размера словаря
+    """
+    if ids and max(ids) >= dict_count:
+        raise ValueError(
+            f"Снимок поврежден: номер {max(ids)} вне словаря из {dict_count} строк"
+        )
+
+
+def _fsync_dir(path: Path) -> None:
+    """Сбрасывает на диск папку с файлом, чтобы сохранилось и переименование."""
+    if os.name != "posix":
+        return
+    fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def save_snapshot(students: Iterable[Student], path: str) -> int:
+    """
+    Сохраняет студентов в двоичный снимок.
+
+    Даты рождения и группы хранятся в словаре без повторов, в записях -
+    только их номера. Снимок пишется во временный файл, сбрасывается на
+    диск (fsync) и заменяет старый через os.replace: при сбое на диске
+    остается либо старый, либо новый снимок целиком.
+
+    Args:
+        students: Объекты Student
+        path: Путь к файлу снимка
+
+    Returns:
+        Количество сохраненных студентов
+
+    Raises:
+        ValueError: Если строковые поля нельзя сохранить в снимок
+    """
+    gpa = array("d")
+    birth_ids = array("I")
+    group_ids = array("I")
+    fios = []
+    dictionary = {}
+
+    for student in students:
+        gpa.append(student.gpa)
+        birth_ids.append(dictionary.setdefault(student.birthdate, len(dictionary)))
+        group_ids.append(dictionary.setdefault(student.group, len(dictionary)))
+        fios.append(student.fio)
+
+    fio_offsets, fio_blob = _string_table(fios)
+    dict_offsets, dict_blob = _string_table(list(dictionary))
+
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(
+                HEADER.pack(
+                    SNAPSHOT_MAGIC,
+                    SNAPSHOT_VERSION,
+                    0,
+                    len(gpa),
+                    len(dictionary),
+                    len(fio_blob),
+                    len(dict_blob),
+                )
+            )
+            for column in (gpa, birth_ids, group_ids, fio_offsets):
+                f.write(_to_le(column))
+            f.write(fio_blob)
+            f.write(_to_le(dict_offsets))
+            f.write(dict_blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _fsync_dir(file_path)
+
+    return len(gpa)
+
+
+def load_snapshot(path: str) -> list[Student]:
+    """
+    Загружает всех студентов из двоичного снимка.
+
+    Данные записаны из проверенных объектов Student, поэтому объекты
+    создаются без повторной валидации.
+
+    Args:
+        path: Путь к файлу снимка
+
+    Returns:
+        Список объектов Student
+
+    Raises:
+        FileNotFoundError: Если файл не найден
+        ValueError: Если файл не является снимком или поврежден
+    """
+    data = memoryview(Path(path).read_bytes())
+    count, dict_count, fio_size, dict_size = _read_header(data)
+    layout = _layout(count, dict_count, fio_size)
+
+    gpa = _from_le("d", data[layout["gpa"] : layout["birth_ids"]])
+    birth_ids = _from_le("I", data[layout["birth_ids"] : layout["group_ids"]])
+    group_ids = _from_le("I", data[layout["group_ids"] : layout["fio_offsets"]])
+
+    # Строки разбираются целиком: один decode и split по нулевым байтам
+    fios = str(data[layout["fio_blob"] : layout["dict_offsets"]], "utf-8").split("\0")
+    values = str(data[layout["dict_blob"] :], "utf-8").split("\0")
+    if len(fios) != count + 1 or len(values) != dict_count + 1:
+        raise ValueError("Снимок поврежден: число строк не совпадает с заголовком")
+    _check_ids(birth_ids, dict_count)
+    _check_ids(group_ids, dict_count)
+
+    trusted = Student.trusted
+    return [
+        trusted(fio, values[birth], values[group], value)
+        for fio, birth, group, value in zip(fios, birth_ids, group_ids, gpa)
+    ]
+
+
+class SnapshotReader:
+    """
+    Чтение отдельных студентов из снимка через mmap без загрузки файла.
+
+    Записи фиксированного размера и таблица смещений строк позволяют
+    найти i-го студента за O(1): с диска читаются только нужные страницы.
+
+    Example:
+        >>> with SnapshotReader("students.snap") as reader:
+        ...     print(len(reader), reader[1000].fio)
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает снимок.
+
+        Args:
+            path: Путь к файлу снимка
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если файл не является снимком или поврежден
+        """
+        self._file = open(path, "rb")
+        self._mm = None
+        try:
+            # Пустой файл нельзя отобразить в память - проверяем размер заранее
+            if os.fstat(self._file.fileno()).st_size < HEADER.size:
+                raise ValueError("Файл слишком короткий для снимка студентов")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._count, self._dict_count, fio_size, dict_size = _read_header(self._mm)
+        except ValueError:
+            self.close()
+            raise
+        self._layout = _layout(self._count, self._dict_count, fio_size)
+        self._blob_sizes = {"fio_blob": fio_size, "dict_blob": dict_size}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, table: str, blob: str, index: int) -> str:
+        """
+        Читает строку index из таблицы строк.
+
+        Raises:
+            ValueError: Если смещения строки выходят за буфер строк
+        """
+        start, end = struct.unpack_from(
+            "<II", self._mm, self._layout[table] + 4 * index
+        )
+        if not start < end <= self._blob_sizes[blob]:
+            raise ValueError(f"Снимок поврежден: неверные смещения строки {index}")
+        base = self._layout[blob]
+        return str(self._mm[base + start : base + end - 1], "utf-8")
+
+    def __getitem__(self, index: int) -> Student:
+        """
+        Возвращает студента по номеру (поддерживаются отрицательные номера).
+
+        Raises:
+            IndexError: Если номер вне диапазона
+            ValueError: Если запись снимка повреждена
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Номер студента вне диапазона")
+
+        layout = self._layout
+        (gpa,) = struct.unpack_from("<d", self._mm, layout["gpa"] + 8 * index)
+        (birth,) = struct.unpack_from("<I", self._mm, layout["birth_ids"] + 4 * index)
+        (group,) = struct.unpack_from("<I", self._mm, layout["group_ids"] + 4 * index)
+        if max(birth, group) >= self._dict_count:
+            raise ValueError(
+                f"Снимок поврежден: номер {max(birth, group)} вне словаря "
+                f"из {self._dict_count} строк"
+            )
+        return Student.trusted(
+            self._string("fio_offsets", "fio_blob", index),
+            self._string("dict_offsets", "dict_blob", birth),
+            self._string("dict_offsets", "dict_blob", group),
+            gpa,
+        )
+
+    def __iter__(self) -> Iterator[Student]:
+        for index in range(self._count):
+            yield self[index]
+
+    def close(self) -> None:
+        """Закрывает файл снимка."""
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,391 @@
+import csv
+import heapq
+from array import array
+from datetime import date
+from collections import Counter
+from itertools import compress, islice
+from pathlib import Path
+from typing import Iterable, Optional, Self
+
+from .models import Student, StudentList, parse_date
+
+# NumPy необязателен: если он установлен, агрегаты и фильтры считаются
+# по массивам без копирования, иначе - встроенными функциями по array
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class StudentTable:
+    """
+    Колоночное хранилище студентов для аналитики.
+
+    Каждое поле хранится отдельным столбцом, а не в объектах Student:
+
+    - gpa: array('d') - числа подряд, без объектов float;
+    - группа: коды в array('I') плюс словарь названий (категории);
+    - дата рождения: порядковые номера дней (date.toordinal) в array('l');
+    - ФИО: список строк.
+
+    Агрегаты (средний балл, статистика по группам) проходят по столбцу
+    целиком встроенными функциями или NumPy, фильтры возвращают новую
+    таблицу из выбранных строк.
+    """
+
+    def __init__(self, groups: Optional[list[str]] = None):
+        """
+        Создает пустую таблицу.
+
+        Args:
+            groups: Названия групп (категории), общие с другой таблицей
+        """
+        self.fio: list[str] = []
+        self.gpa = array("d")
+        self.group_codes = array("I")
+        self.birth = array("l")
+        self.groups: list[str] = list(groups or [])
+        self._group_code = {name: code for code, name in enumerate(self.groups)}
+
+    def __len__(self) -> int:
+        return len(self.gpa)
+
+    def _code(self, group: str) -> int:
+        """Возвращает код группы, добавляя новую категорию при необходимости."""
+        code = self._group_code.get(group)
+        if code is None:
+            code = self._group_code[group] = len(self.groups)
+            self.groups.append(group)
+        return code
+
+    def append(self, fio: str, birthdate: str, group: str, gpa: float) -> None:
+        """
+        Добавляет строку с проверкой данных (как в Student).
+
+        Raises:
+            ValueError: Если данные некорректны
+        """
+        gpa = float(gpa)
+        if not (0 <= gpa <= 5):
+            raise ValueError(
+                f"Средний балл должен быть в диапазоне от 0 до 5, получено: {gpa}"
+            )
+        if len(fio.split(None, 1)) < 2:
+            raise ValueError(f"ФИО должно содержать минимум два слова: {fio}")
+
+        self.birth.append(parse_date(birthdate).toordinal())
+        self.fio.append(fio)
+        self.group_codes.append(self._code(group))
+        self.gpa.append(gpa)
+
+    def _append_rows(self, rows: Iterable[dict], source: str) -> None:
+        """
+        Добавляет строки-словари, некорректные пропускаются с предупреждением.
+
+        Args:
+            rows: Словари с ключами fio, birthdate, group, gpa
+            source: Имя источника для сообщений
+        """
+        for i, row in enumerate(rows, 1):
+            try:
+                self.append(row["fio"], row["birthdate"], row["group"], row["gpa"])
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"⚠️ Пропущена строка {i} в {source}: {e}")
+
+    @classmethod
+    def from_csv(cls, path: str) -> Self:
+        """
+        Загружает таблицу из CSV-файла группы (fio, birthdate, group, gpa).
+
+        Файл читается построчно, объекты Student не создаются.
+
+        Args:
+            path: Путь к CSV-файлу
+
+        Returns:
+            Объект StudentTable
+        """
+        table = cls()
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            table._append_rows(csv.DictReader(f), path)
+        return table
+
+    @classmethod
+    def from_json(cls, path: str) -> Self:
+        """
+        Загружает таблицу из JSON (массив объектов или JSON Lines).
+
+        Записи читаются потоком по одной, весь документ в память не грузится.
+
+        Args:
+            path: Путь к JSON файлу
+
+        Returns:
+            Объект StudentTable
+
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если JSON некорректен
+        """
+        from src.lib.json_stream import iter_json_records
+
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Файл не найден: {path}")
+
+        table = cls()
+        table._append_rows(iter_json_records(path), path)
+        return table
+
+    @classmethod
+    def from_students(cls, students: Iterable[Student]) -> Self:
+        """
+        Создает таблицу из объектов Student (они уже проверены).
+
+        Args:
+            students: Объекты Student
+
+        Returns:
+            Объект StudentTable
+        """
+        table = cls()
+        for student in students:
+            table.fio.append(student.fio)
+            table.birth.append(student.birth_date.toordinal())
+            table.group_codes.append(table._code(student.group))
+            table.gpa.append(student.gpa)
+        return table
+
+    @classmethod
+    def from_student_list(cls, student_list: StudentList) -> Self:
+        """Создает таблицу из StudentList."""
+        return cls.from_students(student_list.students)
+
+    def to_students(self) -> list[Student]:
+        """
+        Преобразует строки таблицы в объекты Student.
+
+        Данные проверены при загрузке, поэтому объекты создаются без
+        повторной валидации.
+
+        Returns:
+            Список объектов Student
+        """
+        groups = self.groups
+        fromordinal = date.fromordinal
+        return [
+            Student.trusted(fio, fromordinal(birth).isoformat(), groups[code], gpa)
+            for fio, birth, code, gpa in zip(
+                self.fio, self.birth, self.group_codes, self.gpa
+            )
+        ]
+
+    def to_student_list(self) -> StudentList:
+        """Преобразует таблицу в StudentList."""
+        return StudentList(self.to_students())
+
+    def take(self, positions: Iterable[int]) -> Self:
+        """
+        Возвращает новую таблицу из строк с указанными номерами.
+
+        С NumPy числовые столбцы выбираются через np.take по буферам
+        array без копирования исходных данных; в Python остается только
+        выборка ФИО из списка.
+
+        Args:
+            positions: Номера строк (итерируемый объект или массив NumPy)
+
+        Returns:
+            Объект StudentTable (категории групп общие с исходной таблицей)
+        """
+        table = type(self)(self.groups)
+        if np is not None:
+            if not isinstance(positions, np.ndarray):
+                positions = np.fromiter(positions, dtype=np.intp)
+            for name in ("gpa", "group_codes", "birth"):
+                column = getattr(self, name)
+                values = np.frombuffer(column, dtype=column.typecode)
+                getattr(table, name).frombytes(np.take(values, positions).tobytes())
+            table.fio = list(map(self.fio.__getitem__, positions.tolist()))
+            return table
+
+        positions = list(positions)
+        table.fio = [self.fio[i] for i in positions]
+        table.gpa = array("d", [self.gpa[i] for i in positions])
+        table.group_codes = array("I", [self.group_codes[i] for i in positions])
+        table.birth = array("l", [self.birth[i] for i in positions])
+        return table
+
+    def where_group(self, group: str) -> Self:
+        """
+        Возвращает студентов указанной группы.
+
+        Args:
+            group: Номер группы
+
+        Returns:
+            Новая таблица (пустая, если группы нет)
+        """
+        code = self._group_code.get(group)
+        if code is None:
+            return self.take([])
+        if np is not None:
+            codes = np.frombuffer(self.group_codes, dtype=self.group_codes.typecode)
+            return self.take(np.flatnonzero(codes == code))
+        return self.take(compress(range(len(self)), map(code.__eq__, self.group_codes)))
+
+    def where_gpa(self, lo: float = 0.0, hi: float = 5.0) -> Self:
+        """
+        Возвращает студентов с lo <= GPA <= hi.
+
+        Args:
+            lo: Нижняя граница (включительно)
+            hi: Верхняя граница (включительно)
+
+        Returns:
+            Новая таблица
+        """
+        if np is not None:
+            values = np.frombuffer(self.gpa, dtype=np.float64)
+            return self.take(np.flatnonzero((values >= lo) & (values <= hi)))
+        return self.take(i for i, value in enumerate(self.gpa) if lo <= value <= hi)
+
+    def where_born(self, start: date, end: date) -> Self:
+        """
+        Возвращает студентов, родившихся с start по end включительно.
+
+        Args:
+            start: Начальная дата
+            end: Конечная дата
+
+        Returns:
+            Новая таблица
+        """
+        lo, hi = start.toordinal(), end.toordinal()
+        if np is not None:
+            values = np.frombuffer(self.birth, dtype=self.birth.typecode)
+            return self.take(np.flatnonzero((values >= lo) & (values <= hi)))
+        return self.take(i for i, value in enumerate(self.birth) if lo <= value <= hi)
+
+    def average_gpa(self) -> float:
+        """Вычисляет средний балл по всем студентам."""
+        if not len(self):
+            return 0.0
+        if np is not None:
+            return float(np.frombuffer(self.gpa, dtype=np.float64).mean())
+        return sum(self.gpa) / len(self)
+
+    def group_counts(self) -> dict[str, int]:
+        """
+        Возвращает количество студентов в каждой группе.
+
+        Returns:
+            Словарь группа -> количество (только непустые группы)
+        """
+        if np is not None:
+            counts = np.bincount(
+                np.frombuffer(self.group_codes, dtype=np.uint32),
+                minlength=len(self.groups),
+            ).tolist()
+        else:
+            counter = Counter(self.group_codes)
+            counts = [counter[code] for code in range(len(self.groups))]
+        return {name: n for name, n in zip(self.groups, counts) if n}
+
+    def group_average_gpa(self) -> dict[str, float]:
+        """
+        Возвращает средний балл по каждой группе.
+
+        Без NumPy каждая группа суммируется отдельным проходом встроенными
+        функциями (быстро, пока групп немного).
+
+        Returns:
+            Словарь группа -> средний балл (только непустые группы)
+        """
+        if np is not None:
+            codes = np.frombuffer(self.group_codes, dtype=np.uint32)
+            values = np.frombuffer(self.gpa, dtype=np.float64)
+            sums = np.bincount(
+                codes, weights=values, minlength=len(self.groups)
+            ).tolist()
+            counts = np.bincount(codes, minlength=len(self.groups)).tolist()
+        else:
+            counter = Counter(self.group_codes)
+            counts = [counter[code] for code in range(len(self.groups))]
+            sums = [
+                (
+                    sum(compress(self.gpa, map(code.__eq__, self.group_codes)))
+                    if n
+                    else 0.0
+                )
+                for code, n in enumerate(counts)
+            ]
+        return {name: s / n for name, s, n in zip(self.groups, sums, counts) if n}
+
+    def top_k(self, k: int = 5) -> list[int]:
+        """
+        Возвращает номера строк k студентов с наибольшим GPA.
+
+        При равном GPA раньше идет строка с меньшим номером.
+
+        Args:
+            k: Количество студентов
+
+        Returns:
+            Номера строк по убыванию GPA
+        """
+        if k <= 0 or not len(self):
+            return []
+        k = min(k, len(self))
+
+        # Порог - k-й по величине GPA. Строки выше порога берутся все, а из
+        # равных порогу - первые по порядку, поэтому ключом сравниваются
+        # только эти строки, а не все студенты
+        if np is not None:
+            values = np.frombuffer(self.gpa, dtype=np.float64)
+            threshold = float(np.partition(values, len(values) - k)[len(values) - k])
+            above = np.flatnonzero(values > threshold).tolist()
+            equal = np.flatnonzero(values == threshold)[: k - len(above)].tolist()
+        else:
+            threshold = heapq.nlargest(k, self.gpa)[-1]
+            positions = range(len(self))
+            above = list(compress(positions, map(threshold.__lt__, self.gpa)))
+            equal = islice(
+                compress(positions, map(threshold.__eq__, self.gpa)), k - len(above)
+            )
+        top = sorted(above, key=self.gpa.__getitem__, reverse=True)
+        top.extend(equal)
+        return top
+
+    def stats(self) -> dict:
+        """
+        Возвращает статистику в том же виде, что и Group.stats.
+
+        Returns:
+            Словарь со статистикой
+        """
+        if not len(self):
+            return {
+                "count": 0,
+                "min_gpa": 0,
+                "max_gpa": 0,
+                "avg_gpa": 0,
+                "groups": {},
+                "top_5_students": [],
+            }
+
+        if np is not None:
+            values = np.frombuffer(self.gpa, dtype=np.float64)
+            min_gpa, max_gpa = float(values.min()), float(values.max())
+        else:
+            min_gpa, max_gpa = min(self.gpa), max(self.gpa)
+
+        return {
+            "count": len(self),
+            "min_gpa": min_gpa,
+            "max_gpa": max_gpa,
+            "avg_gpa": self.average_gpa(),
+            "groups": self.group_counts(),
+            "top_5_students": [
+                {"fio": self.fio[i], "gpa": self.gpa[i]} for i in self.top_k(5)
+            ],
+        }
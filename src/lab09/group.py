@@ -1,58 +1,110 @@
+import copy
 import csv
+import hashlib
+import io
+import json
+import os
+from bisect import insort
+from itertools import islice
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from dataclasses import asdict
 
-# Импортируем Student из ЛР8
 try:
-    from src.lab08.models import Student
+    import fcntl
 except ImportError:
-    # Для тестирования
-    from dataclasses import dataclass
-    from datetime import datetime, date
-    
-    @dataclass
-    class Student:
-        fio: str
-        birthdate: str
-        group: str
-        gpa: float
-        
-        def age(self) -> int:
-            birth_date = datetime.strptime(self.birthdate, "%Y-%m-%d").date()
-            today = date.today()
-            age = today.year - birth_date.year
-            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                age -= 1
-            return age
-        
-        def to_dict(self) -> dict:
-            return {
-                "fio": self.fio,
-                "birthdate": self.birthdate,
-                "group": self.group,
-                "gpa": self.gpa
-            }
-        
-        @classmethod
-        def from_dict(cls, data: dict):
-            return cls(**data)
+    # Windows: блокировки файлов недоступны, работаем без них
+    fcntl = None
+
+# Student и вторичные индексы по группе и GPA из ЛР8
+from src.lab08.models import Student, ages
+from src.lab08.index import StudentIndex
+
+
+# Колонки CSV-файла группы
+FIELDNAMES = ["fio", "birthdate", "group", "gpa"]
+
+# Размер журнала изменений (в байтах), после которого он переносится в CSV
+DEFAULT_COMPACT_BYTES = 1024 * 1024
+
+# Сколько студентов add_many дописывает за одну запись
+ADD_BATCH_SIZE = 10_000
 
 
 class Group:
     """
     Класс для работы с группой студентов, хранящейся в CSV-файле.
     Реализует CRUD-операции (Create, Read, Update, Delete).
+    
+    В режиме кэширования (по умолчанию) файл разбирается один раз, студенты
+    хранятся в памяти вместе с индексом по ФИО. Файл перечитывается, только
+    если он изменился на диске (время изменения, размер или inode).
+    
+    В режиме журнала (journal=True) удаление и обновление не переписывают
+    CSV: изменения дописываются строками JSON в журнал рядом с файлом
+    (students.csv.journal) и при чтении применяются поверх CSV. compact()
+    переносит журнал в новый CSV; вызывается вручную или автоматически,
+    когда журнал превышает compact_bytes. Журнал привязан к хешу содержимого
+    CSV, поэтому переживает touch, копирование и восстановление из копии.
+    
+    Несколько процессов могут работать с одним файлом: чтение выполняется
+    под разделяемой блокировкой, изменения - под исключительной (fcntl.flock
+    на файле students.csv.lock), поэтому изменения не теряются.
+    
+    Выборки by_group, gpa_range, top_k и stats используют вторичные индексы
+    (StudentIndex), которые обновляются вместе с кэшем и не перебирают всех
+    студентов.
+    
+    Методы чтения возвращают копии студентов из кэша: их можно изменять,
+    кэш и индексы от этого не портятся. Изменения сохраняются через update.
     """
     
-    def __init__(self, storage_path: str):
+    def __init__(
+        self,
+        storage_path: str,
+        cached: bool = True,
+        journal: bool = False,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+    ):
         """
         Инициализация группы студентов.
         
         Args:
             storage_path: Путь к CSV-файлу для хранения данных
+            cached: Хранить студентов в памяти между вызовами
+                (False - перечитывать файл при каждой операции)
+            journal: Записывать изменения в журнал, а не переписывать CSV
+            compact_bytes: Размер журнала в байтах, после которого
+                выполняется compact()
         """
         self.path = Path(storage_path)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.cached = cached
+        self.journal = journal
+        self.compact_bytes = compact_bytes
+        
+        # Состояние файла при последней загрузке: (mtime_ns, размер, inode)
+        self._signature = None
+        # Хеш содержимого CSV и признаки файла, для которых он посчитан
+        self._content = None
+        # Применённая часть журнала: (inode, байт прочитано) или None
+        self._journal_state = None
+        # Строки CSV как есть (для записи) и студенты из них (None для
+        # некорректных строк) по внутреннему номеру строки; словари
+        # сохраняют порядок файла
+        self._rows = {}
+        self._students = {}
+        # Индекс: ФИО -> номера строк с таким ФИО
+        self._by_fio = {}
+        # Индексы по группе и GPA (только корректные строки)
+        self._index = StudentIndex()
+        self._next_id = 0
+        # Открытый файл блокировки и глубина вложенных _lock()
+        self._lock_file = None
+        self._lock_depth = 0
+        
         self._ensure_storage_exists()
     
     def _ensure_storage_exists(self) -> None:
@@ -61,33 +113,387 @@ class Group:
         """
         if not self.path.exists():
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=["fio", "birthdate", "group", "gpa"])
-                writer.writeheader()
+            with self._lock(exclusive=True):
+                # Другой процесс мог создать файл, пока мы ждали блокировку
+                if self.path.exists():
+                    return
+                self._write_all([])
             print(f"📁 Создан новый файл базы данных: {self.path}")
     
+    @contextmanager
+    def _lock(self, exclusive: bool = False):
+        """
+        Блокирует файл группы для других процессов на время операции.
+        
+        Блокируется отдельный файл students.csv.lock: сам CSV заменяется
+        при записи, и блокировка на нём терялась бы. Вложенные вызовы
+        используют уже взятую блокировку.
+        
+        Args:
+            exclusive: Исключительная блокировка (для изменений),
+                иначе разделяемая (для чтения)
+        """
+        if self._lock_depth == 0 and fcntl is not None:
+            self._lock_file = open(self.lock_path, 'ab')
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        self._lock_depth += 1
+        try:
+            yield
+        finally:
+            self._lock_depth -= 1
+            if self._lock_depth == 0 and self._lock_file is not None:
+                # Закрытие файла снимает блокировку
+                self._lock_file.close()
+                self._lock_file = None
+    
     def _read_all(self) -> List[dict]:
         """
-        Читает все записи из CSV-файла.
+        Читает все записи из CSV-файла и запоминает хеш его содержимого.
         
         Returns:
             Список словарей с данными студентов
         """
-        with open(self.path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        signature = self._file_signature()
+        data = self.path.read_bytes()
+        self._content = (signature, self._hash(data))
+        reader = csv.DictReader(io.StringIO(data.decode('utf-8'), newline=None))
+        return list(reader)
     
     def _write_all(self, rows: List[dict]) -> None:
         """
         Записывает все записи в CSV-файл.
         
+        Файл пишется рядом под временным именем, сбрасывается на диск
+        (fsync) и заменяет старый через os.replace: при сбое на любом шаге
+        на диске остаётся либо старая, либо новая версия целиком.
+        Журнал после этого уже учтён в CSV и удаляется.
+        
         Args:
             rows: Список словарей с данными студентов
         """
-        with open(self.path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["fio", "birthdate", "group", "gpa"])
-            writer.writeheader()
-            writer.writerows(rows)
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+        data = buffer.getvalue().encode('utf-8')
+        
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._fsync_dir()
+        self._signature = self._file_signature()
+        self._content = (self._signature, self._hash(data))
+        
+        self.journal_path.unlink(missing_ok=True)
+        self._journal_state = None
+    
+    def _fsync_dir(self) -> None:
+        """
+        Сбрасывает на диск папку с файлом, чтобы сохранилось и переименование.
+        """
+        if os.name != 'posix':
+            return
+        fd = os.open(self.path.parent, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _file_signature(self) -> tuple:
+        """
+        Возвращает признаки изменения файла.
+        
+        Returns:
+            Кортеж (mtime_ns, размер, inode)
+        """
+        stat = self.path.stat()
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    @staticmethod
+    def _hash(data: bytes):
+        """Создаёт хеш содержимого CSV (его можно дополнять через update)."""
+        return hashlib.blake2b(data, digest_size=16)
+    
+    def _generation(self, signature: tuple) -> str:
+        """
+        Возвращает версию CSV - хеш его содержимого.
+        
+        Хеш пересчитывается, только если признаки файла изменились с
+        прошлого подсчёта.
+        
+        Args:
+            signature: Текущие признаки файла (_file_signature)
+        """
+        if self._content is None or self._content[0] != signature:
+            self._content = (signature, self._hash(self.path.read_bytes()))
+        return self._content[1].hexdigest()
+    
+    @staticmethod
+    def _parse_row(row: dict) -> Student:
+        """
+        Создаёт Student из строки CSV (сама строка не изменяется).
+        
+        Raises:
+            ValueError, KeyError: Если данные в строке некорректны
+        """
+        # Преобразуем GPA из строки в float
+        return Student.from_dict(dict(row, gpa=float(row['gpa'])))
+    
+    def _try_parse(self, row: dict) -> Optional[Student]:
+        """
+        Создаёт Student из строки CSV или сообщает об ошибке.
+        
+        Returns:
+            Объект Student или None, если данные некорректны
+        """
+        try:
+            return self._parse_row(row)
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ Ошибка при чтении студента {row.get('fio', 'unknown')}: {e}")
+            return None
+    
+    def _load(self) -> None:
+        """
+        Загружает студентов из файла, если кэша нет или файл изменился,
+        и применяет новые записи журнала.
+        """
+        signature = self._file_signature()
+        if not (self.cached and signature == self._signature):
+            self._rows = {}
+            self._students = {}
+            self._by_fio = {}
+            self._next_id = 0
+            # Индексы строятся одной сортировкой после чтения, а не вставками
+            self._index = None
+            for row in self._read_all():
+                self._insert(row)
+            self._index = StudentIndex(
+                (row_id, student) for row_id, student in self._students.items() if student is not None
+            )
+            self._signature = signature
+            self._journal_state = None
+        
+        self._replay_journal()
+    
+    def _replay_journal(self) -> None:
+        """
+        Применяет к кэшу записи журнала, появившиеся после прошлой загрузки.
+        
+        Первая строка журнала - версия (хеш содержимого) CSV, к которому он
+        относится. Если CSV с тех пор заменён (журнал уже перенесён в него),
+        журнал игнорируется. Недописанная последняя строка пропускается.
+        """
+        try:
+            f = open(self.journal_path, 'rb')
+        except FileNotFoundError:
+            if self._journal_state is not None:
+                # Журнал удалили, а CSV не менялся - загружаем всё заново
+                self._signature = None
+                self._load()
+            return
+        
+        with f:
+            inode = os.fstat(f.fileno()).st_ino
+            if self._journal_state is None:
+                first = f.readline()
+                base = self._journal_base(first)
+                if not first.endswith(b'\n') or base != self._generation(self._signature):
+                    return
+                offset = len(first)
+            else:
+                known_inode, offset = self._journal_state
+                if inode != known_inode:
+                    # Журнал заменён - загружаем всё заново
+                    f.close()
+                    self._signature = None
+                    self._load()
+                    return
+                f.seek(offset)
+            data = f.read()
+        
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                print(f"⚠️ Пропущена повреждённая запись журнала: {e}")
+                continue
+            self._apply(record)
+        self._journal_state = (inode, offset + end)
+    
+    @staticmethod
+    def _journal_base(line: bytes) -> Optional[str]:
+        """
+        Разбирает первую строку журнала.
+        
+        Returns:
+            Версия CSV (хеш содержимого), к которой относится журнал,
+            или None, если строка повреждена
+        """
+        try:
+            base = json.loads(line)['base']
+        except (ValueError, KeyError, TypeError):
+            return None
+        return base if isinstance(base, str) else None
+    
+    def _apply(self, record: dict, student: Optional[Student] = None) -> None:
+        """
+        Применяет к кэшу одну запись журнала.
+        
+        Args:
+            record: {"op": "add", "row": ...} - добавить строку,
+                {"op": "upsert", "fio": ..., "row": ...} - заменить первую
+                строку с этим ФИО (или добавить, если такой нет),
+                {"op": "delete", "fio": ...} - удалить все строки с этим ФИО
+            student: Уже созданный Student для добавляемой строки (если есть)
+        """
+        op = record.get('op')
+        if op == 'add':
+            if student is None:
+                # Строки "add" записаны нами из уже проверенных объектов Student
+                student = Student.from_dict(record['row'], trusted=True)
+            self._insert(record['row'], student)
+        elif op == 'upsert':
+            row_ids = self._by_fio.get(record['fio'])
+            if row_ids:
+                self._replace(row_ids[0], record['row'])
+            else:
+                self._insert(record['row'])
+        elif op == 'delete':
+            for row_id in list(self._by_fio.get(record['fio'], ())):
+                self._delete(row_id)
+        else:
+            print(f"⚠️ Неизвестная операция в журнале: {op}")
+    
+    def _commit(self, records: List[dict]) -> None:
+        """
+        Сохраняет изменения, проверенные по только что загруженному кэшу.
+        
+        В режиме журнала изменения дописываются в журнал, иначе применяются
+        к кэшу и CSV переписывается целиком.
+        
+        Args:
+            records: Записи в формате _apply
+        """
+        if self.journal:
+            self._append_journal(records)
+            return
+        
+        for record in records:
+            self._apply(record)
+        self._write_all(list(self._rows.values()))
+    
+    def _append_journal(
+        self, records: List[dict], students: Optional[List[Student]] = None
+    ) -> None:
+        """
+        Дописывает записи в журнал одной операцией записи.
+        
+        Стоимость не зависит от размера группы. Если журнал превысил
+        compact_bytes, он переносится в CSV.
+        
+        Args:
+            records: Записи в формате _apply
+            students: Уже созданные Student для записей "add" (если есть)
+        """
+        signature = self._file_signature()
+        generation = self._generation(signature)
+        try:
+            stat = self.journal_path.stat()
+            state = (stat.st_ino, stat.st_size)
+        except FileNotFoundError:
+            state = None
+        
+        # Кэш можно дополнить, только если он отражает и CSV, и весь журнал
+        in_sync = (
+            self.cached
+            and signature == self._signature
+            and state == self._journal_state
+        )
+        
+        if state is not None and not in_sync:
+            with open(self.journal_path, 'rb') as f:
+                if self._journal_base(f.readline()) != generation:
+                    # Журнал от прежней версии CSV (уже перенесён в неё)
+                    self.journal_path.unlink(missing_ok=True)
+                    state = None
+        
+        lines = [json.dumps(record, ensure_ascii=False, default=str) for record in records]
+        if state is None:
+            lines.insert(0, json.dumps({'base': generation}))
+        data = ('\n'.join(lines) + '\n').encode('utf-8')
+        
+        with open(self.journal_path, 'ab+') as f:
+            # Недописанная при сбое строка не должна склеиться с новой
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    data = b'\n' + data
+            f.write(data)
+            inode = os.fstat(f.fileno()).st_ino
+            size = f.tell()
+        
+        if in_sync:
+            for record, student in zip(records, students or [None] * len(records)):
+                self._apply(record, student)
+            self._journal_state = (inode, size)
+        
+        if size > self.compact_bytes:
+            self.compact()
+    
+    def compact(self) -> None:
+        """
+        Переносит журнал изменений в CSV.
+        
+        Итоговое состояние записывается в новый CSV, который атомарно
+        заменяет старый, после чего журнал удаляется. Если удалить журнал
+        не удалось, он не применится к новому CSV: он привязан к хешу
+        прежнего содержимого. Совпасть хеш может, только если журнал ничего
+        не изменил, и тогда повторное применение даёт тот же результат.
+        """
+        with self._lock(exclusive=True):
+            self._load()
+            self._write_all(list(self._rows.values()))
+    
+    def _insert(self, row: dict, student: Optional[Student] = None) -> None:
+        """
+        Добавляет строку в кэш и индексы.
+        
+        Args:
+            row: Словарь с данными студента
+            student: Уже созданный Student для этой строки (если есть)
+        """
+        row_id = self._next_id
+        self._next_id += 1
+        self._rows[row_id] = row
+        self._by_fio.setdefault(row['fio'], []).append(row_id)
+        
+        if student is None:
+            student = self._try_parse(row)
+        self._students[row_id] = student
+        if student is not None and self._index is not None:
+            self._index.add(row_id, student)
+    
+    def _delete(self, row_id: int) -> None:
+        """
+        Удаляет строку из кэша и индексов.
+        
+        Args:
+            row_id: Внутренний номер строки
+        """
+        row = self._rows.pop(row_id)
+        del self._students[row_id]
+        if row_id in self._index:
+            self._index.remove(row_id)
+        
+        ids = self._by_fio[row['fio']]
+        ids.remove(row_id)
+        if not ids:
+            del self._by_fio[row['fio']]
     
     def list(self) -> List[Student]:
         """
@@ -96,37 +502,181 @@ class Group:
         Returns:
             Список объектов Student
         """
-        rows = self._read_all()
-        students = []
+        with self._lock():
+            self._load()
+        return [copy.copy(s) for s in self._students.values() if s is not None]
+    
+    def get(self, fio: str) -> Optional[Student]:
+        """
+        Возвращает студента по точному ФИО (через индекс, без перебора).
         
-        for row in rows:
-            try:
-                # Преобразуем GPA из строки в float
-                row['gpa'] = float(row['gpa'])
-                student = Student.from_dict(row)
-                students.append(student)
-            except (ValueError, KeyError) as e:
-                print(f"⚠️ Ошибка при чтении студента {row.get('fio', 'unknown')}: {e}")
+        Args:
+            fio: ФИО студента
+        
+        Returns:
+            Объект Student или None, если студента нет
+        """
+        with self._lock():
+            self._load()
+        for row_id in self._by_fio.get(fio, ()):
+            if self._students[row_id] is not None:
+                return copy.copy(self._students[row_id])
+        return None
+    
+    def by_group(self, group: str) -> List[Student]:
+        """
+        Возвращает студентов группы (через индекс, в порядке файла).
+        
+        Args:
+            group: Номер группы
+        
+        Returns:
+            Список студентов группы
+        """
+        with self._lock():
+            self._load()
+        return [copy.copy(s) for s in self._index.by_group(group)]
+    
+    def gpa_range(self, lo: float, hi: float) -> List[Student]:
+        """
+        Возвращает студентов с lo <= GPA <= hi по убыванию GPA (через индекс).
+        
+        Args:
+            lo: Нижняя граница (включительно)
+            hi: Верхняя граница (включительно)
         
-        return students
+        Returns:
+            Список студентов
+        """
+        with self._lock():
+            self._load()
+        return [copy.copy(s) for s in self._index.gpa_range(lo, hi)]
+    
+    def top_k(self, k: int = 5) -> List[Student]:
+        """
+        Возвращает k студентов с наибольшим GPA (через индекс).
+        
+        Args:
+            k: Количество студентов
+        
+        Returns:
+            Список студентов по убыванию GPA
+        """
+        with self._lock():
+            self._load()
+        return [copy.copy(s) for s in self._index.top_k(k)]
     
     def add(self, student: Student) -> None:
         """
         Добавляет нового студента в базу данных.
         
+        Строка дописывается в конец файла, файл не переписывается целиком,
+        поэтому добавление не зависит от размера группы.
+        
         Args:
             student: Объект Student для добавления
         """
-        # Читаем существующие данные
-        rows = self._read_all()
+        with self._lock(exclusive=True):
+            self._append([student])
         
-        # Добавляем нового студента
-        rows.append(student.to_dict())
+        print(f"Студент {student.fio} успешно добавлен")
+    
+    def add_many(self, students: Iterable[Student]) -> int:
+        """
+        Добавляет нескольких студентов в конец файла.
         
-        # Записываем обратно
-        self._write_all(rows)
+        Студенты дописываются пачками по ADD_BATCH_SIZE, поэтому генератор
+        любой длины обрабатывается с постоянным расходом памяти.
         
-        print(f"Студент {student.fio} успешно добавлен")
+        Args:
+            students: Объекты Student для добавления
+        
+        Returns:
+            Количество добавленных студентов
+        """
+        students = iter(students)
+        count = 0
+        while batch := list(islice(students, ADD_BATCH_SIZE)):
+            with self._lock(exclusive=True):
+                self._append(batch)
+            count += len(batch)
+        
+        print(f"Добавлено студентов: {count}")
+        return count
+    
+    def import_json(self, path: str) -> int:
+        """
+        Добавляет студентов из JSON массива или JSON Lines файла.
+        
+        Файл читается потоком, студенты дописываются пачками.
+        
+        Args:
+            path: Путь к JSON файлу
+        
+        Returns:
+            Количество добавленных студентов
+        
+        Raises:
+            FileNotFoundError: Если файл не найден
+            ValueError: Если JSON некорректен (уже прочитанные пачки
+                остаются добавленными)
+        """
+        from src.lab08.serialize import iter_students_from_json
+        
+        return self.add_many(iter_students_from_json(path))
+    
+    def _append(self, students: List[Student]) -> None:
+        """
+        Дописывает студентов в конец CSV-файла (или журнала) одной
+        операцией записи.
+        
+        Args:
+            students: Объекты Student для добавления
+        """
+        rows = [student.to_dict() for student in students]
+        if self.journal:
+            self._append_journal([{'op': 'add', 'row': row} for row in rows], students)
+            return
+        
+        # Кэш можно дополнить, только если файл с момента загрузки не менялся;
+        # иначе он будет перечитан при следующем обращении
+        signature = self._file_signature()
+        in_sync = self.cached and self._signature == signature
+        
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), None)
+        if header != FIELDNAMES or self.journal_path.exists():
+            # Нестандартный заголовок или есть журнал от другого объекта:
+            # переписываем файл целиком, как раньше
+            self._load()
+            for row, student in zip(rows, students):
+                self._insert(row, student)
+            self._write_all(list(self._rows.values()))
+            return
+        
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=FIELDNAMES).writerows(rows)
+        data = buffer.getvalue().encode('utf-8')
+        
+        with open(self.path, 'ab+') as f:
+            # Если последняя строка файла без перевода строки - добавляем его
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    data = b'\r\n' + data
+            f.write(data)
+        
+        # Хеш содержимого дополняется дописанными байтами, без перечитывания
+        content = self._content
+        if content is not None and content[0] == signature:
+            content[1].update(data)
+            self._content = (self._file_signature(), content[1])
+        
+        if in_sync:
+            for row, student in zip(rows, students):
+                self._insert(row, student)
+            self._signature = self._file_signature()
     
     def find(self, substr: str) -> List[Student]:
         """
@@ -134,7 +684,7 @@ class Group:
         
         Args:
             substr: Подстрока для поиска в ФИО
-            
+        
         Returns:
             Список найденных студентов
         """
@@ -156,23 +706,23 @@ class Group:
         
         Args:
             fio: ФИО студента для удаления
-            
+        
         Returns:
             True если студент был удалён, False если не найден
         """
-        rows = self._read_all()
-        original_count = len(rows)
-        
-        # Удаляем всех студентов с указанным ФИО
-        rows = [row for row in rows if row['fio'] != fio]
-        
-        if len(rows) < original_count:
-            self._write_all(rows)
-            print(f"Студент {fio} удалён")
-            return True
-        else:
-            print(f"Студент {fio} не найден")
-            return False
+        with self._lock(exclusive=True):
+            self._load()
+            
+            # Удаляем всех студентов с указанным ФИО (их номера берём из индекса)
+            row_ids = self._by_fio.get(fio)
+            
+            if row_ids:
+                self._commit([{'op': 'delete', 'fio': fio}])
+                print(f"Студент {fio} удалён")
+                return True
+            else:
+                print(f"Студент {fio} не найден")
+                return False
     
     def update(self, fio: str, **fields) -> bool:
         """
@@ -181,31 +731,56 @@ class Group:
         Args:
             fio: ФИО студента для обновления
             **fields: Поля для обновления (например, gpa=4.5, group="SE-01")
-            
+        
         Returns:
             True если студент был обновлён, False если не найден
         """
-        rows = self._read_all()
-        updated = False
-        
-        for row in rows:
-            if row['fio'] == fio:
-                # Обновляем указанные поля
-                for field, value in fields.items():
-                    if field in row:
-                        row[field] = value
-                    else:
-                        print(f"⚠️ Поле '{field}' не существует в записи студента")
-                updated = True
-                break
-        
-        if updated:
-            self._write_all(rows)
+        with self._lock(exclusive=True):
+            self._load()
+            row_ids = self._by_fio.get(fio)
+            
+            if not row_ids:
+                print(f"⚠️ Студент {fio} не найден")
+                return False
+            
+            row_id = row_ids[0]
+            row = dict(self._rows[row_id])
+            
+            # Обновляем указанные поля
+            for field, value in fields.items():
+                if field in row:
+                    row[field] = value
+                else:
+                    print(f"⚠️ Поле '{field}' не существует в записи студента")
+            
+            self._commit([{'op': 'upsert', 'fio': fio, 'row': row}])
             print(f"Данные студента {fio} обновлены")
-        else:
-            print(f"⚠️ Студент {fio} не найден")
+            
+            return True
+    
+    def _replace(self, row_id: int, row: dict) -> None:
+        """
+        Заменяет строку на месте, сохраняя её позицию в файле.
         
-        return updated
+        Args:
+            row_id: Внутренний номер строки
+            row: Новые данные
+        """
+        old_fio = self._rows[row_id]['fio']
+        if row['fio'] != old_fio:
+            ids = self._by_fio[old_fio]
+            ids.remove(row_id)
+            if not ids:
+                del self._by_fio[old_fio]
+            insort(self._by_fio.setdefault(row['fio'], []), row_id)
+        
+        self._rows[row_id] = row
+        student = self._try_parse(row)
+        self._students[row_id] = student
+        if student is not None:
+            self._index.add(row_id, student)
+        elif row_id in self._index:
+            self._index.remove(row_id)
     
     def stats(self) -> dict:
         """
@@ -214,9 +789,11 @@ class Group:
         Returns:
             Словарь со статистикой
         """
-        students = self.list()
+        with self._lock():
+            self._load()
+        index = self._index
         
-        if not students:
+        if not len(index):
             return {
                 "count": 0,
                 "min_gpa": 0,
@@ -226,24 +803,17 @@ class Group:
                 "top_5_students": []
             }
         
-        # Основная статистика
-        gpa_values = [s.gpa for s in students]
-        count = len(students)
-        min_gpa = min(gpa_values)
-        max_gpa = max(gpa_values)
-        avg_gpa = sum(gpa_values) / count
+        # Основная статистика (минимум и максимум - концы индекса по GPA)
+        count = len(index)
+        min_gpa = index.min_gpa()
+        max_gpa = index.max_gpa()
+        avg_gpa = index.average_gpa()
         
         # Статистика по группам
-        groups = {}
-        for student in students:
-            group = student.group
-            if group not in groups:
-                groups[group] = 0
-            groups[group] += 1
+        groups = index.group_sizes()
         
         # Топ-5 студентов по GPA
-        top_students = sorted(students, key=lambda s: s.gpa, reverse=True)[:5]
-        top_5 = [{"fio": s.fio, "gpa": s.gpa} for s in top_students]
+        top_5 = [{"fio": s.fio, "gpa": s.gpa} for s in index.top_k(5)]
         
         return {
             "count": count,
@@ -268,8 +838,8 @@ class Group:
         print(f"{'№':<3} {'ФИО':<30} {'Группа':<12} {'GPA':<6} {'Возраст':<8}")
         print("="*80)
         
-        for i, student in enumerate(students, 1):
-            print(f"{i:<3} {student.fio:<30} {student.group:<12} {student.gpa:<6.2f} {student.age():<8}")
+        for i, (student, age) in enumerate(zip(students, ages(students)), 1):
+            print(f"{i:<3} {student.fio:<30} {student.group:<12} {student.gpa:<6.2f} {age:<8}")
         
         print("="*80)
         print(f"Всего студентов: {len(students)}")
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Потоковое чтение больших JSON файлов по одной записи.
+
+Поддерживаются два формата:
+  - JSON массив верхнего уровня: [{...}, {...}, ...]
+  - JSON Lines / NDJSON: значения, разделенные пробелами или переводами строк
+    (файлы .jsonl/.ndjson или любой файл с несколькими значениями подряд)
+
+Файл читается кусками фиксированного размера, каждое значение разбирается
+стандартным json.JSONDecoder.raw_decode, поэтому в памяти одновременно
+находятся только текущий кусок и одна запись, а не весь документ.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+# Размер куска чтения в символах
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Расширения файлов JSON Lines: в них одно значение - тоже одна запись
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+# Пробельные символы между значениями JSON
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+# Символы, которыми может продолжаться число: "-4" из "-4e5", "1" из "1.5"
+_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+\-]*")
+
+# Насколько далеко от конца буфера может указывать ошибка в оборванном
+# значении: "-Infinit", "\ud83d\ude0" (суррогатная пара) и т.п.
+_TRUNCATED_TAIL = 16
+
+_DECODER = json.JSONDecoder()
+
+
+class _Reader:
+    """Буфер поверх файла: читает кусками и разбирает значения по одному."""
+
+    def __init__(self, file, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 0) -> bool:
+        """Дочитывает следующий кусок; уже разобранная часть отбрасывается."""
+        if self.eof:
+            return False
+        chunk = self.file.read(max(size, self.chunk_size))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Возвращает следующий непробельный символ ("" в конце файла)."""
+        while True:
+            self.pos = _WHITESPACE_RE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def decode(self) -> Any:
+        """Разбирает одно значение JSON начиная с текущей позиции."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Значение могло не поместиться в буфер - дочитываем.
+                # Буфер растет вдвое, чтобы длинная запись не разбиралась
+                # заново после каждого маленького куска. Настоящая ошибка
+                # сообщается сразу, без чтения остатка файла
+                if self.truncated(e) and self.fill(len(self.buffer) - self.pos):
+                    continue
+                raise
+
+            # Число в конце буфера могло оборваться: "12|3", "-4|e5", "1.|5"
+            if (
+                isinstance(value, (int, float))
+                and _NUMBER_TAIL_RE.match(self.buffer, end).end() == len(self.buffer)
+                and self.fill()
+            ):
+                continue
+
+            self.pos = end
+            return value
+
+    def truncated(self, error: json.JSONDecodeError) -> bool:
+        """
+        Проверяет, может ли ошибка разбора быть вызвана концом буфера.
+
+        Оборванная строка сообщается с позиции открывающей кавычки, любое
+        другое оборванное значение ("tr", "-4.", "\\ud83d\\ude") - не дальше
+        _TRUNCATED_TAIL символов от конца буфера. Ошибка раньше - настоящая.
+        """
+        if error.msg.startswith("Unterminated string"):
+            return True
+        return len(self.buffer) - error.pos <= _TRUNCATED_TAIL
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def iter_json_records(
+    json_path: Union[str, Path],
+    encoding: str = "utf-8",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Лениво читает записи из JSON массива или из JSON Lines файла.
+
+    Формат определяется по первому непробельному символу: "[" - массив,
+    иначе - поток значений JSON Lines (каждое значение может занимать
+    и несколько строк). Одиночное значение не-массив считается JSON Lines
+    только в файлах .jsonl/.ndjson, в остальных это ошибка, как и раньше
+    при json.load: записи должны лежать в списке.
+
+    Args:
+        json_path: Путь к JSON файлу
+        encoding: Кодировка файла
+        chunk_size: Размер куска чтения в символах
+
+    Yields:
+        Элементы массива или значения JSON Lines по одному
+
+    Raises:
+        FileNotFoundError: Если файл не существует
+        ValueError: Если файл не является корректным JSON, либо содержит
+            одно значение, которое не является списком
+
+    Examples:
+        >>> for record in iter_json_records("data/samples/people.json"):
+        ...     print(record["name"])
+    """
+    with open(json_path, "r", encoding=encoding) as f:
+        reader = _Reader(f, chunk_size)
+        try:
+            if reader.peek() != "[":
+                if not reader.peek():
+                    return
+                first = reader.decode()
+                if not reader.peek() and (
+                    Path(json_path).suffix.lower() not in JSON_LINES_SUFFIXES
+                ):
+                    # Единственное значение верхнего уровня, но не массив
+                    if not first:
+                        raise ValueError("Пустой JSON файл")
+                    raise ValueError("JSON должен содержать список")
+
+                # JSON Lines: значения подряд до конца файла
+                yield first
+                while reader.peek():
+                    yield reader.decode()
+                return
+
+            # Массив: значения через запятую до закрывающей скобки
+            reader.pos += 1
+            if reader.peek() == "]":
+                reader.pos += 1
+            else:
+                while True:
+                    yield reader.decode()
+                    separator = reader.peek()
+                    reader.pos += 1
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise reader.error("Ожидалась ',' или ']'")
+
+            if reader.peek():
+                raise reader.error("Лишние данные после массива")
+
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Ошибка чтения JSON: {e}") from e
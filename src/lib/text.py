@@ -1,5 +1,22 @@
+import heapq
 import re
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Шаблоны компилируются один раз при импорте модуля
+_CONTROL_CHARS_RE = re.compile(r"[\t\r\n\f\v]")
+# Схлопываем только серии из 2+ пробелов: одиночные не нужно трогать
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+# Последний разделитель в куске и все символы после него: пробельный
+# символ или любой символ, не входящий в слово (для normalize_tokenize)
+_LAST_SPACE_RE = re.compile(r"\s\S*\Z")
+_LAST_NON_WORD_RE = re.compile(r"[^\w-][\w-]*\Z")
+
+
+def _freq_order(item: Tuple[str, int]) -> Tuple[int, str]:
+    """Ключ сортировки: по убыванию частоты, при равенстве - по алфавиту."""
+    return -item[1], item[0]
 
 
 def normalize(text: str, *, casefold: bool = True, yo2e: bool = True) -> str:
@@ -21,7 +38,7 @@ def normalize(text: str, *, casefold: bool = True, yo2e: bool = True) -> str:
         'ежик, елка'
     """
     # Замена управляющих символов на пробелы
-    text = re.sub(r"[\t\r\n\f\v]", " ", text)
+    text = _CONTROL_CHARS_RE.sub(" ", text)
 
     # Замена ё/Ё на е/Е
     if yo2e:
@@ -32,7 +49,7 @@ def normalize(text: str, *, casefold: bool = True, yo2e: bool = True) -> str:
         text = text.casefold()
 
     # Удаление лишних пробелов
-    text = re.sub(r" +", " ", text)
+    text = _MULTI_SPACE_RE.sub(" ", text)
     return text.strip()
 
 
@@ -53,7 +70,7 @@ def tokenize(text: str) -> List[str]:
         ['по-настоящему', 'круто']
     """
     # Убираем все не-словесные символы (кроме дефиса и пробелов)
-    clear_text = re.sub(r"[^\w\s-]", " ", text)
+    clear_text = _NON_WORD_RE.sub(" ", text)
 
     # Разбиваем на слова по пробелам
     new_text = clear_text.split()
@@ -61,6 +78,44 @@ def tokenize(text: str) -> List[str]:
     return new_text
 
 
+def normalize_tokenize(
+    text: str, *, casefold: bool = True, yo2e: bool = True
+) -> List[str]:
+    """
+    Быстрый путь: нормализует текст и сразу разбивает его на слова.
+
+    Результат совпадает с tokenize(normalize(text)), но без лишних проходов:
+    замена управляющих символов и схлопывание пробелов не влияют на слова
+    (split и так режет по любым пробельным символам), поэтому они
+    пропускаются. Остаются только замена ё, casefold и один проход
+    предкомпилированного шаблона.
+
+    Args:
+        text: Исходный текст
+        casefold: Приводить к нижнему регистру (по умолчанию True)
+        yo2e: Заменять ё/Ё на е/Е (по умолчанию True)
+
+    Returns:
+        Список нормализованных слов
+
+    Examples:
+        >>> normalize_tokenize("ПрИвЕт,\tЁЖИК по-настоящему!")
+        ['привет', 'ежик', 'по-настоящему']
+    """
+    return _NON_WORD_RE.sub(" ", _fold_case(text, casefold, yo2e)).split()
+
+
+def _fold_case(text: str, casefold: bool, yo2e: bool) -> str:
+    """Заменяет ё на е и приводит регистр (порядок как в normalize)."""
+    if yo2e:
+        text = text.replace("ё", "е").replace("Ё", "Е")
+
+    if casefold:
+        text = text.casefold()
+
+    return text
+
+
 def count_freq(tokens: List[str]) -> Dict[str, int]:
     """
     Подсчитывает, сколько раз каждое слово встречается в списке.
@@ -101,14 +156,355 @@ def top_n(freq: Dict[str, int], n: int = 5) -> List[Tuple[str, int]]:
         >>> top_n({'a': 3, 'b': 2, 'c': 1}, 2)
         [('a', 3), ('b', 2)]
     """
-    # Преобразуем словарь в список кортежей
-    items = list(freq.items())
+    # Отрицательный n исторически означал срез [:n] полной сортировки
+    if n < 0:
+        return sorted(freq.items(), key=_freq_order)[:n]
+
+    # Куча из n элементов: O(U log n) вместо сортировки всех U слов.
+    # Порядок тот же: по убыванию частоты, при равенстве - по алфавиту
+    return heapq.nsmallest(n, freq.items(), key=_freq_order)
+
+
+def iter_word_aligned(
+    chunks: Iterable[str], boundary: "re.Pattern[str]" = _LAST_SPACE_RE
+) -> Iterator[str]:
+    """
+    Перекраивает поток кусков текста так, чтобы ни одно слово не разрывалось.
+
+    Каждый кусок обрезается по последнему разделителю, а хвост (возможно,
+    начало слова) переносится в начало следующего куска. По умолчанию
+    разделитель - пробельный символ: слова никогда не содержат пробельных
+    символов, поэтому разрез по ним не меняет результат normalize/tokenize.
+
+    Разделитель ищется одним проходом шаблона только в новом куске (в хвосте
+    его нет), а куски без разделителя копятся списком, поэтому время работы
+    линейно. В памяти держится хвост - одно незаконченное слово.
+
+    Args:
+        chunks: Итерируемый объект с кусками текста произвольной длины
+        boundary: Шаблон, совпадающий с последним разделителем куска и
+            всем текстом после него
+
+    Yields:
+        Куски текста, границы которых совпадают с границами слов
+
+    Examples:
+        >>> list(iter_word_aligned(["при", "вет ми", "р"]))
+        ['привет ', 'мир']
+    """
+    tail: List[str] = []
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        match = boundary.search(chunk)
+        if match is None:
+            # В куске нет ни одного разделителя - копим дальше
+            tail.append(chunk)
+            continue
+
+        cut = match.start() + 1
+        tail.append(chunk[:cut])
+        yield "".join(tail)
+        tail = [chunk[cut:]] if cut < len(chunk) else []
+
+    if tail:
+        yield "".join(tail)
+
+
+def count_freq_stream(
+    chunks: Iterable[str],
+    *,
+    casefold: bool = True,
+    yo2e: bool = True,
+    tokenizer: Optional[Callable[[str], Iterable[str]]] = None,
+) -> Dict[str, int]:
+    """
+    Подсчитывает частоты слов в потоке кусков текста.
+
+    В памяти одновременно находится только один кусок и словарь частот,
+    поэтому потребление памяти не зависит от размера входных данных.
+    Результат совпадает с count_freq(tokenize(normalize(весь_текст))).
+
+    Без своего tokenizer куски режутся по любому символу, не входящему в
+    слово (а не только по пробелам), поэтому и текст без пробелов
+    ("слово,слово,...") не копится в памяти. Для этого регистр и ё
+    приводятся до разрезания: обе замены посимвольные.
+
+    Args:
+        chunks: Итерируемый объект с кусками текста (например, буферы файла)
+        casefold: Приводить к нижнему регистру (по умолчанию True)
+        yo2e: Заменять ё/Ё на е/Е (по умолчанию True)
+        tokenizer: Своя функция "текст -> слова" вместо normalize + tokenize
+            (casefold и yo2e тогда не используются). Слова не должны
+            содержать пробельных символов; куски режутся только по ним.
+
+    Returns:
+        Словарь, где ключ - слово, значение - количество вхождений
+
+    Examples:
+        >>> count_freq_stream(["Привет, ми", "р! При", "вет"])
+        {'привет': 2, 'мир': 1}
+    """
+    frequency_dict = {}
+
+    if tokenizer is None:
+        parts = iter_word_aligned(
+            (_fold_case(chunk, casefold, yo2e) for chunk in chunks),
+            _LAST_NON_WORD_RE,
+        )
+
+        def tokenizer(text: str) -> List[str]:
+            return _NON_WORD_RE.sub(" ", text).split()
+
+    else:
+        parts = iter_word_aligned(chunks)
+
+    for part in parts:
+        for word in tokenizer(part):
+            if word not in frequency_dict:
+                frequency_dict[word] = 1
+            else:
+                frequency_dict[word] += 1
+
+    return frequency_dict
+
+
+def merge_freq(target: Dict[str, int], other: Dict[str, int]) -> Dict[str, int]:
+    """
+    Добавляет частоты из other в словарь target (на месте).
+
+    Args:
+        target: Словарь частот, который дополняется
+        other: Словарь частот, который прибавляется
+
+    Returns:
+        Тот же словарь target (для удобства цепочек)
+
+    Examples:
+        >>> merge_freq({"a": 1, "b": 2}, {"b": 3, "c": 1})
+        {'a': 1, 'b': 5, 'c': 1}
+    """
+    for word, count in other.items():
+        if word not in target:
+            target[word] = count
+        else:
+            target[word] += count
+
+    return target
+
+
+class SpaceSaving:
+    """
+    Приближённый топ-k для бесконечного потока слов в фиксированной памяти.
+
+    Реализует алгоритм Space-Saving (Metwally, Agrawal, El Abbadi, 2005):
+    хранится не больше capacity счётчиков. Если приходит новое слово,
+    а места нет, вытесняется слово с минимальным счётчиком min, новое
+    слово получает счётчик min + 1 и запоминает ошибку min.
+
+    Гарантии (N - общее число слов в потоке, m - capacity):
+      - оценка никогда не меньше истинной частоты:
+        истинная <= count <= истинная + error, где error <= N / m;
+      - любое слово с истинной частотой больше N / m гарантированно
+        присутствует среди отслеживаемых;
+      - если различных слов не больше m, все частоты точные.
+
+    Минимальный счётчик ищется через кучу с ленивым удалением устаревших
+    записей, поэтому каждое слово обрабатывается за O(log m).
+
+    Examples:
+        >>> counter = SpaceSaving(capacity=2)
+        >>> counter.update(["a", "b", "a", "c", "a"])
+        >>> counter.top(1)
+        [('a', 3)]
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Максимальное количество отслеживаемых слов
+
+        Raises:
+            ValueError: Если capacity не положительный
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity должен быть положительным: {capacity}")
+
+        self.capacity = capacity
+        self.total = 0  # Сколько всего слов пришло в поток
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, word: str, count: int = 1) -> None:
+        """
+        Учитывает count вхождений слова word.
+
+        Args:
+            word: Слово из потока
+            count: Сколько раз оно встретилось
+        """
+        self.total += count
+
+        if word in self._counts:
+            self._counts[word] += count
+        elif len(self._counts) < self.capacity:
+            self._counts[word] = count
+            self._errors[word] = 0
+        else:
+            # Вытесняем слово с минимальным счётчиком
+            min_count, min_word = self._pop_min()
+            del self._counts[min_word]
+            del self._errors[min_word]
+            self._counts[word] = min_count + count
+            self._errors[word] = min_count
+
+        heapq.heappush(self._heap, (self._counts[word], word))
+
+        # Не даём куче разрастись из-за устаревших записей
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, w) for w, c in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def update(self, tokens: Iterable[str]) -> None:
+        """
+        Учитывает все слова из итерируемого объекта.
+
+        Args:
+            tokens: Слова из потока
+        """
+        for word in tokens:
+            self.add(word)
+
+    def _pop_min(self) -> Tuple[int, str]:
+        """Достаёт из кучи актуальную запись с минимальным счётчиком."""
+        while True:
+            count, word = heapq.heappop(self._heap)
+            if self._counts.get(word) == count:
+                return count, word
+
+    def top(self, n: int = 5) -> List[Tuple[str, int]]:
+        """
+        Возвращает n слов с наибольшими оценками частоты.
+
+        Порядок как у top_n: по убыванию частоты, при равенстве - по алфавиту.
+
+        Args:
+            n: Количество слов
+
+        Returns:
+            Список кортежей (слово, оценка частоты)
+        """
+        return top_n(self._counts, n)
+
+    def bounds(self, word: str) -> Tuple[int, int]:
+        """
+        Возвращает границы истинной частоты слова.
+
+        Args:
+            word: Слово
+
+        Returns:
+            Кортеж (нижняя, верхняя) граница. Для неотслеживаемого слова
+            нижняя граница 0, верхняя - минимальный счётчик (или 0).
+        """
+        if word in self._counts:
+            count = self._counts[word]
+            return count - self._errors[word], count
+
+        if len(self._counts) < self.capacity:
+            return 0, 0
+
+        return 0, min(self._counts.values())
+
+    @property
+    def max_error(self) -> float:
+        """Верхняя оценка ошибки любого счётчика: N / capacity."""
+        return self.total / self.capacity
+
+
+@dataclass
+class TextAnalysis:
+    """
+    Результат анализа текста, посчитанный за один проход.
 
-    # Сортируем по убыванию частоты, при равенстве - по алфавиту
-    sorted_items = sorted(items, key=lambda x: (-x[1], x[0]))
+    Хранит всё, что нужно отчётам и CLI: общее число слов, число уникальных,
+    топ-N и полную таблицу частот, отсортированную по убыванию частоты
+    (при равенстве - по алфавиту). Таблица сортируется один раз, топ-N -
+    это её начало.
 
-    # Возвращаем первые n элементов
-    return sorted_items[:n]
+    Attributes:
+        total_words: Общее количество слов (с повторениями)
+        unique_words: Количество уникальных слов
+        top_words: Топ-N самых частых слов в виде (слово, частота)
+        frequencies: Полная отсортированная таблица (слово, частота)
+
+    Examples:
+        >>> analysis = TextAnalysis.from_text("Привет, мир! Привет!", n=1)
+        >>> analysis.total_words, analysis.unique_words, analysis.top_words
+        (3, 2, [('привет', 2)])
+    """
+
+    total_words: int
+    unique_words: int
+    top_words: List[Tuple[str, int]]
+    frequencies: List[Tuple[str, int]]
+
+    @classmethod
+    def from_freq(cls, freq: Dict[str, int], n: int = 5) -> "TextAnalysis":
+        """
+        Строит результат анализа по готовому словарю частот.
+
+        Args:
+            freq: Словарь частот
+            n: Размер топа самых частых слов
+
+        Returns:
+            Объект TextAnalysis
+        """
+        frequencies = sorted(freq.items(), key=_freq_order)
+
+        return cls(
+            total_words=sum(freq.values()),
+            unique_words=len(freq),
+            top_words=frequencies[:n],
+            frequencies=frequencies,
+        )
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str], n: int = 5) -> "TextAnalysis":
+        """
+        Строит результат анализа по списку уже готовых токенов.
+
+        Args:
+            tokens: Слова для подсчёта
+            n: Размер топа самых частых слов
+
+        Returns:
+            Объект TextAnalysis
+        """
+        return cls.from_freq(count_freq(tokens), n)
+
+    @classmethod
+    def from_text(
+        cls, text: str, n: int = 5, *, casefold: bool = True, yo2e: bool = True
+    ) -> "TextAnalysis":
+        """
+        Нормализует, токенизирует и анализирует текст за один проход.
+
+        Args:
+            text: Исходный текст
+            n: Размер топа самых частых слов
+            casefold: Приводить к нижнему регистру (по умолчанию True)
+            yo2e: Заменять ё/Ё на е/Е (по умолчанию True)
+
+        Returns:
+            Объект TextAnalysis
+        """
+        tokens = normalize_tokenize(text, casefold=casefold, yo2e=yo2e)
+        return cls.from_tokens(tokens, n)
 
 
 # Только тесты, которые запускаются при прямом запуске файла
@@ -121,7 +517,27 @@ if __name__ == "__main__":
     assert normalize("ёжик, Ёлка") == "ежик, елка"
     assert tokenize("привет, мир!") == ["привет", "мир"]
     assert tokenize("по-настоящему круто") == ["по-настоящему", "круто"]
+    assert normalize_tokenize("ПрИвЕт,\tЁЖИК по-настоящему!") == [
+        "привет",
+        "ежик",
+        "по-настоящему",
+    ]
 
     freq = count_freq(["a", "b", "a", "c", "b", "a"])
     assert freq == {"a": 3, "b": 2, "c": 1}
     assert top_n(freq, 2) == [("a", 3), ("b", 2)]
+    assert count_freq_stream(["Привет, ми", "р! При", "вет"]) == {
+        "привет": 2,
+        "мир": 1,
+    }
+
+    assert merge_freq({"a": 1, "b": 2}, {"b": 3, "c": 1}) == {"a": 1, "b": 5, "c": 1}
+
+    counter = SpaceSaving(capacity=2)
+    counter.update(["a", "b", "a", "c", "a"])
+    assert counter.top(1) == [("a", 3)]
+
+    analysis = TextAnalysis.from_text("Привет, мир! Привет!", n=1)
+    assert (analysis.total_words, analysis.unique_words) == (3, 2)
+    assert analysis.top_words == [("привет", 2)]
+    assert analysis.frequencies == [("привет", 2), ("мир", 1)]
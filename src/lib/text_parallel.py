@@ -0,0 +1,219 @@
+"""
+Параллельный (map-reduce) подсчёт частот слов в больших файлах.
+
+Файл делится на диапазоны байтов, границы которых сдвинуты на ближайший
+пробельный символ, поэтому ни одно слово не разрезается. Каждый диапазон
+обрабатывается в отдельном процессе (normalize + tokenize + count_freq),
+а частичные словари частот затем складываются. Результат в точности
+совпадает с последовательным подсчётом.
+"""
+
+import codecs
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .text import count_freq_stream, merge_freq
+
+# Минимальный размер диапазона: меньшие куски не окупают запуск процесса
+MIN_RANGE_SIZE = 4 * 1024 * 1024
+
+# Размер буфера чтения внутри одного диапазона (в байтах)
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Количество диапазонов на один процесс (для равномерной загрузки)
+RANGES_PER_WORKER = 4
+
+# ASCII-пробелы: в UTF-8 и однобайтовых кодировках такие байты
+# никогда не встречаются внутри многобайтового символа
+_WHITESPACE_BYTES_RE = re.compile(rb"[ \t\n\r\x0b\x0c]")
+
+
+def can_split_bytes(encoding: str) -> bool:
+    """
+    Проверяет, можно ли резать файл в этой кодировке по байтам пробелов.
+
+    Подходят UTF-8 и однобайтовые ASCII-совместимые кодировки
+    (cp1251, koi8-r и т.д.). Для UTF-16/32 и многобайтовых кодировок
+    байт пробела может оказаться частью другого символа.
+
+    Args:
+        encoding: Название кодировки
+
+    Returns:
+        True если файл можно безопасно делить на диапазоны байтов
+    """
+    name = codecs.lookup(encoding).name
+    if name in ("utf-8", "utf-8-sig", "ascii"):
+        return True
+
+    # Однобайтовая кодировка: каждый байт - ровно один символ
+    try:
+        decoded = bytes(range(256)).decode(encoding, errors="replace")
+        spaces = " \t\n\r".encode(encoding)
+    except (UnicodeError, LookupError):
+        return False
+
+    return len(decoded) == 256 and spaces == b" \t\n\r"
+
+
+def split_byte_ranges(path: Union[str, Path], parts: int) -> List[Tuple[int, int]]:
+    """
+    Делит файл на диапазоны байтов, выровненные по пробельным символам.
+
+    Каждая граница сдвигается вперёд до первого байта пробела (включительно),
+    поэтому слова никогда не попадают в два диапазона сразу. Диапазоны
+    идут подряд и вместе покрывают весь файл.
+
+    Args:
+        path: Путь к файлу
+        parts: Желаемое количество диапазонов
+
+    Returns:
+        Список пар (начало, конец) - полуинтервалы [начало, конец)
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    parts = max(1, min(parts, size))
+    boundaries = [0]
+
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            position = max(size * i // parts, boundaries[-1])
+            if position >= size:
+                break
+
+            f.seek(position)
+            # Ищем первый байт пробела начиная с position
+            while True:
+                block = f.read(64 * 1024)
+                if not block:
+                    position = size
+                    break
+                match = _WHITESPACE_BYTES_RE.search(block)
+                if match:
+                    position += match.end()
+                    break
+                position += len(block)
+
+            if position >= size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def _iter_range_text(
+    path: Union[str, Path], start: int, end: int, encoding: str
+) -> Iterator[str]:
+    """
+    Читает диапазон байтов файла и декодирует его кусками.
+
+    Args:
+        path: Путь к файлу
+        start: Начало диапазона (включительно)
+        end: Конец диапазона (не включительно)
+        encoding: Кодировка файла
+
+    Yields:
+        Декодированные куски текста
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield decoder.decode(block)
+
+    yield decoder.decode(b"", final=True)
+
+
+def _count_range(
+    path: Union[str, Path],
+    start: int,
+    end: int,
+    encoding: str,
+    casefold: bool,
+    yo2e: bool,
+    tokenizer: Optional[Callable[[str], Iterable[str]]],
+) -> Dict[str, int]:
+    """
+    Считает частоты слов в одном диапазоне файла (выполняется в процессе).
+    """
+    return count_freq_stream(
+        _iter_range_text(path, start, end, encoding),
+        casefold=casefold,
+        yo2e=yo2e,
+        tokenizer=tokenizer,
+    )
+
+
+def count_file_freq_parallel(
+    path: Union[str, Path],
+    encoding: str = "utf-8",
+    workers: Optional[int] = None,
+    *,
+    casefold: bool = True,
+    yo2e: bool = True,
+    tokenizer: Optional[Callable[[str], Iterable[str]]] = None,
+    min_range_size: int = MIN_RANGE_SIZE,
+) -> Dict[str, int]:
+    """
+    Подсчитывает частоты слов в файле на нескольких процессах.
+
+    Map: каждый диапазон файла нормализуется, токенизируется и считается
+    в ProcessPoolExecutor. Reduce: частичные словари складываются.
+    Если процесс один, файл маленький или кодировку нельзя резать
+    по байтам, используется обычный потоковый подсчёт в текущем процессе.
+
+    Args:
+        path: Путь к текстовому файлу
+        encoding: Кодировка файла
+        workers: Количество процессов (по умолчанию - число ядер)
+        casefold: Приводить к нижнему регистру (по умолчанию True)
+        yo2e: Заменять ё/Ё на е/Е (по умолчанию True)
+        tokenizer: Своя функция "текст -> слова" (должна сериализоваться
+            pickle, то есть быть функцией уровня модуля)
+        min_range_size: Минимальный размер диапазона в байтах
+
+    Returns:
+        Словарь частот, совпадающий с последовательным подсчётом
+
+    Raises:
+        FileNotFoundError: Если файл не существует
+        UnicodeDecodeError: Если неправильная кодировка
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    size = os.path.getsize(path)
+    parts = min(workers * RANGES_PER_WORKER, size // max(min_range_size, 1))
+
+    if workers <= 1 or parts <= 1 or not can_split_bytes(encoding):
+        return _count_range(path, 0, size, encoding, casefold, yo2e, tokenizer)
+
+    ranges = split_byte_ranges(path, parts)
+
+    frequency_dict = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _count_range, path, start, end, encoding, casefold, yo2e, tokenizer
+            )
+            for start, end in ranges
+        ]
+        for future in futures:
+            merge_freq(frequency_dict, future.result())
+
+    return frequency_dict
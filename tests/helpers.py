@@ -0,0 +1,61 @@
+"""
+Общие помощники тестов: генераторы тестовых студентов и замер времени.
+
+Обычный модуль, а не conftest.py: тесты импортируют его как tests.helpers
+(корень репозитория добавляется в sys.path так же, как для пакета src).
+"""
+
+import random
+import sys
+import os
+import time
+from typing import Callable, Iterator
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab08.models import Student
+
+# Группы тестовых студентов (одна кириллицей - для проверки кодировок)
+GROUPS = ["SE-01", "SE-02", "SE-03", "ПИ-01"]
+
+# Средние баллы с повторами: индексам и топу важны равные GPA
+GPAS = [3.0, 3.5, 4.0, 4.25, 4.5, 5.0]
+
+
+def make_student(
+    i: int, group: str = "SE-01", gpa: float = 4.0, birthdate: str = "2000-01-15"
+) -> Student:
+    """Студент с ФИО "Студент{i} Тестовый" и заданными полями."""
+    return Student(f"Студент{i} Тестовый", birthdate, group, gpa)
+
+
+def iter_students(count: int, seed: int = 0) -> Iterator[Student]:
+    """Генерирует count тестовых студентов с уникальными ФИО (детерминированно)."""
+    rng = random.Random(seed)
+    for i in range(count):
+        year = rng.randint(1995, 2005)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        birthdate = f"{year}-{month:02d}-{day:02d}"
+        yield make_student(i, rng.choice(GROUPS), rng.choice(GPAS), birthdate)
+
+
+def make_students(count: int, seed: int = 0) -> list[Student]:
+    """Список из count тестовых студентов."""
+    return list(iter_students(count, seed))
+
+
+def timed(func: Callable[[], object], repeat: int = 1) -> float:
+    """
+    Лучшее время из repeat вызовов func() в секундах.
+
+    Только для бенчмарков (@pytest.mark.benchmark): они печатают время,
+    но не сравнивают его, потому что оно зависит от машины и нагрузки.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
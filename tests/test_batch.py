@@ -0,0 +1,65 @@
+import json
+import sys
+import os
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab05.batch import convert_batch, plan_batch
+
+
+def make_inputs(in_dir, count=4):
+    """Папка с несколькими JSON файлами (один во вложенной папке) и одним битым."""
+    (in_dir / "sub").mkdir(parents=True)
+    for i in range(count):
+        folder = in_dir / "sub" if i == 0 else in_dir
+        data = [{"id": i, "name": f"Имя {i}"}]
+        (folder / f"file_{i}.json").write_text(
+            json.dumps(data, ensure_ascii=False), encoding="utf-8"
+        )
+    (in_dir / "broken.json").write_text("{not valid json}", encoding="utf-8")
+    (in_dir / "notes.txt").write_text("не JSON", encoding="utf-8")
+
+
+def test_plan_batch_keeps_structure(tmp_path):
+    """Результаты повторяют структуру папок, берутся только нужные файлы"""
+    make_inputs(tmp_path / "in", count=2)
+
+    pairs = plan_batch(tmp_path / "in", tmp_path / "out", "csv")
+
+    assert [
+        (s.relative_to(tmp_path).as_posix(), t.relative_to(tmp_path).as_posix())
+        for s, t in pairs
+    ] == [
+        ("in/broken.json", "out/broken.csv"),
+        ("in/file_1.json", "out/file_1.csv"),
+        ("in/sub/file_0.json", "out/sub/file_0.csv"),
+    ]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_convert_batch_isolates_failures_and_skips_fresh(tmp_path, jobs):
+    """Битый файл не мешает остальным, актуальные результаты пропускаются"""
+    make_inputs(tmp_path / "in")
+    out_dir = tmp_path / "out"
+
+    result = convert_batch(tmp_path / "in", out_dir, "csv", jobs=jobs)
+
+    assert result.converted == 4
+    assert [os.path.basename(source) for source, _ in result.failed] == ["broken.json"]
+    assert not (out_dir / "broken.csv").exists()
+    first = (out_dir / "sub" / "file_0.csv").read_text(encoding="utf-8")
+    assert first.splitlines() == ["id,name", "0,Имя 0"]
+    assert "файлов/с" in result.summary()
+
+    # Второй запуск: все готовые файлы пропускаются, битый пробуется снова
+    again = convert_batch(tmp_path / "in", out_dir, "csv", jobs=jobs)
+    assert (again.converted, again.skipped, len(again.failed)) == (0, 4, 1)
+
+    # Измененный исходник конвертируется заново
+    source = tmp_path / "in" / "file_1.json"
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert convert_batch(tmp_path / "in", out_dir, "csv").converted == 1
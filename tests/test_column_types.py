@@ -0,0 +1,141 @@
+import json
+import sys
+import os
+from datetime import date
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab05.column_types import (
+    detect_type,
+    infer_column_types,
+    infer_csv_types,
+    load_schema,
+    make_converters,
+)
+from src.lab05.json_csv import csv_to_json
+
+CSV_TEXT = (
+    "name,age,gpa,active,birthdate,zip,note\n"
+    "Анна,25,4.5,true,2000-01-31,007,\n"
+    "Петр,,4,False,1999-12-01,123,текст\n"
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", "null"),
+        ("25", "int"),
+        ("-3", "int"),
+        ("007", "str"),
+        ("4.5", "float"),
+        ("1e3", "float"),
+        ("nan", "str"),
+        ("1e999", "str"),
+        ("TRUE", "bool"),
+        ("2025-01-31", "date"),
+        ("2025-02-30", "str"),
+        ("Москва", "str"),
+    ],
+)
+def test_detect_type(value, expected):
+    """Тип одного значения"""
+    assert detect_type(value) == expected
+
+
+def test_infer_column_types_merges_values():
+    """int + float = float, пустые значения не мешают, смесь типов - строка"""
+    header = ["a", "b", "c", "d"]
+    rows = [["1", "", "1", "true"], ["2.5", "", "x", "2"], ["3", "", "2", "false"]]
+
+    assert infer_column_types(header, rows) == {
+        "a": "float",
+        "b": "null",
+        "c": "str",
+        "d": "str",
+    }
+    # По выборке из одной строки колонка c выглядит числовой
+    assert infer_column_types(header, rows, sample_rows=1)["c"] == "int"
+
+
+def test_converters_keep_values_outside_sample():
+    """Значение, не подходящее под тип колонки, остается строкой"""
+    converters = make_converters({"n": "int", "d": "date"}, parse_dates=True)
+
+    assert converters["n"]("12") == 12
+    assert converters["n"]("") is None
+    assert converters["n"]("n/a") == "n/a"
+    assert converters["d"]("2000-01-31") == date(2000, 1, 31)
+
+
+def test_converters_check_values_like_sample():
+    """После выборки значения проверяются так же строго, как в ней"""
+    converters = make_converters({"zip": "int", "val": "float", "flag": "bool"})
+
+    assert converters["zip"]("00123") == "00123"
+    assert converters["zip"]("+5") == 5
+    assert converters["val"]("7") == 7.0
+    for value in ("nan", "inf", "-Infinity", "1e999", "1_000"):
+        assert converters["val"](value) == value
+    assert converters["flag"]("yes") == "yes"
+
+
+def test_csv_to_json_rows_after_sample(tmp_path):
+    """Строки после выборки не теряют ведущие нули и не дают NaN в JSON"""
+    csv_path = tmp_path / "test.csv"
+    json_path = tmp_path / "test.json"
+    rows = "".join(f"{i},{i}.5\n" for i in range(1, 1001))
+    csv_path.write_text("zip,val\n" + rows + "00123,nan\n", encoding="utf-8")
+
+    csv_to_json(str(csv_path), str(json_path), infer_types=True)
+
+    text = json_path.read_text(encoding="utf-8")
+    data = json.loads(text, parse_constant=lambda name: pytest.fail(name))
+    assert data[0] == {"zip": 1, "val": 1.5}
+    assert data[-1] == {"zip": "00123", "val": "nan"}
+
+
+def test_csv_to_json_with_types(tmp_path):
+    """Типизированный JSON: числа, bool и null вместо строк"""
+    csv_path = tmp_path / "test.csv"
+    json_path = tmp_path / "test.json"
+    csv_path.write_text(CSV_TEXT, encoding="utf-8")
+
+    csv_to_json(str(csv_path), str(json_path), infer_types=True)
+
+    data = json.loads(json_path.read_text(encoding="utf-8"))
+    assert data[0] == {
+        "name": "Анна",
+        "age": 25,
+        "gpa": 4.5,
+        "active": True,
+        "birthdate": "2000-01-31",
+        "zip": "007",
+        "note": "",
+    }
+    assert data[1]["age"] is None
+    assert data[1]["active"] is False
+
+
+def test_schema_file_is_reused(tmp_path):
+    """Схема сохраняется и при том же заголовке используется без выборки"""
+    csv_path = tmp_path / "test.csv"
+    schema_path = tmp_path / "schema.json"
+    csv_path.write_text(CSV_TEXT, encoding="utf-8")
+
+    types = infer_csv_types(csv_path, schema_path=schema_path)
+    assert load_schema(schema_path, CSV_TEXT.splitlines()[0].split(",")) == types
+
+    # Данные изменились, но схема для этого заголовка уже есть
+    csv_path.write_text(CSV_TEXT.replace("25", "двадцать"), encoding="utf-8")
+    assert infer_csv_types(csv_path, schema_path=schema_path)["age"] == "int"
+
+    # Другой заголовок - схема определяется заново и дописывается в файл
+    other = tmp_path / "other.csv"
+    other.write_text("x\n1.5\n", encoding="utf-8")
+    assert infer_csv_types(other, schema_path=schema_path) == {"x": "float"}
+    assert load_schema(schema_path, ["age"]) is None
+    assert load_schema(schema_path, ["x"]) == {"x": "float"}
@@ -0,0 +1,149 @@
+import csv
+import sys
+import os
+import tracemalloc
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from src.lab05.csv_xlsx import column_widths, csv_to_xlsx, sheet_title
+
+
+def write_rows(path, rows):
+    with path.open("w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def test_csv_to_xlsx_values_and_widths(tmp_path):
+    """Значения переносятся как есть, ширина - по самому длинному значению"""
+    csv_path = tmp_path / "test.csv"
+    xlsx_path = tmp_path / "test.xlsx"
+    rows = [
+        ["name", "city"],
+        ["Анна", "Санкт-Петербург"],
+        ["Петр", "СПб", "лишняя колонка"],
+    ]
+    write_rows(csv_path, rows)
+
+    csv_to_xlsx(str(csv_path), str(xlsx_path))
+
+    sheet = openpyxl.load_workbook(xlsx_path).active
+    assert sheet.title == "Sheet1"
+    assert [[cell.value for cell in row] for row in sheet.iter_rows()] == [
+        ["name", "city", None],
+        ["Анна", "Санкт-Петербург", None],
+        ["Петр", "СПб", "лишняя колонка"],
+    ]
+    assert [sheet.column_dimensions[letter].width for letter in "ABC"] == [
+        8,
+        len("Санкт-Петербург") + 2,
+        len("лишняя колонка") + 2,
+    ]
+
+
+def test_column_widths_sample(tmp_path):
+    """Ширину можно считать только по первым строкам"""
+    csv_path = tmp_path / "test.csv"
+    write_rows(csv_path, [["a"], ["b" * 20]])
+
+    assert column_widths(csv_path) == [22]
+    assert column_widths(csv_path, sample_rows=1) == [8]
+
+
+def test_csv_to_xlsx_empty(tmp_path):
+    """Пустой CSV - ошибка, файл не создается"""
+    csv_path = tmp_path / "empty.csv"
+    csv_path.write_text("", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="пустой"):
+        csv_to_xlsx(str(csv_path), str(tmp_path / "out.xlsx"))
+
+    assert not (tmp_path / "out.xlsx").exists()
+
+
+def test_csv_to_xlsx_peak_memory_is_flat(tmp_path):
+    """Пиковая память не растёт вместе с количеством строк"""
+
+    def peak_for(count: int) -> int:
+        csv_path = tmp_path / f"input_{count}.csv"
+        write_rows(
+            csv_path,
+            [["id", "name", "city"]]
+            + [[i, f"Имя {i}", "Москва"] for i in range(count)],
+        )
+
+        tracemalloc.start()
+        csv_to_xlsx(str(csv_path), str(tmp_path / "out.xlsx"))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small = peak_for(500)
+    large = peak_for(5_000)
+
+    # Строк в 10 раз больше, а пик памяти практически тот же
+    assert large < small * 2
+
+
+def test_csv_to_xlsx_rolls_over_to_new_sheet(tmp_path):
+    """При превышении лимита строк запись продолжается на новом листе"""
+    csv_path = tmp_path / "test.csv"
+    xlsx_path = tmp_path / "test.xlsx"
+    write_rows(csv_path, [["id"]] + [[str(i)] for i in range(5)])
+
+    assert csv_to_xlsx(str(csv_path), str(xlsx_path), max_rows=3) == 5
+
+    workbook = openpyxl.load_workbook(xlsx_path)
+    assert workbook.sheetnames == ["Sheet1", "Sheet1_2", "Sheet1_3"]
+    assert [
+        [row[0] for row in sheet.iter_rows(values_only=True)] for sheet in workbook
+    ] == [["id", "0", "1"], ["id", "2", "3"], ["id", "4"]]
+
+
+def test_csv_to_xlsx_several_files(tmp_path):
+    """Несколько CSV - по листу на каждый файл"""
+    first = tmp_path / "people.csv"
+    second = tmp_path / "cities.csv"
+    write_rows(first, [["name"], ["Анна"]])
+    write_rows(second, [["city"], ["Москва"], ["Казань"]])
+
+    # Считаются только строки данных, без заголовков листов
+    assert csv_to_xlsx([str(first), str(second)], str(tmp_path / "all.xlsx")) == 3
+
+    workbook = openpyxl.load_workbook(tmp_path / "all.xlsx")
+    assert workbook.sheetnames == ["people", "cities"]
+    assert workbook["cities"].max_row == 3
+
+
+def test_sheet_title_is_valid_and_unique():
+    """Имена листов без запрещенных символов, не длиннее 31 и без повторов"""
+    used = set()
+
+    assert sheet_title("отчет:2025/01", used) == "отчет_2025_01"
+    assert sheet_title("Отчет:2025/01", used) == "Отчет_2025_01_2"
+    assert len(sheet_title("x" * 40, used)) == 31
+    assert sheet_title("x" * 40, used) == "x" * 29 + "_2"
+
+
+def test_csv_to_xlsx_typed_cells(tmp_path):
+    """С определением типов числа, bool и даты записываются как значения"""
+    csv_path = tmp_path / "test.csv"
+    xlsx_path = tmp_path / "test.xlsx"
+    write_rows(
+        csv_path,
+        [
+            ["name", "age", "gpa", "ok", "born"],
+            ["Анна", "25", "4.5", "true", "2000-01-31"],
+        ],
+    )
+
+    csv_to_xlsx(str(csv_path), str(xlsx_path), infer_types=True)
+
+    sheet = openpyxl.load_workbook(xlsx_path).active
+    name, age, gpa, ok, born = next(sheet.iter_rows(min_row=2, values_only=True))
+    assert (name, age, gpa, ok) == ("Анна", 25, 4.5, True)
+    assert born.date().isoformat() == "2000-01-31"
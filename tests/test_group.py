@@ -0,0 +1,348 @@
+import csv
+import sys
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab09.group import Group
+
+from tests.helpers import make_student, timed
+
+
+def stress_worker(path: str, worker: int, rounds: int, journal: bool) -> None:
+    """Процесс стресс-теста: добавляет студентов и обновляет своего студента."""
+    group = Group(path, journal=journal, compact_bytes=4096)
+    for i in range(rounds):
+        group.add(make_student((worker + 1) * 1000 + i, group=f"W-{worker}"))
+        group.update(f"Студент{worker} Тестовый", gpa=i / 10)
+
+
+class CountingGroup(Group):
+    """Group, который считает, сколько раз файл разбирался целиком."""
+
+    reads = 0
+
+    def _read_all(self):
+        self.reads += 1
+        return super()._read_all()
+
+
+@pytest.mark.parametrize("cached", [True, False])
+def test_group_crud(tmp_path, cached):
+    """CRUD работает одинаково с кэшем и без"""
+    group = Group(tmp_path / "students.csv", cached=cached)
+    group.add(make_student(1, gpa=4.5))
+    group.add(make_student(2, group="SE-02"))
+    group.add(make_student(3))
+
+    assert group.update("Студент2 Тестовый", gpa=3.5, group="SE-03")
+    assert group.remove("Студент1 Тестовый")
+    assert not group.remove("Нет Такого")
+
+    students = Group(tmp_path / "students.csv").list()
+    assert [(s.fio, s.group, s.gpa) for s in students] == [
+        ("Студент2 Тестовый", "SE-03", 3.5),
+        ("Студент3 Тестовый", "SE-01", 4.0),
+    ]
+    assert group.list() == students
+
+
+def test_group_reads_file_once_while_unchanged(tmp_path):
+    """Повторные чтения не разбирают файл, пока он не изменился"""
+    path = tmp_path / "students.csv"
+    Group(path).add(make_student(1))
+
+    group = CountingGroup(path)
+    for _ in range(5):
+        group.list()
+        group.find("Студент")
+        group.stats()
+    assert group.get("Студент1 Тестовый").gpa == 4.0
+    assert group.get("Нет Такого") is None
+    assert group.reads == 1
+
+    # Собственные изменения не требуют повторного чтения
+    group.add(make_student(2))
+    group.update("Студент2 Тестовый", gpa=5.0)
+    assert group.get("Студент2 Тестовый").gpa == 5.0
+    assert group.reads == 1
+
+
+def test_group_reloads_after_external_change(tmp_path):
+    """Изменение файла другим объектом (процессом) замечается"""
+    path = tmp_path / "students.csv"
+    first = CountingGroup(path)
+    second = Group(path)
+
+    assert first.list() == []
+    second.add(make_student(1))
+
+    assert [s.fio for s in first.list()] == ["Студент1 Тестовый"]
+    # Только что созданный пустой файл не разбирался, прочитан только измененный
+    assert first.reads == 1
+
+
+def test_group_keeps_invalid_rows_on_rewrite(tmp_path, capsys):
+    """Некорректные строки пропускаются при чтении, но не теряются при записи"""
+    path = tmp_path / "students.csv"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["fio", "birthdate", "group", "gpa"])
+        writer.writerow(["Плохой Студент", "не дата", "SE-01", "4.0"])
+        writer.writerow(["Студент1 Тестовый", "2000-01-15", "SE-01", "4.50"])
+
+    group = Group(path)
+    assert [s.fio for s in group.list()] == ["Студент1 Тестовый"]
+    assert "Плохой Студент" in capsys.readouterr().out
+
+    group.add(make_student(2))
+
+    rows = path.read_text(encoding="utf-8").splitlines()
+    assert rows[1:3] == [
+        "Плохой Студент,не дата,SE-01,4.0",
+        "Студент1 Тестовый,2000-01-15,SE-01,4.50",
+    ]
+
+
+def test_add_appends_without_rewriting(tmp_path):
+    """add дописывает строку в конец файла и не разбирает файл целиком"""
+    path = tmp_path / "students.csv"
+    path.write_text(
+        "fio,birthdate,group,gpa\r\nСтудент0 Тестовый,2000-01-15,SE-01,4.50",
+        encoding="utf-8",
+    )
+
+    group = CountingGroup(path)
+    group.add(make_student(1))
+    assert group.add_many(make_student(i) for i in range(2, 4)) == 2
+    assert group.reads == 0
+
+    # Строка без перевода строки в конце не склеилась с новой
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        "fio,birthdate,group,gpa",
+        "Студент0 Тестовый,2000-01-15,SE-01,4.50",
+        "Студент1 Тестовый,2000-01-15,SE-01,4.0",
+        "Студент2 Тестовый,2000-01-15,SE-01,4.0",
+        "Студент3 Тестовый,2000-01-15,SE-01,4.0",
+    ]
+    assert len(group.list()) == 4 and group.reads == 1
+
+    # Кэш в актуальном состоянии дополняется без повторного чтения
+    group.add(make_student(4))
+    assert group.get("Студент4 Тестовый") is not None
+    assert group.reads == 1
+
+
+@pytest.mark.benchmark
+def test_benchmark_add_scales_linearly(tmp_path):
+    """Бенчмарк: add_many линеен по числу строк, add не зависит от размера файла"""
+    students = [make_student(i) for i in range(100_000)]
+
+    small = timed(lambda: Group(tmp_path / "small.csv").add_many(students))
+    large = timed(lambda: Group(tmp_path / "large.csv").add_many(students * 2))
+
+    # 10 добавлений в пустой файл и в файл на 200 000 строк
+    empty_group = Group(tmp_path / "empty.csv")
+    large_group = Group(tmp_path / "large.csv")
+    add_empty = timed(lambda: [empty_group.add(s) for s in students[:10]])
+    add_large = timed(lambda: [large_group.add(s) for s in students[:10]])
+
+    print(
+        f"\nadd_many: 100k - {small:.2f} сек, 200k - {large:.2f} сек; "
+        f"10 x add: пустой файл - {add_empty * 1000:.1f} мс, "
+        f"200k строк - {add_large * 1000:.1f} мс"
+    )
+
+    with open(tmp_path / "large.csv", encoding="utf-8") as f:
+        assert sum(1 for _ in f) == 1 + 200_010
+
+
+def snapshot(group: Group) -> list:
+    return [(s.fio, s.group, s.gpa) for s in group.list()]
+
+
+def test_journal_matches_rewrite_mode(tmp_path):
+    """Журнал дает тот же результат, что и перезапись CSV"""
+    results = []
+    for name, journal in [("plain.csv", False), ("journal.csv", True)]:
+        group = Group(tmp_path / name, journal=journal)
+        group.add_many(make_student(i, gpa=3.0 + i / 10) for i in range(5))
+        group.update("Студент1 Тестовый", gpa=5.0, group="SE-05")
+        group.remove("Студент3 Тестовый")
+        group.add(make_student(3, group="SE-02"))
+        results.append(snapshot(group))
+        # Другой объект (процесс) видит те же данные
+        assert snapshot(Group(tmp_path / name)) == results[-1]
+
+    assert results[0] == results[1]
+    assert (tmp_path / "journal.csv.journal").exists()
+    # В режиме журнала CSV не менялся
+    assert (tmp_path / "journal.csv").read_text(encoding="utf-8").splitlines() == [
+        "fio,birthdate,group,gpa"
+    ]
+
+
+def test_journal_compact(tmp_path):
+    """compact переносит журнал в CSV и удаляет его"""
+    path = tmp_path / "students.csv"
+    group = Group(path, journal=True)
+    group.add_many(make_student(i) for i in range(3))
+    group.remove("Студент0 Тестовый")
+    reader = CountingGroup(path)
+    expected = snapshot(reader)
+
+    group.compact()
+
+    assert not group.journal_path.exists()
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    assert snapshot(group) == snapshot(Group(path)) == expected
+    # Читатель замечает замену CSV и перечитывает его без журнала
+    assert snapshot(reader) == expected and reader.reads == 2
+
+
+def test_journal_auto_compact(tmp_path):
+    """Журнал больше compact_bytes переносится в CSV автоматически"""
+    path = tmp_path / "students.csv"
+    group = Group(path, journal=True, compact_bytes=2000)
+    group.add_many(make_student(i) for i in range(5))
+    assert group.journal_path.exists()
+
+    for i in range(20):
+        group.update(f"Студент{i % 5} Тестовый", gpa=float(i % 5))
+
+    # Журнал хотя бы раз перенесен в CSV и не разрастается
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 6
+    assert not group.journal_path.exists() or group.journal_path.stat().st_size <= 2000
+    assert snapshot(Group(path)) == snapshot(group)
+    assert [s.gpa for s in group.list()] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+
+def test_stale_journal_is_ignored(tmp_path):
+    """Журнал от прежней версии CSV (сбой после compact) не применяется"""
+    path = tmp_path / "students.csv"
+    group = Group(path, journal=True)
+    group.add(make_student(1))
+    stale = group.journal_path.read_bytes()
+
+    group.compact()
+    group.journal_path.write_bytes(stale)
+
+    assert [s.fio for s in Group(path).list()] == ["Студент1 Тестовый"]
+    # Новые изменения пишутся в новый журнал, старый не мешает
+    Group(path, journal=True).add(make_student(2))
+    assert [s.fio for s in Group(path).list()] == [
+        "Студент1 Тестовый",
+        "Студент2 Тестовый",
+    ]
+
+
+def test_journal_survives_touch_and_copy(tmp_path):
+    """Журнал применяется после touch CSV и к копии пары файлов"""
+    path = tmp_path / "students.csv"
+    group = Group(path, journal=True)
+    group.add(make_student(1, gpa=4.9))
+    group.update("Студент1 Тестовый", gpa=5.0)
+    expected = [("Студент1 Тестовый", "SE-01", 5.0)]
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns + 10**9, stat.st_mtime_ns + 10**9))
+    assert snapshot(Group(path)) == snapshot(group) == expected
+
+    copy = tmp_path / "backup" / "students.csv"
+    copy.parent.mkdir()
+    shutil.copy2(path, copy)
+    shutil.copy2(group.journal_path, copy.with_name("students.csv.journal"))
+    assert snapshot(Group(copy)) == expected
+
+    # Изменения копии дописываются в её журнал
+    Group(copy, journal=True).add(make_student(2))
+    assert len(Group(copy).list()) == 2
+    assert snapshot(Group(path)) == expected
+
+
+def test_journal_skips_torn_record(tmp_path):
+    """Недописанная при сбое запись пропускается"""
+    path = tmp_path / "students.csv"
+    Group(path, journal=True).add(make_student(1))
+    with open(path.with_name("students.csv.journal"), "ab") as f:
+        f.write(b'{"op": "delete", "fio": "\xd0')
+
+    assert [s.fio for s in Group(path).list()] == ["Студент1 Тестовый"]
+    Group(path, journal=True).add(make_student(2))
+    assert len(Group(path).list()) == 2
+
+
+@pytest.mark.benchmark
+def test_benchmark_journal_mutations_do_not_depend_on_size(tmp_path):
+    """Бенчмарк: update/remove в режиме журнала не переписывают файл"""
+    students = [make_student(i) for i in range(50_000)]
+
+    def timed_mutations(path, journal, count=len(students)) -> float:
+        group = Group(path, journal=journal, compact_bytes=10**9)
+        group.add_many(students[:count])
+        group.list()
+
+        def mutate():
+            for i in range(5):
+                group.update(f"Студент{i} Тестовый", gpa=5.0)
+                group.remove(f"Студент{i + 10} Тестовый")
+
+        elapsed = timed(mutate)
+        assert len(group.list()) == count - 5
+        return elapsed
+
+    rewrite = timed_mutations(tmp_path / "plain.csv", journal=False)
+    journal = timed_mutations(tmp_path / "journal.csv", journal=True)
+    journal_small = timed_mutations(tmp_path / "small.csv", journal=True, count=100)
+
+    print(
+        f"\n10 изменений в группе на 50k: перезапись - {rewrite * 1000:.0f} мс, "
+        f"журнал - {journal * 1000:.1f} мс (группа на 100 - {journal_small * 1000:.1f} мс)"
+    )
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_concurrent_processes_do_not_lose_updates(tmp_path, journal):
+    """Стресс-тест: несколько процессов одновременно добавляют и обновляют"""
+    path = tmp_path / "students.csv"
+    workers, rounds = 4, 30
+    Group(path).add_many(make_student(w) for w in range(workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(stress_worker, str(path), w, rounds, journal)
+            for w in range(workers)
+        ]
+        for future in futures:
+            future.result()
+
+    students = Group(path).list()
+    assert len(students) == workers + workers * rounds
+    for w in range(workers):
+        assert Group(path).get(f"Студент{w} Тестовый").gpa == (rounds - 1) / 10
+        added = [s for s in students if s.group == f"W-{w}"]
+        assert len(added) == rounds
+    assert not path.with_name("students.csv.tmp").exists()
+
+
+def test_write_all_is_atomic(tmp_path, monkeypatch):
+    """Сбой во время записи не портит файл: остается прежняя версия"""
+    path = tmp_path / "students.csv"
+    group = Group(path)
+    group.add_many(make_student(i) for i in range(3))
+    before = path.read_bytes()
+
+    def crash(*args):
+        raise OSError("сбой диска")
+
+    monkeypatch.setattr(os, "fsync", crash)
+    with pytest.raises(OSError):
+        group.remove("Студент0 Тестовый")
+
+    assert path.read_bytes() == before
+    assert len(Group(path).list()) == 3
@@ -0,0 +1,230 @@
+import random
+import sys
+import os
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab08.index import StudentIndex
+from src.lab08.models import Student, StudentList
+from src.lab09.group import Group
+
+from tests.helpers import GROUPS, make_students, timed
+
+
+def expected_top(students, k):
+    return sorted(students, key=lambda s: s.gpa, reverse=True)[:k]
+
+
+def test_index_queries_match_linear_scan():
+    """Ответы индекса совпадают с перебором, в том числе после изменений"""
+    rng = random.Random(1)
+    pool = make_students(200)
+    current = dict(enumerate(pool[:100]))
+    index = StudentIndex(current.items())
+
+    for step in range(300):
+        key = rng.randrange(150)
+        if key in current and rng.random() < 0.5:
+            index.remove(key)
+            del current[key]
+        else:
+            current[key] = rng.choice(pool)
+            index.add(key, current[key])
+
+        if step % 30 == 0:
+            ordered = [current[k] for k in sorted(current)]
+            for group in GROUPS:
+                assert index.by_group(group) == [s for s in ordered if s.group == group]
+            assert index.gpa_range(3.5, 4.25) == sorted(
+                (s for s in ordered if 3.5 <= s.gpa <= 4.25),
+                key=lambda s: s.gpa,
+                reverse=True,
+            )
+            assert index.top_k(7) == expected_top(ordered, 7)
+            assert index.group_sizes() == {
+                g: n for g in GROUPS if (n := sum(s.group == g for s in ordered))
+            }
+            assert index.min_gpa() == min(s.gpa for s in ordered)
+            assert index.max_gpa() == max(s.gpa for s in ordered)
+
+    with pytest.raises(KeyError):
+        index.remove(10_000)
+
+
+def test_index_remove_ignores_changed_fields():
+    """Удаление находит студента по значениям на момент добавления"""
+    students = make_students(20)
+    index = StudentIndex(enumerate(students))
+    students[3].gpa = 0.5 if students[3].gpa > 1 else 4.9
+    students[3].group = "NEW-01"
+
+    index.remove(3)
+    index.remove(4)
+
+    rest = [s for i, s in enumerate(students) if i not in (3, 4)]
+    assert index.top_k(len(students)) == expected_top(rest, len(students))
+    assert sum(index.group_sizes().values()) == len(rest)
+
+
+def test_group_returns_copies(tmp_path):
+    """Изменение возвращенного студента не портит кэш и индексы Group"""
+    group = Group(tmp_path / "students.csv")
+    group.add_many(make_students(5))
+
+    student = group.get("Студент0 Тестовый")
+    student.gpa = 4.9
+    group.top_k(3)[0].group = "NEW-01"
+    assert group.get("Студент0 Тестовый").gpa != 4.9
+    assert group.by_group("NEW-01") == []
+
+    assert group.remove("Студент0 Тестовый")
+    assert group.top_k(3) == expected_top(group.list(), 3)
+    assert [s.fio for s in group.list()] == [
+        f"Студент{i} Тестовый" for i in range(1, 5)
+    ]
+
+
+def test_student_list_uses_index():
+    """StudentList отвечает как раньше и учитывает добавленных студентов"""
+    students = make_students(50)
+    student_list = StudentList(list(students[:40]))
+
+    assert student_list.get_by_group("SE-01") == [
+        s for s in students[:40] if s.group == "SE-01"
+    ]
+    for student in students[40:45]:
+        student_list.add_student(student)
+    # Список изменен напрямую - индекс перестраивается
+    student_list.students.extend(students[45:])
+
+    assert student_list.get_by_group("SE-02") == [
+        s for s in students if s.group == "SE-02"
+    ]
+    assert student_list.get_top_students(5) == expected_top(students, 5)
+    assert student_list.get_by_gpa_range(5.0, 5.0) == [
+        s for s in students if s.gpa == 5.0
+    ]
+
+
+def test_student_list_notices_same_length_edits():
+    """Замена элемента списка без изменения длины перестраивает индекс"""
+    students = make_students(10)
+    student_list = StudentList(list(students))
+    assert student_list.get_by_group(students[0].group)[0] is students[0]
+
+    replacement = Student("Новый Студент", "2001-02-03", "Z-01", 2.0)
+    student_list.students[0] = replacement
+    assert student_list.get_by_group("Z-01") == [replacement]
+    assert students[0] not in student_list.get_by_group(students[0].group)
+
+    student_list.students = list(reversed(students))
+    student_list.add_student(replacement)
+    assert student_list.get_by_group("Z-01") == [replacement]
+    assert student_list.get_by_gpa_range(0, 5) == expected_top(
+        student_list.students, len(student_list.students)
+    )
+
+
+def test_student_list_tracks_changes_by_version():
+    """Изменения students учитываются, повторные запросы не перестраивают индекс"""
+    students = make_students(30)
+    student_list = StudentList(list(students))
+    index = student_list._get_index()
+    student_list.get_top_students(3)
+    assert student_list._get_index() is index
+
+    student_list.add_student(students[0])
+    assert student_list._get_index() is index
+    assert (
+        student_list.get_top_students(-1)
+        == expected_top(student_list.students, len(student_list.students))[:-1]
+    )
+    assert student_list.get_top_students(-100) == []
+
+    del student_list.students[:10]
+    student_list.students.sort(key=lambda s: s.fio)
+    student_list.students.insert(0, students[5])
+    assert student_list._get_index() is not index
+    assert student_list.get_by_group("SE-01") == [
+        s for s in student_list.students if s.group == "SE-01"
+    ]
+
+
+def test_index_remove_detects_corruption():
+    """Рассогласованный индекс дает ValueError, а не пропадающий assert"""
+    index = StudentIndex(enumerate(make_students(5)))
+    index._by_gpa.pop()
+
+    with pytest.raises(ValueError, match="рассогласован"):
+        for key in range(5):
+            index.remove(key)
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_group_indexes_stay_consistent(tmp_path, journal):
+    """Индексы Group согласованы после add/remove/update и перечитывания"""
+    path = tmp_path / "students.csv"
+    students = make_students(30)
+    group = Group(path, journal=journal)
+    group.add_many(students[:20])
+    group.add(students[20])
+    group.remove(students[0].fio)
+    group.update(students[1].fio, gpa=1.5, group="NEW-01")
+    group.update(students[2].fio, gpa="не число")
+
+    for reader in (group, Group(path, cached=False)):
+        expected = reader.list()
+        assert [s.fio for s in expected] == [
+            s.fio for s in students[1:21] if s is not students[2]
+        ]
+        assert reader.by_group("NEW-01") == [expected[0]]
+        assert reader.by_group("SE-01") == [s for s in expected if s.group == "SE-01"]
+        assert reader.gpa_range(1.0, 2.0) == [expected[0]]
+        assert reader.top_k(3) == expected_top(expected, 3)
+
+        stats = reader.stats()
+        assert stats["count"] == len(expected)
+        assert stats["min_gpa"] == 1.5
+        assert stats["avg_gpa"] == pytest.approx(
+            sum(s.gpa for s in expected) / len(expected)
+        )
+        assert sum(stats["groups"].values()) == len(expected)
+
+
+@pytest.mark.benchmark
+def test_benchmark_index_at_1m():
+    """Бенчмарк: запросы к индексу на 1M студентов не перебирают всех"""
+    count = 1_000_000
+    # Объекты повторяются, ключи разные: индексу важны только group и gpa
+    pool = [
+        Student(f"Студент{i} Тестовый", "2000-01-15", GROUPS[i % 4], i / 200)
+        for i in range(1000)
+    ]
+    items = [(i, pool[i % 1000]) for i in range(count)]
+
+    build = timed(lambda: StudentIndex(items))
+    index = StudentIndex(items)
+
+    scan = timed(lambda: [s for _, s in items if s.gpa >= 5.0][:10], repeat=3)
+    top = timed(lambda: index.top_k(10), repeat=20)
+    narrow = timed(lambda: index.gpa_range(2.0, 2.01), repeat=20)
+
+    def mutate():
+        for i in range(100):
+            index.add(count + i, pool[i])
+            index.remove(i * 997)
+            index.add(i * 997, pool[-i])
+
+    mutations = timed(mutate) / 300
+
+    print(
+        f"\n1M: построение {build:.2f} сек, перебор {scan * 1000:.1f} мс, "
+        f"top_k(10) {top * 1e6:.1f} мкс, gpa_range (3000 шт.) {narrow * 1000:.2f} мс, "
+        f"изменение {mutations * 1e6:.0f} мкс"
+    )
+
+    assert len(index) == count + 100
+    assert len(index.gpa_range(2.0, 2.01)) == 3000
@@ -3,11 +3,13 @@ import json
 import csv
 import sys
 import os
+import tracemalloc
 
 # Добавляем корневую папку в путь Python
 sys.path.insert(0, os.path.abspath("."))
 
 from src.lab05.json_csv import json_to_csv, csv_to_json
+from src.lib.json_stream import iter_json_records
 
 
 def test_json_to_csv_basic(tmp_path):
@@ -132,3 +134,210 @@ def test_json_to_csv_roundtrip(tmp_path):
     assert restored_data[0]["value"] == str(
         original_data[0]["value"]
     )  # CSV хранит строки
+
+
+def test_json_to_csv_ndjson(tmp_path):
+    """JSON Lines: по одному словарю на строку, колонки со всех записей"""
+    json_path = tmp_path / "test.jsonl"
+    csv_path = tmp_path / "test.csv"
+    json_path.write_text(
+        '{"name": "Анна", "age": 25}\n\n{"name": "Петр", "city": "СПб"}\n',
+        encoding="utf-8",
+    )
+
+    json_to_csv(str(json_path), str(csv_path))
+
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        "age,city,name",
+        "25,,Анна",
+        ",СПб,Петр",
+    ]
+
+
+def test_json_to_csv_rejects_single_non_list(tmp_path):
+    """Одно значение не-список - ошибка, кроме файлов JSON Lines"""
+    csv_path = tmp_path / "test.csv"
+    for text, message in [
+        ('{"a": 1}', "список"),
+        ("{}", "Пустой"),
+        ("[]", "Пустой"),
+        ('"строка"', "список"),
+    ]:
+        json_path = tmp_path / "test.json"
+        json_path.write_text(text, encoding="utf-8")
+        with pytest.raises(ValueError, match=message):
+            json_to_csv(str(json_path), str(csv_path))
+        assert not csv_path.exists()
+
+    # Два значения подряд или расширение .jsonl - это JSON Lines
+    json_path.write_text('{"a": 1} {"a": 2}', encoding="utf-8")
+    json_to_csv(str(json_path), str(csv_path))
+    assert csv_path.read_text(encoding="utf-8").splitlines() == ["a", "1", "2"]
+
+    for suffix in (".jsonl", ".ndjson"):
+        json_path = tmp_path / f"one{suffix}"
+        json_path.write_text('{"a": 1}\n', encoding="utf-8")
+        assert list(iter_json_records(json_path)) == [{"a": 1}]
+
+
+def test_json_to_csv_error_keeps_old_csv(tmp_path):
+    """Ошибка в середине JSON не оставляет обрезанный CSV"""
+    json_path = tmp_path / "test.json"
+    csv_path = tmp_path / "test.csv"
+    csv_path.write_text("старый,отчет\n", encoding="utf-8")
+    records = ",".join(json.dumps({"id": i}) for i in range(1000))
+    json_path.write_text(f"[{records}, 5]", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="словарями"):
+        json_to_csv(str(json_path), str(csv_path), fieldnames=["id"])
+
+    assert csv_path.read_text(encoding="utf-8") == "старый,отчет\n"
+    assert sorted(tmp_path.iterdir()) == sorted([json_path, csv_path])
+
+
+def test_json_to_csv_fieldnames_and_sample(tmp_path):
+    """Заданные колонки читают файл один раз; узкая выборка ловит новые ключи"""
+    json_path = tmp_path / "test.json"
+    csv_path = tmp_path / "test.csv"
+    data = [{"name": "Анна", "age": 25}, {"name": "Петр", "city": "СПб"}]
+    json_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    json_to_csv(str(json_path), str(csv_path), fieldnames=["name", "city"])
+    assert csv_path.read_text(encoding="utf-8").splitlines() == [
+        "name,city",
+        "Анна,",
+        "Петр,СПб",
+    ]
+
+    with pytest.raises(ValueError, match="sample_size"):
+        json_to_csv(str(json_path), str(csv_path), sample_size=1)
+
+
+def test_iter_json_records_matches_json_load(tmp_path):
+    """Потоковый разбор совпадает с json.load при любом размере куска"""
+    data = [
+        {"n": i, "x": -4e5 * i, "s": 'ё"\\' * (i % 3), "l": [True, None, {}]}
+        for i in range(50)
+    ]
+    json_path = tmp_path / "test.json"
+    json_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    for chunk_size in (1, 2, 5, 64, 1024 * 1024):
+        assert list(iter_json_records(json_path, chunk_size=chunk_size)) == data
+
+    for bad in ("[1,]", "[1 2]", "[1, 2", "[1] x"):
+        json_path.write_text(bad, encoding="utf-8")
+        with pytest.raises(ValueError, match="JSON"):
+            list(iter_json_records(json_path, chunk_size=2))
+
+
+def test_iter_json_records_error_does_not_read_rest(tmp_path):
+    """Ошибка в начале файла сообщается сразу, остаток файла не читается"""
+    json_path = tmp_path / "test.json"
+    json_path.write_text(
+        "[false, -Infinity, NaN, null, true, -1.5e3]", encoding="utf-8"
+    )
+    assert list(iter_json_records(json_path, chunk_size=1)) == json.loads(
+        json_path.read_text(encoding="utf-8")
+    )
+
+    records = "".join(
+        f',{{"id": {i}, "text": "{"слово " * 40}"}}' for i in range(20_000)
+    )
+    for bad in ('[{"id": x}', '[{"id" 1}', '[{"id": "a\nb"}', '[{"id": "\\q"}'):
+        json_path.write_text(bad + records + "]", encoding="utf-8")
+
+        tracemalloc.start()
+        with pytest.raises(ValueError, match="JSON"):
+            list(iter_json_records(json_path))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < json_path.stat().st_size // 20
+
+
+def test_json_to_csv_peak_memory_is_flat(tmp_path):
+    """Пиковая память не растёт вместе с количеством записей"""
+
+    def peak_for(count: int) -> int:
+        json_path = tmp_path / f"input_{count}.json"
+        with json_path.open("w", encoding="utf-8") as f:
+            f.write("[")
+            for i in range(count):
+                f.write(
+                    ("," if i else "") + json.dumps({"id": i, "text": "слово " * 40})
+                )
+            f.write("]")
+
+        tracemalloc.start()
+        json_to_csv(str(json_path), str(tmp_path / "out.csv"))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small = peak_for(1_000)
+    large = peak_for(10_000)
+
+    # Записей в 10 раз больше, а пик памяти практически тот же
+    assert large < small * 2
+
+
+def test_csv_to_json_streaming_matches_json_dump(tmp_path):
+    """Потоковая запись дает тот же текст, что и json.dump всей таблицы"""
+    csv_path = tmp_path / "test.csv"
+    json_path = tmp_path / "test.json"
+    rows = [
+        {"name": "Анна", "note": 'строка\nс "кавычками"'},
+        {"name": "Петр", "note": ""},
+    ]
+    with csv_path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["name", "note"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+    csv_to_json(str(csv_path), str(json_path))
+
+    assert json_path.read_text(encoding="utf-8") == json.dumps(
+        rows, ensure_ascii=False, indent=2
+    )
+
+
+def test_csv_to_json_ndjson(tmp_path):
+    """Режим NDJSON: по одному объекту на строку"""
+    csv_path = tmp_path / "test.csv"
+    json_path = tmp_path / "test.jsonl"
+    csv_path.write_text("name,age\nАнна,25\nПетр,30\n", encoding="utf-8")
+
+    csv_to_json(str(csv_path), str(json_path), ndjson=True)
+
+    lines = json_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"name": "Анна", "age": "25"},
+        {"name": "Петр", "age": "30"},
+    ]
+    assert list(iter_json_records(json_path)) == [json.loads(line) for line in lines]
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_csv_to_json_peak_memory_is_flat(tmp_path, ndjson):
+    """Пиковая память не растёт вместе с количеством строк"""
+
+    def peak_for(count: int) -> int:
+        csv_path = tmp_path / f"input_{count}.csv"
+        with csv_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "name", "city"])
+            for i in range(count):
+                writer.writerow([i, f"Имя {i}", "Москва"])
+
+        tracemalloc.start()
+        csv_to_json(str(csv_path), str(tmp_path / "out.json"), ndjson=ndjson)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    peaks = {count: peak_for(count) for count in (1_000, 10_000)}
+    print(f"\nпик памяти по числу строк: {peaks}")
+
+    # Строк в 10 раз больше, а пик памяти практически тот же
+    assert peaks[10_000] < peaks[1_000] * 2
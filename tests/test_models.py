@@ -0,0 +1,178 @@
+import copy
+import json
+import pickle
+import sys
+import os
+import tracemalloc
+from dataclasses import asdict, fields
+from datetime import date, datetime
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab08.models import Student, ages, parse_date
+from src.lab08.serialize import export_students_csv
+
+from tests.helpers import timed
+
+
+@pytest.mark.parametrize(
+    "value", ["2000-01-15", "2024-02-29", "1999-12-31", "2000-1-5", "0001-01-01"]
+)
+def test_parse_date_matches_strptime(value):
+    """Быстрый разбор дает тот же результат, что и strptime"""
+    assert parse_date(value) == datetime.strptime(value, "%Y-%m-%d").date()
+
+
+@pytest.mark.parametrize(
+    "value", ["2023-02-29", "2000-13-01", "2000-01-32", "20000115", "2000/01/15", ""]
+)
+def test_parse_date_rejects_invalid(value):
+    """Некорректные даты отклоняются, как и раньше"""
+    with pytest.raises(ValueError):
+        parse_date(value)
+
+
+def test_student_is_slotted_and_validated():
+    """Student без __dict__, валидация работает"""
+    student = Student("Иванов Иван", "2000-01-15", "SE-01", 4.5)
+    assert not hasattr(student, "__dict__")
+    with pytest.raises(AttributeError):
+        student.extra = 1
+
+    with pytest.raises(ValueError, match="даты"):
+        Student("Иванов Иван", "2000-02-30", "SE-01", 4.5)
+    with pytest.raises(ValueError, match="ФИО"):
+        Student("Иванов", "2000-01-15", "SE-01", 4.5)
+    with pytest.raises(ValueError, match="балл"):
+        Student("Иванов Иван", "2000-01-15", "SE-01", 5.5)
+
+
+def test_birth_cache_is_not_a_field():
+    """Кэш даты рождения не попадает в fields/asdict, копия его сохраняет"""
+    student = Student("Иванов Иван", "2000-01-15", "SE-01", 4.5)
+    student.age()
+
+    assert [f.name for f in fields(Student)] == ["fio", "birthdate", "group", "gpa"]
+    assert json.loads(json.dumps(asdict(student))) == student.to_dict()
+    assert copy.copy(student) == student
+    assert pickle.loads(pickle.dumps(student)).birth_date == date(2000, 1, 15)
+
+
+def test_trusted_construction_skips_validation():
+    """Доверенное создание равно обычному и не проверяет данные"""
+    data = {
+        "fio": "Иванов Иван",
+        "birthdate": "2000-01-15",
+        "group": "SE-01",
+        "gpa": 4.5,
+    }
+
+    assert Student.from_dict(data, trusted=True) == Student.from_dict(data)
+    # Проверка пропущена намеренно - только для уже проверенных данных
+    assert Student.trusted("Иванов", "не дата", "SE-01", 9.0).gpa == 9.0
+
+
+def student_rows(count: int) -> list[tuple]:
+    """Поля count студентов (строки создаются заранее, до замеров)."""
+    return [
+        (f"Студент{i} Тестовый", f"{1990 + i % 20}-{1 + i % 12:02d}-15", "SE-01", 4.0)
+        for i in range(count)
+    ]
+
+
+def bytes_per_student(rows: list[tuple]) -> float:
+    """Память только под сами объекты: строки полей уже существуют."""
+    tracemalloc.start()
+    students = [Student.trusted(*row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (size - sys.getsizeof(students)) / len(rows)
+
+
+def test_student_memory_per_object():
+    """Студент со __slots__ занимает меньше 100 байт"""
+    assert bytes_per_student(student_rows(10_000)) < 100
+
+
+@pytest.mark.benchmark
+def test_benchmark_student_memory_and_speed():
+    """Бенчмарк: байт на студента и созданий в секунду на 1M строк"""
+    count = 1_000_000
+    rows = student_rows(count)
+
+    validated = timed(lambda: [Student(*row) for row in rows])
+    trusted = timed(lambda: [Student.trusted(*row) for row in rows])
+    sample = rows[:100_000]
+    strptime = timed(
+        lambda: [datetime.strptime(row[1], "%Y-%m-%d") for row in sample]
+    ) * (count / len(sample))
+
+    per_student = bytes_per_student(rows)
+
+    print(
+        f"\n1M студентов: с проверкой {count / validated:,.0f}/с, "
+        f"доверенно {count / trusted:,.0f}/с "
+        f"(только strptime на 1M - {strptime:.2f} сек против {validated:.2f} сек), "
+        f"{per_student:.0f} байт на объект"
+    )
+
+
+def test_age_uses_cached_birth_date_and_given_day():
+    """Дата рождения разбирается один раз, дату расчета можно передать"""
+    student = Student("Иванов Иван", "2000-03-15", "SE-01", 4.5)
+
+    assert student.birth_date == date(2000, 3, 15)
+    assert student.birth_date is student.birth_date
+    assert student.age(on=date(2020, 3, 14)) == 19
+    assert student.age(on=date(2020, 3, 15)) == 20
+    assert student.age() == Student("Петров Петр", "2000-03-15", "SE-01", 4.0).age()
+
+    # После изменения даты кэш не используется
+    student.birthdate = "2001-03-15"
+    assert student.age(on=date(2020, 3, 15)) == 19
+    assert Student.trusted("Иванов Иван", "2000-03-15", "SE-01", 4.5).birth_date == (
+        date(2000, 3, 15)
+    )
+
+
+def test_ages_column():
+    """ages считает возраст всех студентов на одну дату"""
+    students = [
+        Student("Иванов Иван", "2000-03-15", "SE-01", 4.5),
+        Student("Петров Петр", "2004-12-31", "SE-01", 4.0),
+    ]
+
+    assert ages(students, on=date(2022, 12, 30)) == [22, 17]
+    assert ages(students) == [s.age() for s in students]
+    assert ages([]) == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_export_is_not_dominated_by_dates(tmp_path):
+    """Бенчмарк: экспорт 1M студентов, возраст - малая часть времени"""
+    count = 1_000_000
+    students = [
+        Student.trusted(
+            f"Студент{i} Тестовый", f"{1990 + i % 20}-{1 + i % 12:02d}-15", "SE-01", 4.0
+        )
+        for i in range(count)
+    ]
+
+    export = timed(lambda: export_students_csv(students, str(tmp_path / "export.csv")))
+    cached = timed(lambda: ages(students))
+
+    def parse_each(sample):
+        for student in sample:
+            datetime.strptime(student.birthdate, "%Y-%m-%d").date()
+            date.today()
+
+    sample = students[:100_000]
+    old = timed(lambda: parse_each(sample)) * (count / len(sample))
+
+    print(
+        f"\nэкспорт 1M: {export:.2f} сек; возраст по кэшу {cached:.2f} сек, "
+        f"strptime + today() для каждой строки ~{old:.2f} сек"
+    )
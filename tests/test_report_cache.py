@@ -0,0 +1,137 @@
+import json
+import sys
+import os
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab04.report_cache import ReportCache
+from src.lab04.text_report import generate_report
+from src.lib.text import count_freq, normalize, tokenize
+
+OPTIONS = {"encoding": "utf-8", "casefold": True, "yo2e": True}
+
+
+class CountingCompute:
+    """Считает, сколько раз кэш действительно запускал анализ."""
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return count_freq(tokenize(normalize(self.path.read_text(encoding="utf-8"))))
+
+
+def test_cache_hit_skips_analysis(tmp_path):
+    """Неизменившийся файл не анализируется повторно"""
+    path = tmp_path / "a.txt"
+    path.write_text("привет мир привет", encoding="utf-8")
+    compute = CountingCompute(path)
+
+    with ReportCache(tmp_path / "cache") as cache:
+        first = cache.get_or_compute(path, OPTIONS, compute)
+
+    with ReportCache(tmp_path / "cache") as cache:
+        second = cache.get_or_compute(path, OPTIONS, compute)
+
+    assert first == second == {"привет": 2, "мир": 1}
+    assert compute.calls == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_touched_file_is_hit_by_content_hash(tmp_path):
+    """Изменился только mtime - запись находится по хэшу содержимого"""
+    path = tmp_path / "a.txt"
+    path.write_text("один два", encoding="utf-8")
+    compute = CountingCompute(path)
+    cache = ReportCache(tmp_path / "cache")
+
+    cache.get_or_compute(path, OPTIONS, compute)
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    cache.get_or_compute(path, OPTIONS, compute)
+
+    assert compute.calls == 1
+    assert cache.hits == 1
+
+
+def test_cache_miss_on_changed_content_or_options(tmp_path):
+    """Новое содержимое или другие параметры нормализации - промах"""
+    path = tmp_path / "a.txt"
+    path.write_text("один два", encoding="utf-8")
+    compute = CountingCompute(path)
+    cache = ReportCache(tmp_path / "cache")
+
+    cache.get_or_compute(path, OPTIONS, compute)
+    path.write_text("один два три", encoding="utf-8")
+    assert cache.get_or_compute(path, OPTIONS, compute) == {
+        "один": 1,
+        "два": 1,
+        "три": 1,
+    }
+    cache.get_or_compute(path, {**OPTIONS, "yo2e": False}, compute)
+
+    assert compute.calls == 3
+    assert cache.misses == 3
+
+
+def test_cache_eviction_by_total_size(tmp_path):
+    """При превышении размера удаляются давно не использованные записи"""
+    cache = ReportCache(tmp_path / "cache", max_bytes=600)
+
+    for i in range(10):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(" ".join(f"слово{i}_{j}" for j in range(20)), encoding="utf-8")
+        cache.get_or_compute(path, OPTIONS, CountingCompute(path))
+
+    assert cache.evicted > 0
+    assert cache.size() <= 600
+
+
+def test_cache_eviction_prunes_index(tmp_path):
+    """Удаленные записи пропадают из индекса, а индекс входит в лимит"""
+    cache_dir = tmp_path / "cache"
+    cache = ReportCache(cache_dir, max_bytes=2000)
+
+    for i in range(30):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(" ".join(f"слово{i}_{j}" for j in range(20)), encoding="utf-8")
+        cache.get_or_compute(path, OPTIONS, CountingCompute(path))
+    cache.save()
+
+    entries = {p.name for p in (cache_dir / "entries").glob("*.json")}
+    index = json.loads((cache_dir / "index.json").read_text(encoding="utf-8"))
+    assert cache.evicted > 0
+    assert len(index) == len(entries)
+    for key, record in index.items():
+        assert f"{record['sha256']}-{key.rpartition('|')[2]}.json" in entries
+
+    on_disk = (cache_dir / "index.json").stat().st_size + sum(
+        (cache_dir / "entries" / name).stat().st_size for name in entries
+    )
+    assert cache.size() == on_disk <= 2000
+
+
+def test_generate_report_aggregates_cached_files(tmp_path, capsys):
+    """Общий отчёт по нескольким файлам собирается из кэшированных частот"""
+    texts = ["Привет, мир!", "мир труд май", "Привет еще раз"]
+    paths = []
+    for i, text in enumerate(texts):
+        path = tmp_path / f"in_{i}.txt"
+        path.write_text(text, encoding="utf-8")
+        paths.append(str(path))
+
+    output_path = tmp_path / "report.csv"
+    cache_dir = str(tmp_path / "cache")
+
+    generate_report(paths, str(output_path), cache_dir=cache_dir)
+    first_report = output_path.read_bytes()
+    assert "промахов: 3" in capsys.readouterr().out
+
+    generate_report(paths, str(output_path), cache_dir=cache_dir)
+    assert "попаданий: 3, промахов: 0" in capsys.readouterr().out
+    assert output_path.read_bytes() == first_report
+
+    lines = first_report.decode("utf-8").splitlines()
+    assert lines[:3] == ["word,count", "мир,2", "привет,2"]
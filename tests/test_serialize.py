@@ -0,0 +1,105 @@
+import json
+import sys
+import os
+import tracemalloc
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab08.serialize import (
+    iter_students_from_json,
+    students_from_json,
+    students_to_json,
+    write_students_json,
+)
+from src.lab09.group import Group
+
+from tests.helpers import iter_students
+
+
+def test_students_to_json_text_is_unchanged(tmp_path):
+    """Потоковая запись дает тот же текст, что и json.dump(indent=2)"""
+    students = list(iter_students(3))
+    path = tmp_path / "students.json"
+
+    students_to_json(students, str(path))
+
+    expected = json.dumps([s.to_dict() for s in students], ensure_ascii=False, indent=2)
+    assert path.read_text(encoding="utf-8") == expected
+    assert students_from_json(str(path)) == students
+
+    assert write_students_json([], str(path)) == 0
+    assert path.read_text(encoding="utf-8") == "[]"
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+def test_write_and_iter_round_trip(tmp_path, ndjson):
+    """Генератор записывается и читается обратно в обоих форматах"""
+    path = tmp_path / "students.json"
+
+    assert write_students_json(iter_students(5), str(path), ndjson=ndjson) == 5
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == (5 if ndjson else 5 * 6 + 2)
+    assert list(iter_students_from_json(str(path))) == list(iter_students(5))
+
+
+def test_iter_students_reports_bad_record(tmp_path):
+    """Ошибка в записи указывает ее номер, прочитанные записи уже выданы"""
+    path = tmp_path / "students.jsonl"
+    path.write_text(
+        '{"fio": "Иванов Иван", "birthdate": "2000-01-15", "group": "SE-01", "gpa": 4}\n'
+        '{"fio": "Петров", "birthdate": "2000-01-15", "group": "SE-01", "gpa": 4}\n',
+        encoding="utf-8",
+    )
+
+    students = iter_students_from_json(str(path))
+    assert next(students).fio == "Иванов Иван"
+    with pytest.raises(ValueError, match="записи 2") as error:
+        next(students)
+    # Исходная ошибка валидации сохранена как причина
+    assert isinstance(error.value.__cause__, ValueError)
+
+    path.write_text('{"fio": "Иванов Иван"} [1, 2]', encoding="utf-8")
+    with pytest.raises(ValueError, match="записи 1") as error:
+        list(iter_students_from_json(str(path)))
+    assert error.value.__cause__ is not None
+    path.write_text(
+        '[{"fio": "Иванов Иван", "birthdate": "2000-01-15"}, 5]', encoding="utf-8"
+    )
+    with pytest.raises(ValueError, match="записи 2: ожидался объект"):
+        list(iter_students_from_json(str(path)))
+
+    with pytest.raises(FileNotFoundError):
+        next(iter_students_from_json(str(tmp_path / "нет.json")))
+
+
+def test_group_import_json(tmp_path):
+    """Group.import_json добавляет студентов из JSON Lines пачками"""
+    json_path = tmp_path / "students.jsonl"
+    write_students_json(iter_students(25_000), str(json_path), ndjson=True)
+    group = Group(tmp_path / "students.csv")
+
+    assert group.import_json(str(json_path)) == 25_000
+    assert len(Group(tmp_path / "students.csv").list()) == 25_000
+
+
+def test_streaming_memory_does_not_grow_with_roster(tmp_path):
+    """Запись и чтение генератором не держат всех студентов в памяти"""
+    path = tmp_path / "students.json"
+
+    def peak(count: int) -> int:
+        tracemalloc.start()
+        write_students_json(iter_students(count), str(path))
+        for _ in iter_students_from_json(str(path)):
+            pass
+        _, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak_size
+
+    small, large = peak(2_000), peak(20_000)
+    print(f"\nпик памяти: 2k - {small / 1024:.0f} КБ, 20k - {large / 1024:.0f} КБ")
+
+    assert large < small * 2
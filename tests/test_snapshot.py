@@ -0,0 +1,145 @@
+import sys
+import os
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab08.models import Student
+from src.lab08.serialize import students_from_json, write_students_json
+from src.lab08 import snapshot
+from src.lab08.snapshot import (
+    HEADER,
+    SnapshotReader,
+    load_snapshot,
+    save_snapshot,
+)
+from src.lab09.group import Group
+
+from tests.helpers import make_students, timed
+
+
+def test_snapshot_round_trip(tmp_path):
+    """Снимок сохраняет и загружает студентов без потерь"""
+    students = make_students(1000)
+    path = tmp_path / "students.snap"
+
+    assert save_snapshot(iter(students), str(path)) == 1000
+    assert load_snapshot(str(path)) == students
+
+    save_snapshot([], str(path))
+    assert load_snapshot(str(path)) == []
+    with SnapshotReader(str(path)) as reader:
+        assert len(reader) == 0
+
+
+def test_snapshot_reader_random_access(tmp_path):
+    """mmap-чтение отдельных записей без загрузки всего файла"""
+    students = make_students(500)
+    path = tmp_path / "students.snap"
+    save_snapshot(students, str(path))
+
+    with SnapshotReader(str(path)) as reader:
+        assert len(reader) == 500
+        assert reader[0] == students[0]
+        assert reader[321] == students[321]
+        assert reader[-1] == students[-1]
+        assert list(reader) == students
+        with pytest.raises(IndexError):
+            reader[500]
+
+
+def test_snapshot_rejects_foreign_and_damaged_files(tmp_path):
+    """Чужой, поврежденный или неподдерживаемый файл - ValueError"""
+    path = tmp_path / "students.snap"
+    save_snapshot(make_students(10), str(path))
+    data = path.read_bytes()
+
+    cases = {
+        "csv": b"fio,birthdate,group,gpa\n",
+        "truncated": data[:-3],
+        "version": data[:4] + (99).to_bytes(2, "little") + data[6:],
+        "empty": b"",
+    }
+    for name, content in cases.items():
+        bad = tmp_path / f"{name}.snap"
+        bad.write_bytes(content)
+        with pytest.raises(ValueError):
+            load_snapshot(str(bad))
+        with pytest.raises(ValueError):
+            SnapshotReader(str(bad))
+
+    with pytest.raises(ValueError, match="нулевой"):
+        save_snapshot(
+            [Student.trusted("А\0Б В", "2000-01-01", "SE-01", 4.0)], str(path)
+        )
+
+
+def test_snapshot_rejects_bad_dictionary_ids(tmp_path):
+    """Номер группы вне словаря - ValueError, а не IndexError"""
+    path = tmp_path / "students.snap"
+    save_snapshot(make_students(10), str(path))
+    data = bytearray(path.read_bytes())
+    group_ids = HEADER.size + (8 + 4) * 10
+    data[group_ids + 4 * 3 : group_ids + 4 * 4] = (2**32 - 1).to_bytes(4, "little")
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="вне словаря"):
+        load_snapshot(str(path))
+    with SnapshotReader(str(path)) as reader:
+        assert reader[2] is not None
+        with pytest.raises(ValueError, match="вне словаря"):
+            reader[3]
+
+
+def test_failed_save_keeps_old_snapshot(tmp_path, monkeypatch):
+    """Сбой во время записи оставляет прежний снимок целым"""
+    students = make_students(10)
+    path = tmp_path / "students.snap"
+    save_snapshot(students, str(path))
+
+    def fail(column):
+        raise OSError("Диск заполнен")
+
+    monkeypatch.setattr(snapshot, "_to_le", fail)
+    with pytest.raises(OSError):
+        save_snapshot(make_students(20), str(path))
+
+    assert load_snapshot(str(path)) == students
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.mark.benchmark
+def test_benchmark_snapshot_vs_csv_and_json(tmp_path):
+    """Бенчмарк: загрузка снимка против CSV (Group) и JSON"""
+    students = make_students(200_000)
+    csv_path = tmp_path / "students.csv"
+    json_path = tmp_path / "students.json"
+    snap_path = tmp_path / "students.snap"
+    Group(csv_path).add_many(students)
+    write_students_json(students, str(json_path))
+    save_snapshot(students, str(snap_path))
+
+    assert load_snapshot(str(snap_path)) == students
+    csv_time = timed(lambda: Group(csv_path).list())
+    json_time = timed(lambda: students_from_json(str(json_path)))
+    snap_time = timed(lambda: load_snapshot(str(snap_path)))
+
+    def read_every_1000th():
+        with SnapshotReader(str(snap_path)) as reader:
+            for i in range(0, len(reader), 1000):
+                reader[i]
+
+    lazy = timed(read_every_1000th) / 200
+
+    sizes = {
+        p.suffix: p.stat().st_size / 1024 / 1024
+        for p in (csv_path, json_path, snap_path)
+    }
+    print(
+        f"\n200k студентов: CSV {csv_time:.2f} сек / {sizes['.csv']:.1f} МБ, "
+        f"JSON {json_time:.2f} сек / {sizes['.json']:.1f} МБ, "
+        f"снимок {snap_time:.2f} сек / {sizes['.snap']:.1f} МБ; "
+        f"одна запись через mmap {lazy * 1e6:.1f} мкс"
+    )
@@ -0,0 +1,123 @@
+import subprocess
+import sys
+import os
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.helpers import timed
+
+# Модули, которые не должны загружаться при простом запуске (--help).
+# Регрессия запуска проверяется по этому списку, а не по времени: время
+# зависит от машины и только печатается бенчмарком (цель --help - 50 мс)
+HEAVY_MODULES = {
+    "openpyxl",
+    "concurrent.futures",
+    "multiprocessing",
+    "hashlib",
+    "json",
+    "dataclasses",
+}
+
+ENTRY_POINTS = [
+    ["-m", "src.lab06.cli_convert", "--help"],
+    ["-m", "src.lab06.cli_text", "--help"],
+    ["-m", "src.lab04.text_report", "--help"],
+    ["src/lab04/text_report.py", "--help"],
+]
+
+# Корень репозитория: скрипты должны запускаться по пути из любой папки
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(args):
+    """
+    Запускает python -X importtime и разбирает его вывод.
+
+    Returns:
+        (множество загруженных модулей, суммарное время импортов в мс)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = set()
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.add(name.strip())
+        # Верхний уровень (без отступа) уже включает вложенные импорты
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+
+    return modules, total_us / 1000
+
+
+def best_wall_time(args, repeat=5):
+    """Лучшее время полного запуска процесса в секундах."""
+    return timed(
+        lambda: subprocess.run(
+            [sys.executable, *args], capture_output=True, check=True
+        ),
+        repeat=repeat,
+    )
+
+
+@pytest.mark.parametrize("args", ENTRY_POINTS, ids=lambda args: args[-2])
+def test_cli_help_does_not_import_heavy_modules(args):
+    """--help не загружает openpyxl, пул процессов, кэш и ядро анализа"""
+    modules, _ = import_times(args)
+
+    assert not modules & HEAVY_MODULES
+
+
+@pytest.mark.parametrize(
+    "script, stdin, expected",
+    [
+        ("src/lab04/text_report.py", "", "Примеры использования"),
+        ("src/lab03/text_stats.py", "Привет, мир! Привет!", "Всего слов: 3"),
+        ("src/lab03/tokenize.py", "", "['по-настоящему', 'круто']"),
+        ("src/lab03/count_freq.py", "", "Топ-2 слов"),
+        ("src/lab03/normalaize.py", "", "ежик, елка"),
+    ],
+    ids=["text_report", "text_stats", "tokenize", "count_freq", "normalaize"],
+)
+def test_scripts_run_by_path(tmp_path, script, stdin, expected):
+    """Скрипты запускаются файлом из любой папки, как в README"""
+    args = [os.path.join(ROOT, script)]
+    if script.endswith("text_report.py"):
+        args.append("--help")
+    result = subprocess.run(
+        [sys.executable, *args],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        check=True,
+    )
+
+    assert expected in result.stdout
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("args", ENTRY_POINTS, ids=lambda args: args[-2])
+def test_benchmark_cli_startup(args):
+    """Бенчмарк: время импортов и полного запуска CLI (только отчет)"""
+    # Лучшее из нескольких запусков, чтобы не зависеть от фоновой нагрузки
+    baseline_ms = min(import_times(["-c", "pass"])[1] for _ in range(3))
+    total_ms = min(import_times(args)[1] for _ in range(3))
+    overhead_ms = total_ms - baseline_ms
+
+    wall = best_wall_time(args)
+    bare = best_wall_time(["-c", "pass"])
+    print(
+        f"\n{' '.join(args)}: импорты {overhead_ms:.1f} мс, "
+        f"запуск {wall * 1000:.1f} мс (голый интерпретатор {bare * 1000:.1f} мс)"
+    )
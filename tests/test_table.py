@@ -0,0 +1,142 @@
+import json
+import sys
+import os
+from datetime import date
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab08.models import StudentList
+from src.lab08.table import StudentTable
+from src.lab09.group import Group
+
+from tests.helpers import GROUPS, make_students, timed
+
+
+def test_table_round_trip_with_student_list():
+    """StudentList -> таблица -> StudentList без потерь"""
+    students = make_students(100)
+    table = StudentTable.from_student_list(StudentList(students))
+
+    assert len(table) == 100
+    assert table.to_student_list().students == students
+
+
+def test_table_queries_match_student_list():
+    """Фильтры, агрегаты и топ совпадают с перебором объектов"""
+    students = make_students(500)
+    student_list = StudentList(students)
+    table = StudentTable.from_students(students)
+
+    assert table.where_group("SE-02").to_students() == student_list.get_by_group(
+        "SE-02"
+    )
+    assert table.where_group("Нет такой").to_students() == []
+    assert table.where_gpa(3.5, 4.25).to_students() == [
+        s for s in students if 3.5 <= s.gpa <= 4.25
+    ]
+    assert table.where_born(date(2000, 1, 1), date(2000, 12, 31)).to_students() == [
+        s for s in students if s.birthdate.startswith("2000-")
+    ]
+    assert table.average_gpa() == pytest.approx(student_list.average_gpa())
+    assert [table.fio[i] for i in table.top_k(7)] == [
+        s.fio for s in student_list.get_top_students(7)
+    ]
+    assert table.group_counts() == {
+        g: sum(s.group == g for s in students) for g in table.groups
+    }
+    for group, avg in table.group_average_gpa().items():
+        members = [s.gpa for s in students if s.group == group]
+        assert avg == pytest.approx(sum(members) / len(members))
+
+
+def test_numpy_and_builtin_paths_agree(monkeypatch):
+    """С NumPy и без него таблица отвечает одинаково"""
+    np = pytest.importorskip("numpy")
+    from src.lab08 import table as table_module
+
+    table = StudentTable.from_students(make_students(2000))
+
+    def run():
+        taken = table.take(np.array([5, 1, 5]) if table_module.np else [5, 1, 5])
+        return (
+            table.where_group("SE-02").to_students(),
+            table.where_group("Нет такой").to_students(),
+            table.where_gpa(3.5, 4.25).to_students(),
+            table.where_born(date(2000, 1, 1), date(2000, 12, 31)).to_students(),
+            taken.to_students(),
+            table.where_gpa(9, 10).take([]).to_students(),
+            table.top_k(10),
+            table.group_counts(),
+            table.stats(),
+        )
+
+    with_numpy = run()
+    averages = table.group_average_gpa()
+    assert isinstance(table.where_group("SE-01").gpa, type(table.gpa))
+
+    monkeypatch.setattr(table_module, "np", None)
+    assert run() == with_numpy
+    assert table.group_average_gpa() == pytest.approx(averages)
+
+
+def test_table_loads_group_csv_and_json(tmp_path, capsys):
+    """Загрузка из CSV группы и JSON дает ту же статистику, что Group.stats"""
+    students = make_students(50)
+    csv_path = tmp_path / "students.csv"
+    group = Group(csv_path)
+    group.add_many(students)
+    group.update(students[0].fio, gpa="не число")
+
+    table = StudentTable.from_csv(str(csv_path))
+    assert "Пропущена строка 1" in capsys.readouterr().out
+    expected = group.stats()
+    stats = table.stats()
+    assert stats["avg_gpa"] == pytest.approx(expected.pop("avg_gpa"))
+    stats.pop("avg_gpa")
+    assert stats == expected
+
+    json_path = tmp_path / "students.jsonl"
+    json_path.write_text(
+        "\n".join(json.dumps(s.to_dict(), ensure_ascii=False) for s in students),
+        encoding="utf-8",
+    )
+    assert StudentTable.from_json(str(json_path)).to_students() == students
+    with pytest.raises(FileNotFoundError):
+        StudentTable.from_json(str(tmp_path / "нет.json"))
+
+
+@pytest.mark.benchmark
+def test_benchmark_table_stats_on_millions():
+    """Бенчмарк: статистика по 2M студентов за миллисекунды, а не секунды"""
+    small = StudentTable.from_students(make_students(1000))
+    table = StudentTable(small.groups)
+    repeat = 2000
+    table.fio = small.fio * repeat
+    table.gpa = small.gpa * repeat
+    table.group_codes = small.group_codes * repeat
+    table.birth = small.birth * repeat
+
+    stats = timed(table.stats)
+    by_group = timed(table.group_average_gpa)
+    # Те же вычисления по объектам (на выборке, пересчитано на 2M)
+    sample = StudentList(make_students(1000) * 200)
+    objects = timed(
+        lambda: (
+            sample.average_gpa(),
+            min(s.gpa for s in sample.students),
+            max(s.gpa for s in sample.students),
+            sample.get_top_students(5),
+            [sample.get_by_group(g) for g in GROUPS],
+        )
+    ) * (len(table) / len(sample.students))
+
+    print(
+        f"\n{len(table):,} строк: stats {stats * 1000:.0f} мс, "
+        f"средний балл по группам {by_group * 1000:.0f} мс; "
+        f"то же по объектам ~{objects:.2f} сек"
+    )
+
+    assert table.stats()["count"] == 2_000_000
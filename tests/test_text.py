@@ -1,10 +1,35 @@
 import sys
 import os
+import random
+
+import pytest
 
 # Добавляем корневую папку в путь Python
 sys.path.insert(0, os.path.abspath("."))
 
 from src.lab03.text_stats import count_freq, top_n
+from src.lib.text import (
+    SpaceSaving,
+    count_freq as lib_count_freq,
+    normalize,
+    normalize_tokenize,
+    tokenize,
+    top_n as lib_top_n,
+)
+from src.lab03.count_freq import top_n as lab03_top_n
+
+from tests.helpers import timed
+
+TRICKY_TEXTS = [
+    "",
+    "   \t\n ",
+    "ПрИвЕт\nМИр\t",
+    "ёжик, Ёлка",
+    "по-настоящему -- круто - да-",
+    "Hello\r\nWorld\f\vagain\u00a0non\u2028break",
+    "İstanbul ΣΟΦΙΑ Straße ᾳ ͅ",
+    "emoji 🐈‍⬛ не слово, 2025_год!!!",
+]
 
 
 def test_count_freq_basic():
@@ -70,3 +95,89 @@ def test_top_n_default():
     result = top_n(freq)  # default n=5
     assert len(result) == 5
     assert result[0] == ("f", 6)
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXTS)
+@pytest.mark.parametrize("casefold", [True, False])
+@pytest.mark.parametrize("yo2e", [True, False])
+def test_normalize_tokenize_matches_pipeline(text, casefold, yo2e):
+    """Быстрый путь совпадает с tokenize(normalize(...))"""
+    expected = tokenize(normalize(text, casefold=casefold, yo2e=yo2e))
+    assert normalize_tokenize(text, casefold=casefold, yo2e=yo2e) == expected
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "name, line",
+    [
+        ("кириллица", "Привет, мир! Это тестовый текст. Ёлка по-настоящему КРУТО.\n"),
+        ("латиница", "Hello, world! This is a sample text. Tree is REALLY cool.\n"),
+    ],
+)
+def test_benchmark_normalize_tokenize_throughput(name, line):
+    """Микро-бенчмарк пропускной способности (МБ/с) быстрого пути"""
+    text = line * 5000
+    megabytes = len(text.encode("utf-8")) / 1024 / 1024
+
+    assert normalize_tokenize(text) == tokenize(normalize(text))
+
+    old_time = timed(lambda: tokenize(normalize(text)), repeat=5)
+    new_time = timed(lambda: normalize_tokenize(text), repeat=5)
+    print(
+        f"\n{name}: normalize+tokenize {megabytes / old_time:.1f} МБ/с, "
+        f"normalize_tokenize {megabytes / new_time:.1f} МБ/с"
+    )
+
+
+@pytest.mark.parametrize("top", [lib_top_n, lab03_top_n])
+@pytest.mark.parametrize("n", [-2, 0, 1, 3, 5, 50, 1000])
+def test_heap_top_n_matches_full_sort(top, n):
+    """Выбор через кучу совпадает с полной сортировкой, включая ничьи"""
+    rng = random.Random(n)
+    freq = {f"w{i:03d}": rng.randint(1, 10) for i in range(200)}
+
+    expected = sorted(freq.items(), key=lambda x: (-x[1], x[0]))[:n]
+    assert top(freq, n) == expected
+
+
+def test_space_saving_exact_when_capacity_is_enough():
+    """Если различных слов не больше capacity, частоты точные"""
+    tokens = ["a", "b", "a", "c", "b", "a", "d"]
+    counter = SpaceSaving(capacity=4)
+    counter.update(tokens)
+
+    assert counter.top(10) == lib_top_n(lib_count_freq(tokens), 10)
+    assert counter.bounds("a") == (3, 3)
+
+
+def test_space_saving_error_bounds():
+    """Оценки укладываются в документированные границы ошибки"""
+    rng = random.Random(42)
+    # Распределение Ципфа: немного частых слов и длинный хвост редких
+    words = [f"w{i}" for i in range(1, 2001)]
+    weights = [1 / i for i in range(1, 2001)]
+    tokens = rng.choices(words, weights=weights, k=50_000)
+
+    counter = SpaceSaving(capacity=100)
+    counter.update(tokens)
+    exact = lib_count_freq(tokens)
+
+    assert counter.total == len(tokens)
+    for word, true_count in exact.items():
+        lower, upper = counter.bounds(word)
+        assert lower <= true_count <= upper
+        assert upper - true_count <= counter.max_error
+
+    # Все слова с частотой больше N / m гарантированно отслеживаются
+    heavy = [w for w, c in exact.items() if c > counter.max_error]
+    tracked = dict(counter.top(counter.capacity))
+    assert heavy and all(w in tracked for w in heavy)
+
+    # Самое частое слово определяется верно
+    assert counter.top(1)[0][0] == lib_top_n(exact, 1)[0][0]
+
+
+def test_space_saving_rejects_bad_capacity():
+    """capacity должен быть положительным"""
+    with pytest.raises(ValueError):
+        SpaceSaving(capacity=0)
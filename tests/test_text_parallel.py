@@ -0,0 +1,71 @@
+import sys
+import os
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lib.text import count_freq, normalize, tokenize
+from src.lib.text_parallel import (
+    can_split_bytes,
+    count_file_freq_parallel,
+    split_byte_ranges,
+)
+
+TEXT = (
+    "Привет, мир! Ёлка по-настоящему КРУТО.\r\n"
+    "hello world\tHELLO, мир; 2025 год - ЁЖИК ёжик\n"
+) * 200
+
+
+def serial_freq(path, encoding="utf-8"):
+    with open(path, "r", encoding=encoding) as f:
+        return count_freq(tokenize(normalize(f.read())))
+
+
+def test_split_byte_ranges_cover_file_on_word_boundaries(tmp_path):
+    """Диапазоны идут подряд, покрывают файл и не режут слова"""
+    path = tmp_path / "input.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    data = path.read_bytes()
+
+    ranges = split_byte_ranges(path, 16)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+        # Граница стоит сразу после пробельного байта
+        assert data[end - 1 : end] in (b" ", b"\t", b"\n", b"\r")
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp1251"])
+def test_parallel_matches_serial(tmp_path, encoding):
+    """Параллельный подсчёт совпадает с последовательным"""
+    path = tmp_path / "input.txt"
+    path.write_text(TEXT, encoding=encoding)
+
+    result = count_file_freq_parallel(path, encoding, workers=3, min_range_size=1)
+
+    assert result == serial_freq(path, encoding)
+
+
+def test_parallel_with_custom_tokenizer(tmp_path):
+    """Свой токенизатор в процессах даёт тот же результат, что и без них"""
+    path = tmp_path / "input.txt"
+    path.write_text(TEXT, encoding="utf-8")
+
+    result = count_file_freq_parallel(
+        path, workers=2, tokenizer=str.split, min_range_size=1
+    )
+
+    assert result == count_freq(TEXT.split())
+
+
+def test_can_split_bytes():
+    """Байтовое деление разрешено только для безопасных кодировок"""
+    assert can_split_bytes("utf-8")
+    assert can_split_bytes("cp1251")
+    assert can_split_bytes("koi8-r")
+    assert not can_split_bytes("utf-16")
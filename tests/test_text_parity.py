@@ -0,0 +1,118 @@
+import sys
+import os
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lib.text import TextAnalysis, normalize, normalize_tokenize, tokenize
+from src.lib.text import count_freq, top_n
+from src.lib.text_parallel import count_file_freq_parallel
+from src.lab03 import count_freq as lab03_count_freq
+from src.lab03 import normalaize as lab03_normalize
+from src.lab03 import tokenize as lab03_tokenize
+from src.lab03.text_stats import text_stats
+from src.lab04.text_report import analyze_text, generate_report
+from src.lab06 import cli_text
+
+# Тексты, на которых старые реализации расходились между собой
+TEXTS = [
+    "Привет, мир! Привет!",
+    "ёжик Ёжик ЁЖИК ежик",
+    "по-настоящему -- круто - да- -нет",
+    "Hello\r\nWorld\tworld, HELLO! it's 2025_год; e-mail: a@b.c",
+    "Straße STRASSE ΣΟΦΙΑ σοφια ǅemal",
+    "emoji 🐈‍⬛ не слово, снова слово",
+]
+
+
+def expected(text: str) -> TextAnalysis:
+    """Эталон: классический конвейер normalize -> tokenize -> count_freq"""
+    freq = count_freq(tokenize(normalize(text)))
+    return TextAnalysis(
+        total_words=sum(freq.values()),
+        unique_words=len(freq),
+        top_words=top_n(freq, 5),
+        frequencies=sorted(freq.items(), key=lambda x: (-x[1], x[0])),
+    )
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_core_functions(text):
+    """Быстрый путь ядра совпадает с классическим конвейером"""
+    assert normalize_tokenize(text) == tokenize(normalize(text))
+    assert TextAnalysis.from_text(text) == expected(text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_lab03_modules_dispatch_to_core(text):
+    """Функции из src/lab03 дают тот же результат, что и ядро"""
+    assert lab03_normalize.normalize(text) == normalize(text)
+    assert lab03_tokenize.tokenize(text) == tokenize(text)
+
+    tokens = tokenize(normalize(text))
+    assert lab03_count_freq.count_freq(tokens) == count_freq(tokens)
+    assert lab03_count_freq.top_n(count_freq(tokens), 3) == top_n(count_freq(tokens), 3)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_text_stats_entry_point(text, capsys):
+    """src/lab03/text_stats.py печатает статистику ядра"""
+    text_stats(text)
+    out = capsys.readouterr().out.splitlines()
+
+    reference = expected(text)
+    assert out[0] == f"Всего слов: {reference.total_words}"
+    assert out[1] == f"Уникальных слов: {reference.unique_words}"
+    assert out[3:] == [f"{word}:{count}" for word, count in reference.top_words]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_text_report_entry_point(text, tmp_path):
+    """src/lab04/text_report.py: analyze_text и CSV отчёт"""
+    reference = expected(text)
+    assert analyze_text(text) == (
+        reference.total_words,
+        reference.unique_words,
+        reference.top_words,
+    )
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(text.encode("utf-8"))
+    output_path = tmp_path / "report.csv"
+
+    for workers in (1, 2):
+        generate_report(str(input_path), str(output_path), workers=workers)
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert lines[1:] == [f"{w},{c}" for w, c in reference.frequencies]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_cli_text_entry_point(text, tmp_path, monkeypatch, capsys):
+    """src/lab06/cli_text.py stats считает так же, как ядро"""
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(text.encode("utf-8"))
+    reference = expected(text)
+
+    assert cli_text.read_and_tokenize(str(input_path)) == tokenize(normalize(text))
+
+    for workers in ("1", "2"):
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["cli_text", "stats", "--input", str(input_path), "--workers", workers],
+        )
+        cli_text.main()
+        out = capsys.readouterr().out.splitlines()
+        assert out[1:] == [f"  {w}: {c}" for w, c in reference.top_words]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_parallel_engine(text, tmp_path):
+    """Параллельный подсчёт совпадает с ядром"""
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(((text + "\n") * 50).encode("utf-8"))
+
+    result = count_file_freq_parallel(input_path, workers=2, min_range_size=1)
+    assert result == count_freq(tokenize(normalize((text + "\n") * 50)))
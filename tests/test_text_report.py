@@ -0,0 +1,244 @@
+import sys
+import os
+import tracemalloc
+
+import pytest
+
+# Добавляем корневую папку в путь Python
+sys.path.insert(0, os.path.abspath("."))
+
+from src.lab04.text_report import (
+    analyze_text,
+    collect_frequencies,
+    expand_inputs,
+    generate_report,
+)
+from src.lab04.io_txt_csv import write_csv
+from src.lib.text import TextAnalysis, normalize, tokenize, count_freq, top_n
+
+from tests.helpers import timed
+
+SAMPLE_TEXT = (
+    "Привет, мир! Это тестовый текст для лабораторной работы.\r\n"
+    "Текст содержит несколько слов. Привет еще раз!\n"
+    "Ёлка по-настоящему КРУТО\tкруто, ЁЖИК ёжик - 2025 год.\n"
+)
+
+
+def expected_report(text: str, path) -> bytes:
+    """Эталонный CSV: анализ всего текста целиком, как раньше."""
+    freq = count_freq(tokenize(normalize(text)))
+    rows = sorted(freq.items(), key=lambda x: (-x[1], x[0]))
+    write_csv(rows, path, header=("word", "count"))
+    return path.read_bytes()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 1024 * 1024])
+def test_generate_report_matches_full_read(tmp_path, chunk_size):
+    """Потоковый отчёт совпадает с отчётом по целиком прочитанному файлу"""
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(SAMPLE_TEXT.encode("utf-8"))
+
+    expected = expected_report(
+        input_path.read_text(encoding="utf-8"), tmp_path / "expected.csv"
+    )
+
+    output_path = tmp_path / "report.csv"
+    generate_report(str(input_path), str(output_path), chunk_size=chunk_size)
+
+    assert output_path.read_bytes() == expected
+
+
+def test_generate_report_empty_file(tmp_path, capsys):
+    """Пустой файл даёт отчёт только с заголовком и предупреждение"""
+    input_path = tmp_path / "empty.txt"
+    input_path.write_text("   \n\t", encoding="utf-8")
+    output_path = tmp_path / "report.csv"
+
+    generate_report(str(input_path), str(output_path), chunk_size=2)
+
+    assert output_path.read_bytes() == b"word,count\r\n"
+    assert "пустой" in capsys.readouterr().out
+
+
+def test_generate_report_peak_memory_is_flat(tmp_path):
+    """Пиковая память не растёт вместе с размером входного файла"""
+    line = "альфа beta гамма delta эпсилон по-настоящему\n"
+
+    def peak_for(copies: int) -> int:
+        input_path = tmp_path / f"input_{copies}.txt"
+        with input_path.open("w", encoding="utf-8") as f:
+            for _ in range(copies):
+                f.write(line)
+
+        tracemalloc.start()
+        generate_report(str(input_path), str(tmp_path / "report.csv"), chunk_size=4096)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    small = peak_for(2_000)
+    large = peak_for(40_000)
+
+    # Файл в 20 раз больше, а пик памяти практически тот же
+    assert large < small * 2
+
+
+def write_without_whitespace(tmp_path, copies: int):
+    """Файл из одного "слова" без пробелов: режется только по знакам препинания."""
+    text = "Слово,ёлка;по-настоящему." * copies
+    input_path = tmp_path / f"input_{copies}.txt"
+    input_path.write_text(text, encoding="utf-8")
+    return text, input_path
+
+
+def test_generate_report_without_whitespace(tmp_path):
+    """Текст без пробелов режется по знакам препинания: память не растет"""
+
+    def peak_for(copies: int, chunk_size: int = 4096) -> int:
+        text, input_path = write_without_whitespace(tmp_path, copies)
+        output_path = tmp_path / "report.csv"
+
+        tracemalloc.start()
+        generate_report(str(input_path), str(output_path), chunk_size=chunk_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert output_path.read_bytes() == expected_report(
+            text, tmp_path / "expected.csv"
+        )
+        return peak
+
+    peak_for(100, chunk_size=3)
+    small = peak_for(5_000)
+    large = peak_for(100_000)
+
+    # Файл в 20 раз больше, а пик памяти практически тот же
+    assert large < small * 2
+
+
+@pytest.mark.benchmark
+def test_benchmark_report_without_whitespace(tmp_path):
+    """Бенчмарк: время отчета по тексту без пробелов растет линейно"""
+    times = {}
+    for copies in (5_000, 100_000):
+        _, input_path = write_without_whitespace(tmp_path, copies)
+        output_path = str(tmp_path / "report.csv")
+        times[copies] = timed(lambda: generate_report(str(input_path), output_path))
+
+    print(
+        f"\nбез пробелов: 5k фрагментов {times[5_000]:.3f} сек, "
+        f"100k (в 20 раз больше) {times[100_000]:.3f} сек"
+    )
+
+
+def test_analyze_text_uses_single_pass_result():
+    """analyze_text возвращает те же числа, что и TextAnalysis"""
+    analysis = TextAnalysis.from_text(SAMPLE_TEXT)
+
+    assert analyze_text(SAMPLE_TEXT) == (
+        analysis.total_words,
+        analysis.unique_words,
+        analysis.top_words,
+    )
+    assert analysis.top_words == analysis.frequencies[:5]
+    assert analysis.total_words == sum(count for _, count in analysis.frequencies)
+
+
+@pytest.mark.benchmark
+def test_benchmark_single_pass_vs_double_pass():
+    """Бенчмарк: один проход TextAnalysis против старого двойного анализа"""
+    text = SAMPLE_TEXT * 2000
+
+    def double_pass():
+        # Так работал generate_report: analyze_text, затем всё заново для CSV
+        tokens = tokenize(normalize(text))
+        freq = count_freq(tokens)
+        top = top_n(freq, 5)
+        all_freq = count_freq(tokenize(normalize(text)))
+        table = sorted(all_freq.items(), key=lambda x: (-x[1], x[0]))
+        return len(tokens), len(freq), top, table
+
+    def single_pass():
+        analysis = TextAnalysis.from_text(text)
+        return (
+            analysis.total_words,
+            analysis.unique_words,
+            analysis.top_words,
+            analysis.frequencies,
+        )
+
+    assert single_pass() == double_pass()
+
+    old_time = timed(double_pass, repeat=5)
+    new_time = timed(single_pass, repeat=5)
+    print(
+        f"\nдвойной проход: {old_time:.4f} сек, один проход: {new_time:.4f} сек, "
+        f"ускорение x{old_time / new_time:.2f}"
+    )
+
+
+def make_corpus(root):
+    """Папка с текстами во вложенных папках (одно имя файла дважды)."""
+    texts = {
+        "a/text.txt": "Привет, мир! мир",
+        "b/text.txt": "мир труд май",
+        "b/c/other.txt": "Привет еще раз",
+    }
+    for name, text in texts.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    (root / "skip.md").write_text("не текст", encoding="utf-8")
+    return texts
+
+
+def test_expand_inputs_directories_and_globs(tmp_path):
+    """Папки раскрываются рекурсивно, шаблоны - через glob, повторы убираются"""
+    make_corpus(tmp_path)
+
+    from_dir = expand_inputs([str(tmp_path)])
+    from_glob = expand_inputs([str(tmp_path / "**" / "*.txt"), str(tmp_path / "a")])
+
+    assert [p.relative_to(tmp_path).as_posix() for p in from_dir] == [
+        "a/text.txt",
+        "b/c/other.txt",
+        "b/text.txt",
+    ]
+    assert sorted(from_glob) == sorted(from_dir)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_merged_report_equals_sum_of_files(tmp_path, capsys, jobs):
+    """Общий отчет - сумма частот файлов, отдельные отчеты не перезаписываются"""
+    texts = make_corpus(tmp_path / "corpus")
+    files = expand_inputs([str(tmp_path / "corpus")])
+    per_file_dir = tmp_path / "per_file"
+
+    frequencies = collect_frequencies(files, jobs=jobs, per_file_dir=str(per_file_dir))
+
+    assert frequencies == count_freq(tokenize(normalize(" ".join(texts.values()))))
+    assert sorted(p.name for p in per_file_dir.iterdir()) == [
+        "a__text.csv",
+        "b__c__other.csv",
+        "b__text.csv",
+    ]
+    assert (per_file_dir / "a__text.csv").read_bytes() == expected_report(
+        texts["a/text.txt"], tmp_path / "expected.csv"
+    )
+
+    out = capsys.readouterr().out
+    assert "[3/3]" in out
+    assert "файлов/с" in out and "МБ/с" in out
+
+
+def test_generate_report_missing_file_in_list(tmp_path, capsys):
+    """Отсутствующий файл в списке сообщается до начала анализа"""
+    existing = tmp_path / "a.txt"
+    existing.write_text("слово", encoding="utf-8")
+    missing = tmp_path / "missing.txt"
+
+    with pytest.raises(SystemExit):
+        generate_report([str(existing), str(missing)], str(tmp_path / "report.csv"))
+
+    assert str(missing) in capsys.readouterr().out